@@ -0,0 +1,51 @@
+import os, sys, time, random, argparse
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+import yatzy_advice_4 as y
+from yatzy_render import DiceAtlas
+
+# --- 주사위 그리기 시간 측정 ---
+# 2인 화면 한 프레임 분량(주사위 5개 × 2줄)을 프리미티브로 직접 그리는 방식(이전 구현)과
+# 스프라이트 아틀라스 blits 방식으로 그려 시간을 비교하고, 두 결과 픽셀이 같은지 확인한다.
+
+def draw_primitives(surf, rows):
+    # 이전 구현: 주사위마다 테두리, 눈(원 최대 6개), 고정 표시를 매번 그린다
+    for x, dice, held in rows:
+        for i, val in enumerate(dice):
+            r = pygame.Rect(x + i * y.DICE_SPACING, 760, y.DICE_SIZE, y.DICE_SIZE)
+            pygame.draw.rect(surf, y.BLACK, r, 2, border_radius=10)
+            y.draw_dice_face(surf, val, r)
+            if held[i]: pygame.draw.rect(surf, y.RED, r, 4, border_radius=10)
+
+def draw_atlas(surf, rows, atlas):
+    for x, dice, held in rows:
+        surf.blits(atlas.row(x, 760, y.DICE_SPACING, dice, held), doreturn=False)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="주사위 그리기: 프리미티브 vs 스프라이트 아틀라스")
+    ap.add_argument("-n", "--frames", type=int, default=5000)
+    args = ap.parse_args(argv)
+    screen = y.init_display()
+    t = time.perf_counter(); atlas = DiceAtlas(y.DICE_SIZE, y.draw_die); build = time.perf_counter() - t
+    rng = random.Random(0)
+    frames = [[(x, [rng.randint(1, 6) for _ in range(5)], [rng.random() < 0.4 for _ in range(5)]) for x in (80, 720)]
+              for _ in range(256)]
+    a, b = screen.copy(), screen.copy()
+    for rows in frames[:32]:
+        a.fill(y.WHITE); b.fill(y.WHITE)
+        draw_primitives(a, rows); draw_atlas(b, rows, atlas)
+        assert pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+    print(f"픽셀 일치: 32프레임, 아틀라스 생성 {build * 1e3:.2f} ms")
+    for name, fn in (("프리미티브", lambda rows: draw_primitives(screen, rows)),
+                     ("아틀라스", lambda rows: draw_atlas(screen, rows, atlas))):
+        times = []
+        for i in range(args.frames):
+            rows = frames[i % len(frames)]
+            t = time.perf_counter(); fn(rows); times.append(time.perf_counter() - t)
+        times.sort()
+        print(f"{name:6s} 주사위 10개/프레임: 평균 {sum(times) / len(times) * 1e6:7.1f} us  "
+              f"p50 {times[len(times) // 2] * 1e6:7.1f} us  p99 {times[int(len(times) * 0.99)] * 1e6:7.1f} us")
+
+if __name__ == '__main__':
+    main()
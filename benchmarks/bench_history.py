@@ -0,0 +1,59 @@
+import os, sys, time, tempfile, argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import yatzy_sim as sim
+import yatzy_history as H
+
+# --- 게임 기록 저장소 쓰기/조회 속도 측정 ---
+# NumPy 시뮬레이터로 만든 N게임(1인, 이름 K개 중 하나, 채움 순서는 무작위)을 배치로 기록하고
+# 순위/플레이어 통계/백분위/카테고리 분포 조회 시간을 잰다.
+
+def records(n, names, seed, start=0):
+    rng = np.random.default_rng(seed)
+    sheets = sim.simulate(n, seed=seed)
+    tot = sim.totals(sheets)
+    upper = sheets[:, sim.UPPER_IDX].sum(axis=1)
+    orders = np.argsort(rng.random((n, H.NUM_CATS)), axis=1).astype(np.uint8)
+    who = rng.integers(0, len(names), n)
+    for i in range(n):
+        t, u = int(tot[i]), int(upper[i])
+        yield None, None, start + i, [(0, names[who[i]], t, u, sim.BONUS_POINTS if u >= sim.BONUS_THRESHOLD else 0,
+                                 *sheets[i].tolist(), orders[i].tobytes())]
+
+def timed(fn, *a, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter(); out = fn(*a); best = min(best, time.perf_counter() - t)
+    return best * 1e3, out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="게임 기록 저장소 쓰기/조회 속도")
+    ap.add_argument("-n", "--games", type=int, default=1_000_000)
+    ap.add_argument("--players", type=int, default=50, help="서로 다른 플레이어 이름 수")
+    ap.add_argument("--batch", type=int, default=10_000)
+    ap.add_argument("--db", help="기본값: 임시 파일")
+    args = ap.parse_args(argv)
+    path = args.db or os.path.join(tempfile.mkdtemp(), "history.sqlite3")
+    names = [f"player{i:02d}" for i in range(args.players)]
+    conn = H.connect(path)
+    t = time.perf_counter(); batch = []
+    for rec in records(args.games, names, seed=1):
+        batch.append(rec)
+        if len(batch) == args.batch:
+            H.write_records(conn, batch); batch = []
+    if batch: H.write_records(conn, batch)
+    dt = time.perf_counter() - t
+    print(f"쓰기: {args.games}게임 {dt:.1f} s ({args.games/dt:,.0f} 게임/s), DB {os.path.getsize(path)/1e6:.0f} MB")
+    for label, fn, a in [("leaderboard(10)", H.leaderboard, (conn,)),
+                         ("overview", H.overview, (conn,)),
+                         ("player_stats(전체)", H.player_stats, (conn,)),
+                         ("player_stats(1명)", H.player_stats, (conn, names[0])),
+                         ("player_percentiles", H.player_percentiles, (conn, names[0])),
+                         ("category_distribution", H.category_distribution, (conn, "Yatzy")),
+                         ("fill_order", H.fill_order, (conn,))]:
+        ms, _ = timed(fn, *a)
+        print(f"{label:24s} {ms:8.2f} ms")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
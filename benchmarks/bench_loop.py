@@ -0,0 +1,44 @@
+import os, sys, time, argparse
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import stub_advice_server as stub
+
+# --- 메인 루프 프레임 간격 측정 ---
+# 느린 조언 서버(스텁, 응답 지연 delay초)와 AI끼리 두는 2인 게임에서 sync/async 루프의 프레임 간격을 잰다.
+# 조언 요청이 자주 일어나도록 조언 지연/간격과 AI 간격을 줄인다.
+#   python benchmarks/bench_loop.py --loop async --delay 1.5 --seconds 8
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="sync/async 메인 루프 프레임 간격")
+    ap.add_argument("--loop", choices=("sync", "async"), default="async")
+    ap.add_argument("--delay", type=float, default=1.5, help="스텁 서버 응답 지연(초)")
+    ap.add_argument("--seconds", type=float, default=8.0)
+    args = ap.parse_args(argv)
+    srv = stub.serve(delay=args.delay)
+    os.environ.update(YATZY_ADVICE_URL=srv.url, YATZY_LOOP=args.loop, YATZY_ADVICE="quote", YATZY_ADVICE_CACHE="",
+                      YATZY_SAVE=os.path.join(os.devnull, "save"), YATZY_HISTORY=os.path.join(os.devnull, "history"))
+    import yatzy_advice_4 as y
+    from yatzy_bots import make_bot, AI_NAME
+    y.ADVICE_DELAY, y.ADVICE_INTERVAL, y.AI_DELAY = 0, 300, 100
+    g = y.Game()
+    g.num_players = 2; g._setup_players()
+    g.ai = {0: make_bot("greedy"), 1: make_bot("upper")}
+    for p, b in zip(g.players, g.ai.values()): p.name = AI_NAME.format(b.name)
+    g._start_playing()
+    starts, shown, frame, end = [], [], g.frame, time.perf_counter() + args.seconds
+    def timed():
+        starts.append(time.perf_counter())
+        if g.advice and g.advice != (shown[-1] if shown else None): shown.append(g.advice)
+        return frame() and starts[-1] < end
+    g.frame = timed
+    try: g.run()
+    except SystemExit: pass
+    iv = sorted((b - a) * 1e3 for a, b in zip(starts, starts[1:]))
+    pct = lambda p: iv[min(len(iv) - 1, int(len(iv) * p))]
+    print(f"{args.loop:5s} 지연 {args.delay}s: 프레임 {len(starts)}개 ({len(starts) / args.seconds:.1f} fps)  "
+          f"간격 p50 {pct(0.5):.2f}  p99 {pct(0.99):.2f}  max {iv[-1]:.2f} ms  "
+          f"25ms 초과 {sum(x > 25 for x in iv)}개  조언 요청 {srv.hits}회(취소 {srv.aborted}), 표시 {len(shown)}회  기록한 칸 {sum(bin(p.scores.filled).count('1') for p in g.players)}")
+    srv.shutdown()
+
+if __name__ == '__main__':
+    main()
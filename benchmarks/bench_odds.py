@@ -0,0 +1,43 @@
+import os, sys, time, random, argparse, itertools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import yatzy_odds as odds
+from yatzy_scoring import SCORE_CATS, calc_score
+
+# --- 재굴림 확률 조회 시간 측정 ---
+# 무작위 주사위에서 32가지 고정 마스크 전체의 확률/기대 점수 조회 시간을 재고,
+# 굴림 1회 남은 경우는 6^k 전수 나열 결과와 같은지 확인한다.
+
+def enumerate_odds(dice, mask):
+    free = [i for i in range(5) if not mask >> i & 1]
+    rows = []
+    for r in itertools.product(range(1, 7), repeat=len(free)):
+        d = list(dice)
+        for i, v in zip(free, r): d[i] = v
+        rows.append([calc_score(c, d) for c in SCORE_CATS])
+    rows = np.array(rows)
+    return (rows > 0).mean(axis=0), rows.mean(axis=0)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="재굴림 확률 조회 시간")
+    ap.add_argument("-n", "--positions", type=int, default=10000)
+    ap.add_argument("--check", type=int, default=20, help="전수 나열로 확인할 위치 수")
+    args = ap.parse_args(argv)
+    rng = random.Random(0)
+    for _ in range(args.check):
+        dice = [rng.randint(1, 6) for _ in range(5)]
+        o = odds.position_odds(dice, 1)
+        for m in range(32):
+            hit, exp = enumerate_odds(dice, m)
+            assert np.allclose(o.hit[m], hit) and np.allclose(o.expected[m], exp), (dice, m)
+    print(f"전수 나열과 일치: {args.check}개 위치 × 32 마스크")
+    positions = [[rng.randint(1, 6) for _ in range(5)] for _ in range(args.positions)]
+    for rolls in (1, 2):
+        times = []
+        for d in positions:
+            t = time.perf_counter(); odds.position_odds(d, rolls); times.append(time.perf_counter() - t)
+        times.sort()
+        print(f"굴림 {rolls}회 남음, 32 마스크: 평균 {sum(times)/len(times)*1e6:6.1f} us  p99 {times[int(len(times)*0.99)]*1e6:6.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os, sys, time, random, argparse
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+import yatzy_advice_4 as y
+
+# --- 프레임 시간 측정: 전체 다시 그리기(full) vs 변경 영역 갱신(dirty) ---
+# SDL dummy 비디오 드라이버에서 2인 게임 화면을 N 프레임 그리며 프레임당 draw() 시간을 잰다.
+#   idle  : 입력 없음 (대부분의 프레임)
+#   hover : 매 프레임 마우스가 카테고리 행 사이를 이동
+
+def setup(mode, players=2):
+    g = y.Game(); g.render_mode = mode
+    g.num_players = players; g._setup_players(); g.state = "PLAYING"
+    g.engine.rng = random.Random(1)
+    g.engine.roll(); g.engine.toggle_hold(0)
+    g.advice_on, g.advice = True, "Don't eat non-snow-coloured snow."
+    return g
+
+def run(mode, scenario, frames):
+    g = setup(mode)
+    path = [(200, y.BOARD_Y + 10 + (i % 13) * y.ROW_H) for i in range(frames)]
+    times = []
+    for i in range(frames):
+        g.mouse = path[i] if scenario == "hover" else (5, 5)
+        for b in g.buttons.values(): b.check(g.mouse)
+        t = time.perf_counter(); g.draw(); times.append(time.perf_counter() - t)
+    times.sort()
+    return {"mean_ms": sum(times) / frames * 1e3, "p50_ms": times[frames // 2] * 1e3, "p99_ms": times[int(frames * 0.99)] * 1e3}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="렌더링 프레임 시간 비교")
+    ap.add_argument("-n", "--frames", type=int, default=600)
+    args = ap.parse_args(argv)
+    results = {}
+    for scenario in ("idle", "hover"):
+        for mode in ("full", "dirty"):
+            r = results[(scenario, mode)] = run(mode, scenario, args.frames)
+            print(f"{scenario:5s} {mode:5s}  평균 {r['mean_ms']:7.3f} ms  p50 {r['p50_ms']:7.3f} ms  p99 {r['p99_ms']:7.3f} ms")
+        full, dirty = results[(scenario, "full")]["mean_ms"], results[(scenario, "dirty")]["mean_ms"]
+        print(f"{scenario:5s} 개선  {full / dirty:6.1f}x")
+    st = y.TEXT_CACHE.stats()
+    print(f"텍스트 캐시: {st['items']}/{st['max_items']}개, {st['bytes'] / 1024:.1f} KB, 적중률 {st['hit_rate']:.1%}, 내보냄 {st['evictions']}")
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import os, sys, io, time, random, argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from yatzy_scoring import CAT_INDEX
+from yatzy_engine import YatzyEngine
+from yatzy_log import GameLog, parse, replay
+
+# --- 이벤트 로그 재생 속도 측정 ---
+# 무작위 고정 + greedy 기록으로 N게임 아카이브를 메모리에 만들고,
+# 파싱(parse)과 재생(replay)의 초당 이벤트 수를 잰다. 재생 결과 점수는 원래 게임과 비교한다.
+
+def make_archive(games, players=2, seed=0):
+    rng = random.Random(seed)
+    buf, totals = io.BytesIO(), []
+    for _ in range(games):
+        eng = YatzyEngine([f"P{i+1}" for i in range(players)], seed=rng.getrandbits(64))
+        GameLog(buf, autoflush=False).start(eng)
+        while not eng.over:
+            eng.roll()
+            for _ in range(rng.randint(0, 2)):
+                for i in range(5):
+                    if rng.random() < 0.4: eng.toggle_hold(i)
+                eng.roll()
+            pv = eng.preview()
+            eng.score(max(eng.open_categories(), key=lambda c: pv[CAT_INDEX[c]]))
+        totals.append([p.total() for p in eng.players])
+    return buf.getvalue(), totals
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="이벤트 로그 재생 속도 측정")
+    ap.add_argument("-n", "--games", type=int, default=10000)
+    ap.add_argument("--players", type=int, default=2)
+    args = ap.parse_args(argv)
+    t = time.perf_counter(); data, totals = make_archive(args.games, args.players)
+    print(f"아카이브 생성: {args.games}게임, {len(data)/1e6:.2f} MB, {time.perf_counter()-t:.2f} s")
+    t = time.perf_counter(); games = parse(data); t_parse = time.perf_counter() - t
+    events = sum(len(g.events) for g in games)
+    t = time.perf_counter(); finals = [replay(g) for g in games]; t_replay = time.perf_counter() - t
+    assert [[p.total() for p in e.players] for e in finals] == totals, "재생 결과가 원래 게임과 다릅니다"
+    print(f"이벤트 {events}개 ({events/len(games):.1f}/게임)")
+    print(f"parse  {t_parse:6.2f} s  {events/t_parse:>12,.0f} 이벤트/s")
+    print(f"replay {t_replay:6.2f} s  {events/t_replay:>12,.0f} 이벤트/s")
+    print(f"합계   {t_parse+t_replay:6.2f} s  {events/(t_parse+t_replay):>12,.0f} 이벤트/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os, sys, subprocess, argparse
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- 시작 시간 측정 ---
+# 새 인터프리터에서 모듈 import 시간과, 게임 모듈 import부터 첫 프레임(Game() + draw())까지 걸린 시간을 잰다.
+# 인터프리터 자체 시작 시간은 빼고 자식 프로세스 안에서 perf_counter로 잰 값의 중앙값을 보고한다.
+# 실제 실행과 같도록 바이트코드 캐시(__pycache__)를 쓰게 하고, 측정 전에 한 번 실행해 캐시를 채운다.
+
+MODULES = ("yatzy_scoring", "yatzy_engine", "yatzy_log", "yatzy_advice", "yatzy_hints", "yatzy_advice_4")
+
+IMPORT = "import time; t = time.perf_counter(); import {0}; print(time.perf_counter() - t)"
+FIRST_FRAME = ("import time; t = time.perf_counter(); import yatzy_advice_4 as y; t1 = time.perf_counter(); "
+               "g = y.Game(); g.draw(); print(t1 - t, time.perf_counter() - t, 'requests' in __import__('sys').modules)")
+
+def child(code):
+    env = dict(os.environ, SDL_VIDEODRIVER=os.environ.get("SDL_VIDEODRIVER", "dummy"),
+               PYGAME_HIDE_SUPPORT_PROMPT="1", YATZY_SAVE=os.devnull + ".none", YATZY_ADVICE_CACHE="")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+def median(xs):
+    return sorted(xs)[len(xs) // 2]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="import 시간과 첫 프레임까지 시간")
+    ap.add_argument("-n", "--runs", type=int, default=15)
+    args = ap.parse_args(argv)
+    child(FIRST_FRAME); child(IMPORT.format("yatzy_hints"))
+    for m in MODULES:
+        t = median([float(child(IMPORT.format(m))[0]) for _ in range(args.runs)])
+        print(f"import {m:16s} {t * 1e3:8.1f} ms")
+    runs = [child(FIRST_FRAME) for _ in range(args.runs)]
+    print(f"첫 프레임: import {median([float(r[0]) for r in runs]) * 1e3:.1f} ms, "
+          f"import + Game() + draw() {median([float(r[1]) for r in runs]) * 1e3:.1f} ms "
+          f"(requests 로드됨: {runs[0][2]})")
+
+if __name__ == '__main__':
+    main()
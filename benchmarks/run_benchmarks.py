@@ -0,0 +1,190 @@
+import os, sys, json, time, platform, argparse, fnmatch, subprocess
+from itertools import product
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# --- 벤치마크 모음 ---
+# 점수 계산, 합계, 화면별 프레임 시간, 시뮬레이션 처리량, 조언 요청 지연을 재고 JSON으로 저장한다.
+#   python benchmarks/run_benchmarks.py -o base.json          # 실행
+#   python benchmarks/run_benchmarks.py --only "render.*"     # 일부만
+#   python benchmarks/run_benchmarks.py compare base.json new.json --threshold 0.1
+# 결과 항목: 연산 1회당 시간(us) 표본의 median/mean/p99/min과 초당 처리량. compare는 median이
+# threshold 비율 이상 느려진 항목을 회귀로 표시하고 종료 코드 1을 돌려준다.
+
+BENCHES = {} # 이름 -> (함수, 설명)
+
+def bench(name, desc):
+    def deco(fn):
+        BENCHES[name] = (fn, desc); return fn
+    return deco
+
+def measure(fn, number, repeat, ops=1):
+    # fn을 number번 호출하는 묶음을 repeat번 재서 연산(ops개/호출) 1회당 시간(us) 표본을 만든다
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for _ in range(number): fn()
+        samples.append((time.perf_counter() - t) / (number * ops) * 1e6)
+    return summarize(samples)
+
+def summarize(samples):
+    s = sorted(samples)
+    median = s[len(s) // 2]
+    return {"unit": "us", "samples": len(s), "median": median, "mean": sum(s) / len(s),
+            "p99": s[min(len(s) - 1, int(len(s) * 0.99))], "min": s[0], "ops_per_s": 1e6 / median if median else 0.0}
+
+# --- 점수 계산 ---
+@bench("scoring.calc_score", "calc_score: 6^5 굴림 × 13 카테고리 (1회 = 점수 1개)")
+def _calc_score(q):
+    from yatzy_scoring import calc_score, SCORE_CATS
+    rolls = [list(r) for r in product(range(1, 7), repeat=5)]
+    def run():
+        for d in rolls:
+            for c in SCORE_CATS: calc_score(c, d)
+    return measure(run, 1, 3 if q else 10, ops=len(rolls) * len(SCORE_CATS))
+
+@bench("scoring.score_vector", "score_vector: 6^5 굴림 (1회 = 13개 점수 조회)")
+def _score_vector(q):
+    from yatzy_scoring import score_vector
+    rolls = [tuple(r) for r in product(range(1, 7), repeat=5)]
+    def run():
+        for d in rolls: score_vector(d)
+    return measure(run, 1, 5 if q else 30, ops=len(rolls))
+
+@bench("player.total", "Player.total(): 점수판이 모두 찬 플레이어")
+def _player_total(q):
+    from yatzy_engine import Player
+    from yatzy_scoring import SCORE_CATS
+    p = Player("bench")
+    for i, c in enumerate(SCORE_CATS): p.scores[c] = i * 3
+    return measure(p.total, 10000, 5 if q else 30)
+
+# --- 렌더링 ---
+def _game(state, players=2, mode="full"):
+    import random
+    import yatzy_advice_4 as y
+    g = y.Game(); g.render_mode = mode
+    g.num_players = players; g._setup_players()
+    g.engine.rng = random.Random(1)
+    if state in ("PLAYING", "GAME_OVER"):
+        g.engine.roll(); g.engine.toggle_hold(0)
+        g.advice_on, g.advice = True, "Don't eat non-snow-coloured snow."
+    g.state = state
+    return g
+
+def _frames(g, q, hover=False):
+    import yatzy_advice_4 as y
+    path = [(200, y.BOARD_Y + 10 + (i % 13) * y.ROW_H) for i in range(13)]
+    i = [0]
+    def frame():
+        if hover:
+            g.mouse = path[i[0] % 13]; i[0] += 1
+            for b in g.buttons.values(): b.check(g.mouse)
+        g.draw()
+    frame() # 텍스트 캐시, 정적 배경 준비
+    return measure(frame, 1, 60 if q else 300)
+
+for _state, _players, _mode, _hover in [("MODE_SELECTION", 2, "full", False), ("NAME_INPUT", 2, "full", False),
+                                         ("HOW_TO_PLAY", 2, "full", False), ("PLAYING", 1, "full", False),
+                                         ("PLAYING", 2, "full", False), ("PLAYING", 2, "full", True),
+                                         ("PLAYING", 2, "dirty", False), ("PLAYING", 2, "dirty", True),
+                                         ("GAME_OVER", 2, "full", False)]:
+    _name = f"render.{_state.lower()}" + (f".{_players}p" if _state == "PLAYING" else "") + \
+            (f".{_mode}" if _state == "PLAYING" else "") + (".hover" if _hover else "")
+    bench(_name, f"Game.draw 1프레임: {_state} ({_players}인, {_mode}{', 마우스 이동' if _hover else ''})")(
+        lambda q, s=_state, p=_players, m=_mode, h=_hover: _frames(_game(s, p, m), q, h))
+
+# --- 시뮬레이션 ---
+@bench("sim.greedy", "yatzy_sim.simulate greedy (1회 = 게임 1개)")
+def _sim(q):
+    import yatzy_sim as sim
+    n = 16384 if q else 65536
+    return measure(lambda: sim.simulate(n, seed=1), 1, 3 if q else 5, ops=n)
+
+@bench("engine.game", "YatzyEngine 2인 게임 (greedy 봇, 1회 = 게임 1개)")
+def _engine(q):
+    from yatzy_bots import make_bot, play_game
+    bots = [make_bot("greedy"), make_bot("greedy")]
+    seed = [0]
+    def run():
+        seed[0] += 1; play_game(bots, seed=seed[0])
+    return measure(run, 20, 5 if q else 20)
+
+# --- 조언 ---
+@bench("advice.fetch", "AdviceClient request -> poll 지연 (로컬 스텁 서버, prefetch 없음)")
+def _advice(q):
+    import stub_advice_server as stub
+    from yatzy_advice import AdviceClient
+    srv = stub.serve()
+    client = AdviceClient(srv.url, prefetch=0, cache_path=None, min_interval=0.0).start()
+    samples = []
+    try:
+        for token in range(-1, 20 if q else 200): # 토큰 -1: 작업 스레드의 requests import, 연결 준비 (측정 제외)
+            t = time.perf_counter()
+            client.request(token)
+            while client.poll(token) is None: time.sleep(0.0002)
+            if token >= 0: samples.append((time.perf_counter() - t) * 1e6)
+    finally:
+        client.stop(1); srv.shutdown()
+    return summarize(samples)
+
+# --- 실행 / 비교 ---
+def meta():
+    try: rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError: rev = ""
+    import numpy, pygame
+    return {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "git": rev, "python": platform.python_version(),
+            "platform": platform.platform(), "cpus": os.cpu_count(), "numpy": numpy.__version__, "pygame": pygame.version.ver}
+
+def run(only=None, quick=False, out=sys.stdout):
+    results = {}
+    for name, (fn, desc) in BENCHES.items():
+        if only and not any(fnmatch.fnmatch(name, p) for p in only): continue
+        r = fn(quick); r["desc"] = desc
+        results[name] = r
+        print(f"{name:32s} median {r['median']:12.3f} us  p99 {r['p99']:12.3f} us  {r['ops_per_s']:14,.0f}/s", file=out)
+    return {"meta": meta(), "results": results}
+
+def compare(base, new, threshold=0.1, out=sys.stdout):
+    # median 기준 변화율. threshold(비율)보다 느려진 항목 목록을 반환
+    regressions = []
+    print(f"기준 {base['meta'].get('git', '')} ({base['meta'].get('time', '')}) -> "
+          f"비교 {new['meta'].get('git', '')} ({new['meta'].get('time', '')}), 허용 {threshold:.0%}", file=out)
+    for name in sorted(set(base["results"]) | set(new["results"])):
+        a, b = base["results"].get(name), new["results"].get(name)
+        if a is None or b is None:
+            print(f"  {name:32s} {'(새 항목)' if a is None else '(없어짐)'}", file=out); continue
+        change = b["median"] / a["median"] - 1 if a["median"] else 0.0
+        flag = "회귀" if change > threshold else "개선" if change < -threshold else ""
+        if flag == "회귀": regressions.append(name)
+        print(f"  {name:32s} {a['median']:12.3f} -> {b['median']:12.3f} us  {change:+7.1%}  {flag}", file=out)
+    print(f"회귀 {len(regressions)}개" + (f": {', '.join(regressions)}" if regressions else ""), file=out)
+    return regressions
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["compare"]:
+        ap = argparse.ArgumentParser(description="벤치마크 결과 비교")
+        ap.add_argument("base"); ap.add_argument("new")
+        ap.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 median 증가 비율")
+        args = ap.parse_args(argv[1:])
+        with open(args.base, encoding="utf-8") as f: base = json.load(f)
+        with open(args.new, encoding="utf-8") as f: new = json.load(f)
+        return 1 if compare(base, new, args.threshold) else 0
+    ap = argparse.ArgumentParser(description="Yatzy 벤치마크 모음 (compare 하위 명령으로 두 결과 비교)")
+    ap.add_argument("-o", "--output", help="결과 JSON 경로 (기본: 표준 출력에 요약만)")
+    ap.add_argument("--only", nargs="+", help="이름 패턴 (예: 'render.*')")
+    ap.add_argument("--quick", action="store_true", help="반복 횟수를 줄여 빠르게")
+    ap.add_argument("--list", action="store_true")
+    args = ap.parse_args(argv)
+    if args.list:
+        for name, (_, desc) in BENCHES.items(): print(f"{name:32s} {desc}")
+        return 0
+    data = run(args.only, args.quick)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False, indent=1)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
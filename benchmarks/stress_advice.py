@@ -0,0 +1,105 @@
+import os, sys, time, random, argparse, threading
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import stub_advice_server as stub
+from yatzy_advice import AdviceClient
+
+# --- 조언 전달 스트레스 테스트 ---
+# 느린 로컬 스텁 서버를 상대로 수천 번의 턴을 빠르게 넘기며 다음을 확인한다.
+#   1. poll(token)이 돌려준 조언은 항상 그 토큰으로 전달된 것 (지난 턴의 조언이 새 턴에 나타나지 않음)
+#   2. 서버에 동시에 걸린 요청은 최대 1개
+#   3. 작업 스레드가 늘어나지 않음 (스레드 누수 없음)
+# 실패하면 0이 아닌 종료 코드로 끝난다. tests/test_advice.py가 같은 함수를 짧게 돌리고, 여기서는 긴 실행을 한다.
+
+class TracingClient(AdviceClient):
+    # 작업 스레드/메인 스레드가 결과 슬롯에 넣은 (토큰, 조언)을 기록
+    def __init__(self, *a, **kw):
+        super().__init__(*a, **kw)
+        self.delivered = {}
+        self._trace_lock = threading.Lock()
+
+    def _deliver(self, token, slip):
+        ok = super()._deliver(token, slip)
+        if ok:
+            with self._trace_lock: self.delivered.setdefault(token, []).append(slip)
+        return ok
+
+def client_stress(turns, delay, rng, out):
+    srv = stub.serve(delay=delay, fail_rate=0.05, seed=rng.random())
+    # 서버가 매번 다른 문구를 돌려주도록 요청 번호를 넣는다
+    srv.slips = [f"slip-{i}" for i in range(100000)]
+    base_threads = threading.active_count()
+    c = TracingClient(srv.url, prefetch=2, cache_path=None, min_interval=0.0, backoff_base=0.001, backoff_max=0.01).start()
+    received, errors, max_threads = 0, [], 0
+    for token in range(turns):
+        # 턴 시작 후 일부 턴만 요청하고, 결과를 기다리는 시간도 제각각 (대부분 결과 도착 전에 턴이 넘어감)
+        if rng.random() < 0.8: c.request(token)
+        deadline = time.perf_counter() + rng.choice((0, 0, 0.0005, 0.002, delay * 2))
+        while True:
+            slip = c.poll(token)
+            if slip is not None:
+                received += 1
+                if slip not in c.delivered.get(token, ()):
+                    errors.append(f"턴 {token}: 다른 턴의 조언 {slip!r}")
+            if time.perf_counter() >= deadline: break
+        if rng.random() < 0.3: c.cancel()
+        max_threads = max(max_threads, threading.active_count())
+    # 지난 토큰들은 더 이상 아무것도 돌려주지 않아야 한다
+    time.sleep(delay * 3)
+    for token in range(max(0, turns - 50), turns - 1):
+        if c.poll(token) is not None: errors.append(f"지난 턴 {token}의 결과가 남아 있음")
+    workers = sum(t.name == "advice-client" for t in threading.enumerate())
+    c.stop(timeout=5)
+    srv.shutdown(); srv.server_close()
+    print(f"[client] 턴 {turns}, 받은 조언 {received}, 버린 결과 {c.stale_dropped}, 서버 요청 {srv.hits}, "
+          f"최대 동시 요청 {srv.max_inflight}, 작업 스레드 {workers}, 스레드 수 {base_threads}->{max_threads}", file=out)
+    if srv.max_inflight > 1: errors.append(f"동시 요청 {srv.max_inflight}개")
+    if workers != 1: errors.append(f"작업 스레드 {workers}개")
+    if max_threads > base_threads + 4: errors.append(f"스레드 증가 {base_threads}->{max_threads}")
+    return errors
+
+def game_stress(turns, delay, rng, out):
+    # 실제 Game.update 경로: 굴림/점수 기록으로 턴이 바뀔 때 이전 턴의 조언이 표시되지 않는지 확인
+    import yatzy_advice_4 as y
+    srv = stub.serve(delay=delay, seed=rng.random())
+    srv.slips = [f"slip-{i}" for i in range(100000)]
+    g = y.Game()
+    g.advice_client = TracingClient(srv.url, prefetch=1, cache_path=None, min_interval=0.0)
+    errors, shown = [], 0
+    for t in range(turns):
+        if t % 26 == 0:
+            g.reset(); g.num_players = 2; g._setup_players(); g.state = "PLAYING"
+        g.engine.roll(); g._new_advice_turn(); g.advice_on = True
+        g.turn_t = g.advice_t = -10**9 # 조언 대기 시간이 지난 것으로 처리
+        for _ in range(rng.choice((1, 2, 5))):
+            g.update()
+            if g.advice is not None:
+                shown += 1
+                if g.advice not in g.advice_client.delivered.get(g.advice_gen, ()):
+                    errors.append(f"턴 {t}: 지난 토큰의 조언 {g.advice!r}")
+            time.sleep(rng.choice((0, 0.0005, delay)))
+        g.engine.score(g.engine.open_categories()[0]); g.advice_on = False; g._new_advice_turn()
+        if g.advice is not None: errors.append(f"턴 {t}: 턴 변경 후 조언이 남아 있음")
+    workers = sum(th.name == "advice-client" for th in threading.enumerate())
+    g.advice_client.stop(timeout=5)
+    srv.shutdown(); srv.server_close()
+    print(f"[game]   턴 {turns}, 표시된 조언 {shown}, 버린 결과 {g.advice_client.stale_dropped}, "
+          f"최대 동시 요청 {srv.max_inflight}, 작업 스레드 {workers}", file=out)
+    if srv.max_inflight > 1: errors.append(f"동시 요청 {srv.max_inflight}개")
+    if workers != 1: errors.append(f"작업 스레드 {workers}개")
+    return errors
+
+def main(argv=None, out=sys.stdout):
+    ap = argparse.ArgumentParser(description="조언 전달 스트레스 테스트")
+    ap.add_argument("--turns", type=int, default=5000)
+    ap.add_argument("--delay", type=float, default=0.005, help="스텁 서버 응답 지연(초)")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    rng = random.Random(args.seed)
+    errors = client_stress(args.turns, args.delay, rng, out) + game_stress(args.turns // 5, args.delay, rng, out)
+    for e in errors[:20]: print("실패:", e, file=out)
+    print("통과" if not errors else f"실패 {len(errors)}건", file=out)
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import json, time, random, threading, argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# --- 로컬 조언 API 스텁 서버 ---
+# api.adviceslip.com 대신 사용한다. 응답 지연(delay)과 실패 비율(fail_rate)을 조절할 수 있다.
+#   server = serve(delay=0.5); url = server.url; ...; server.shutdown()
+
+SLIPS = [
+    "Don't eat non-snow-coloured snow.",
+    "Never cut your own fringe.",
+    "Always bet on the dice you can count.",
+    "If you don't want something to be public, don't put it on the Internet.",
+    "Sleep is the best cure for waking troubles.",
+    "Smile and the world smiles with you.",
+]
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive: 클라이언트의 연결 재사용 확인용
+    disable_nagle_algorithm = True # 헤더와 본문을 따로 보내므로 Nagle + delayed ACK(약 40ms) 지연을 막는다
+
+    def setup(self):
+        super().setup()
+        with self.server.lock: self.server.connections += 1
+
+    def do_GET(self):
+        srv = self.server
+        with srv.lock:
+            srv.hits += 1; n = srv.hits
+            srv.inflight += 1; srv.max_inflight = max(srv.max_inflight, srv.inflight)
+        try:
+            self._reply(srv, n)
+        except (BrokenPipeError, ConnectionResetError):
+            with srv.lock: srv.aborted += 1 # 응답 전에 클라이언트가 연결을 닫음 (요청 취소)
+        finally:
+            with srv.lock: srv.inflight -= 1
+
+    def _reply(self, srv, n):
+        if srv.delay: time.sleep(srv.delay)
+        if srv.rng.random() < srv.fail_rate:
+            self.send_response(503); self.send_header("Content-Length", "0"); self.end_headers(); return
+        body = json.dumps({"slip": {"id": n, "advice": srv.slips[n % len(srv.slips)]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args): pass
+
+def serve(port=0, delay=0.0, fail_rate=0.0, slips=SLIPS, seed=0):
+    # 백그라운드 스레드에서 스텁 서버를 띄우고 서버 객체를 반환 (server.url로 접속)
+    srv = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    srv.daemon_threads = True
+    srv.delay, srv.fail_rate, srv.slips = delay, fail_rate, list(slips)
+    srv.rng, srv.lock, srv.hits, srv.connections = random.Random(seed), threading.Lock(), 0, 0
+    srv.inflight = srv.max_inflight = 0 # 동시 처리 중인 요청 수 (클라이언트의 동시 요청 상한 확인용)
+    srv.aborted = 0
+    srv.url = f"http://127.0.0.1:{srv.server_address[1]}/advice"
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description="로컬 조언 API 스텁 서버")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--delay", type=float, default=0.0)
+    ap.add_argument("--fail-rate", type=float, default=0.0)
+    args = ap.parse_args()
+    srv = serve(args.port, args.delay, args.fail_rate)
+    print(f"스텁 서버: {srv.url} (YATZY_ADVICE_URL={srv.url} 로 게임 실행)")
+    try:
+        while True: time.sleep(3600)
+    except KeyboardInterrupt:
+        srv.shutdown()
@@ -0,0 +1,7 @@
+import os
+
+# 게임 모듈을 import하는 테스트용 환경: 화면 없이, 저장/통계/조언 캐시 파일을 쓰지 않는다 (import 전에 정해야 한다)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.update(YATZY_SAVE=os.path.join(os.devnull, "save"), YATZY_ARCHIVE=os.path.join(os.devnull, "archive"),
+                  YATZY_HISTORY=os.path.join(os.devnull, "history"), YATZY_ADVICE_CACHE="", YATZY_PROFILE="0")
@@ -0,0 +1,38 @@
+import io, time, random
+import pytest
+import stub_advice_server as stub
+from yatzy_advice import AdviceClient
+
+@pytest.fixture
+def server():
+    srv = stub.serve(delay=0.2)
+    srv.slips = [f"slip-{i}" for i in range(1000)]
+    yield srv
+    srv.shutdown(); srv.server_close()
+
+def _wait(c, token, timeout=5):
+    end = time.perf_counter() + timeout
+    while time.perf_counter() < end:
+        slip = c.poll(token)
+        if slip is not None: return slip
+        time.sleep(0.005)
+
+def test_slip_fetched_for_stale_token_is_reused(server):
+    # 요청 도중 토큰이 바뀌면 받은 조언을 버리지 않고 다음 토큰에 전달한다 (서버 요청 1번)
+    c = AdviceClient(server.url, prefetch=0, cache_path=None, min_interval=0.0).start()
+    try:
+        time.sleep(0.3) # 작업 스레드 준비 (requests import)
+        c.request(1); time.sleep(0.05); c.request(2)
+        assert _wait(c, 2) == "slip-1"
+        assert server.hits == 1 and c.poll(1) is None
+    finally:
+        c.stop(timeout=5)
+
+# benchmarks/stress_advice.py의 짧은 실행: 지난 턴의 조언이 보이지 않고, 동시 요청 1개, 작업 스레드 누수 없음
+def test_client_stress():
+    import stress_advice
+    assert stress_advice.client_stress(400, 0.005, random.Random(0), io.StringIO()) == []
+
+def test_game_stress():
+    import stress_advice
+    assert stress_advice.game_stress(60, 0.005, random.Random(1), io.StringIO()) == []
@@ -0,0 +1,63 @@
+import random, sqlite3
+from yatzy_scoring import CAT_INDEX
+from yatzy_engine import YatzyEngine
+from yatzy_log import GameLog, archive, read_games
+import yatzy_history as H
+
+def _finished(path, seed, names=("A", "B")):
+    # greedy로 끝까지 둔 게임 하나를 저장 파일에 기록
+    eng, rng = YatzyEngine(list(names), seed=seed), random.Random(seed)
+    log = GameLog.create(path, eng)
+    while not eng.over:
+        eng.roll()
+        for i in range(5):
+            if rng.random() < 0.4: eng.toggle_hold(i)
+        eng.roll()
+        pv = eng.preview()
+        eng.score(max(eng.open_categories(), key=lambda c: pv[CAT_INDEX[c]]))
+    log.close()
+    return eng
+
+def _counts(db):
+    conn = H.connect(db)
+    try:
+        return (conn.execute("SELECT count(*) FROM games").fetchone()[0], conn.execute("SELECT count(*) FROM results").fetchone()[0],
+                H.player_stats(conn), conn.execute("SELECT sum(n) FROM category_counts").fetchone()[0],
+                conn.execute("SELECT sum(n) FROM fill_counts").fetchone()[0])
+    finally:
+        conn.close()
+
+def test_import_twice_adds_nothing(tmp_path):
+    db, arc = str(tmp_path / "h.sqlite3"), str(tmp_path / "archive.bin")
+    for seed in (1, 2, 3):
+        save = str(tmp_path / "save.bin"); _finished(save, seed); archive(save, arc)
+    store = H.HistoryStore(db)
+    assert store.import_archive(arc) == 3
+    first = _counts(db)
+    assert first[:2] == (3, 6) and first[3] == first[4] == 6 * H.NUM_CATS
+    assert store.import_archive(arc) == 0
+    assert _counts(db) == first
+
+def test_submitted_game_not_counted_again_on_import(tmp_path):
+    # UI 흐름: 끝난 게임을 submit한 뒤 아카이브 -> 아카이브를 가져와도 그대로
+    db, save, arc = str(tmp_path / "h.sqlite3"), str(tmp_path / "save.bin"), str(tmp_path / "archive.bin")
+    _finished(save, 7, ("A",))
+    store = H.HistoryStore(db, interval=0.01)
+    store.submit(read_games(save)[-1], ended=1.0); store.stop()
+    archive(save, arc)
+    assert store.written == 1 and store.import_archive(arc) == 0
+    conn = H.connect(db)
+    try: assert conn.execute("SELECT ended FROM games").fetchall() == [(1.0,)] # submit한 실제 종료 시각이 남는다
+    finally: conn.close()
+
+def test_old_db_gets_key_column(tmp_path):
+    # key 열이 없던 DB도 열린다
+    db = str(tmp_path / "old.sqlite3")
+    conn = sqlite3.connect(db)
+    conn.executescript(H.SCHEMA.replace(", key BLOB", ""))
+    conn.close()
+    save = str(tmp_path / "save.bin"); _finished(save, 4)
+    store = H.HistoryStore(db, interval=0.01)
+    game = read_games(save)[-1]
+    store.submit(game); store.submit(game); store.stop()
+    assert store.written == 1 and _counts(db)[0] == 1
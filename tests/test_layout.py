@@ -0,0 +1,38 @@
+import pytest
+from yatzy_layout import Layout, layout
+
+SIZE = (1280, 950)
+
+# 1280×950에서 손으로 계산한 점 -> 적중 키
+@pytest.mark.parametrize("num_players, pos, keys", [
+    (1, (400, 230), (("row", 0, 0),)),          # 1인 패널 x0=320, 행 x 360..920, 첫 행 y 222..257
+    (1, (400, 510), (("row", 0, 6),)),          # Lower 첫 행: Upper 끝(430) + 70
+    (1, (640, 800), (("dice", 0, 2),)),         # 주사위 줄 가운데 정렬: x 400부터 100 간격, y 760
+    (1, (490, 800), ()),                        # 주사위 사이 빈 틈
+    (1, (400, 440), (("input", 0),)),           # 이름 입력 상자 (390, 400, 500, 50), 점수판 Upper 끝 아래
+    (1, (640, 880), (("button", "roll"),)),
+    (2, (1200, 230), (("row", 1, 0),)),         # 두 번째 패널 x0=640
+    (2, (1000, 720), (("row", 1, 12),)),        # 마지막 행 (Chance) y 712..747
+    (2, (500, 780), (("dice", 0, 4),)),         # 2인 주사위는 패널 x0 + 80부터
+    (2, (750, 800), (("dice", 1, 0),)),
+    (2, (1150, 100), (("button", "restart"),)),
+])
+def test_hits_at_known_points(num_players, pos, keys):
+    assert Layout(num_players, SIZE).hits(pos) == keys
+
+def test_hits_match_brute_force():
+    # 격자 인덱스 조회가 모든 영역을 순서대로 검사한 결과와 같다
+    for n in (1, 2):
+        L = Layout(n, SIZE)
+        areas = [(("button", k), r) for k, r in L.buttons.items()] + [(("input", i), r) for i, r in enumerate(L.inputs)]
+        for k, p in enumerate(L.panels):
+            areas += [(("row", k, i), r) for i, r in enumerate(p.rows)] + [(("dice", k, i), r) for i, r in enumerate(p.dice)]
+        for x in range(0, SIZE[0], 7):
+            for y in range(0, SIZE[1], 7):
+                assert L.hits((x, y)) == tuple(key for key, r in areas if r.collidepoint(x, y)), (n, x, y)
+
+def test_layout_follows_screen_size():
+    L = layout(2, (1600, 1000))
+    assert L.hits((800, 930)) == (("button", "roll"),) # (w//2-75, h-95)
+    assert L.panels[1].x0 == 800 and L.panels[0].dice_y == 810
+    assert layout(2, (1600, 1000)) is L and layout(2, SIZE) is not L
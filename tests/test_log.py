@@ -0,0 +1,65 @@
+import random
+import pytest
+from yatzy_scoring import CAT_INDEX
+from yatzy_engine import YatzyEngine
+from yatzy_log import GameLog, LogError, encode_start, parse, read_games, replay, resume, archive, complete_size
+
+def _play(eng, rng, turns):
+    # 굴림/고정/greedy 기록을 turns턴 진행
+    for _ in range(turns):
+        if eng.over: return
+        eng.roll()
+        for i in range(5):
+            if rng.random() < 0.4: eng.toggle_hold(i)
+        eng.roll()
+        pv = eng.preview()
+        eng.score(max(eng.open_categories(), key=lambda c: pv[CAT_INDEX[c]]))
+
+def _totals(eng): return [p.total() for p in eng.players]
+
+def test_create_resume_roundtrip(tmp_path):
+    path, rng = str(tmp_path / "save.bin"), random.Random(0)
+    eng = YatzyEngine(["A", "B"], seed=11)
+    log = GameLog.create(path, eng); _play(eng, rng, 6); log.close()
+    back = resume(path)
+    assert _totals(back) == _totals(eng) and back.turn == eng.turn
+    assert _totals(replay(read_games(path)[-1])) == _totals(eng)
+
+@pytest.mark.parametrize("cut", [1, 3, 7])
+def test_resume_after_truncated_event(tmp_path, cut):
+    # 마지막 이벤트를 쓰는 도중 종료된 저장 파일: 이어한 뒤의 이벤트가 어긋나지 않아야 한다
+    path, rng = str(tmp_path / "save.bin"), random.Random(cut)
+    eng = YatzyEngine(["A", "B"], seed=5)
+    log = GameLog.create(path, eng); _play(eng, rng, 4); log.close()
+    with open(path, "rb") as f: data = f.read()
+    with open(path, "wb") as f: f.write(data[:-cut])
+    eng = resume(path)
+    before = len(read_games(path)[-1].events)
+    log = GameLog.append(path, eng); _play(eng, rng, 30); log.close()
+    assert eng.over
+    with open(path, "rb") as f: data = f.read()
+    assert complete_size(data) == len(data)
+    games = parse(data)
+    assert len(games) == 1 and len(games[0].events) > before
+    assert _totals(replay(games[0])) == _totals(resume(path)) == _totals(eng)
+
+def test_truncated_start_is_dropped(tmp_path):
+    # 두 번째 게임의 START가 이름 중간에서 잘린 아카이브
+    path, rng = str(tmp_path / "save.bin"), random.Random(2)
+    eng = YatzyEngine(["Alice", "Bob"], seed=3)
+    log = GameLog.create(path, eng); _play(eng, rng, 13); log.close()
+    with open(path, "rb") as f: first = f.read()
+    with open(path, "ab") as f: f.write(encode_start(9, ["Alice", "Bob"])[:-2])
+    with open(path, "rb") as f: data = f.read()
+    assert complete_size(data) == len(first) and len(parse(data)) == 1
+    arch = str(tmp_path / "archive.bin")
+    archive(path, arch)
+    eng2 = YatzyEngine(["C"], seed=4)
+    log = GameLog.create(path, eng2); _play(eng2, rng, 13); log.close()
+    archive(path, arch)
+    games = read_games(arch)
+    assert [g.names for g in games] == [["Alice", "Bob"], ["C"]]
+    assert _totals(replay(games[1])) == _totals(eng2)
+
+def test_missing_start_is_an_error():
+    with pytest.raises(LogError): parse(bytes([2, 0, 1, 2, 3, 4, 5, 0]))
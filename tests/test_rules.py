@@ -0,0 +1,69 @@
+import pytest
+from yatzy_rules import RULESETS, load
+
+# 규칙 변형 점수표를 손으로 계산한 행과 비교 (행 순서는 각 규칙 집합의 카테고리 순서)
+SCANDINAVIAN = [
+    # Aces..Sixes, One Pair, Two Pairs, 3K, 4K, Small, Large, Full House, Chance, Yatzy
+    ([3, 3, 3, 5, 5], (0, 0, 9, 0, 10, 0, 10, 16, 9, 0, 0, 0, 19, 19, 0)),
+    ([2, 3, 4, 5, 6], (0, 2, 3, 4, 5, 6, 0, 0, 0, 0, 0, 20, 0, 20, 0)),
+    ([1, 2, 3, 4, 5], (1, 2, 3, 4, 5, 0, 0, 0, 0, 0, 15, 0, 0, 15, 0)),
+    ([6, 6, 6, 6, 2], (0, 2, 0, 0, 0, 24, 12, 0, 18, 24, 0, 0, 0, 26, 0)),
+    ([2, 2, 2, 2, 2], (0, 10, 0, 0, 0, 0, 4, 0, 6, 8, 0, 0, 0, 10, 50)),
+]
+MAXI = [
+    # Aces..Sixes, 1/2/3 Pairs, 3/4/5 of a Kind, Small, Large, Full Straight, Full House, Castle, Tower, Chance, Maxi Yatzy
+    ([1, 1, 2, 2, 6, 6], (2, 4, 0, 0, 0, 12, 12, 16, 18, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18, 0)),
+    ([1, 2, 3, 4, 5, 6], (1, 2, 3, 4, 5, 6, 0, 0, 0, 0, 0, 0, 15, 20, 21, 0, 0, 0, 21, 0)),
+    ([4, 4, 4, 4, 6, 6], (0, 0, 0, 16, 0, 12, 12, 20, 0, 12, 16, 0, 0, 0, 0, 24, 0, 28, 28, 0)),
+    ([5, 5, 5, 3, 3, 3], (0, 0, 9, 0, 15, 0, 10, 16, 0, 15, 0, 0, 0, 0, 0, 21, 24, 0, 24, 0)),
+    ([5, 5, 5, 5, 5, 5], (0, 0, 0, 0, 30, 0, 10, 0, 0, 15, 20, 25, 0, 0, 0, 0, 0, 0, 30, 100)),
+]
+
+@pytest.mark.parametrize("dice, row", SCANDINAVIAN)
+def test_scandinavian_rows(dice, row):
+    assert load("scandinavian").score_vector(dice) == row
+
+@pytest.mark.parametrize("dice, row", MAXI)
+def test_maxi_rows(dice, row):
+    r = load("maxi")
+    assert r.dice == 6 and len(r.cats) == 20
+    assert r.score_vector(dice) == row
+
+def test_every_ruleset_compiles():
+    for name in RULESETS:
+        r = load(name)
+        assert len(r.rows) == len(r.multisets) == (252 if r.dice == 5 else 462)
+        assert r.score_vector([0] * r.dice) == r.zero
+
+# Yahtzee 조커: Ones..Sixes, 3K, 4K, Full House, Small, Large, Yahtzee, Chance
+FOURS = [4] * 5
+NORMAL = (0, 0, 0, 20, 0, 0, 20, 20, 0, 0, 0, 50, 20)
+JOKER = (0, 0, 0, 20, 0, 0, 20, 20, 25, 30, 40, 50, 20)
+
+def _sheet(**filled):
+    scores = dict.fromkeys(load("yahtzee").cats)
+    scores.update({k.replace("_", " "): v for k, v in filled.items()})
+    return scores
+
+def test_joker_not_active_before_yahtzee_filled():
+    r = load("yahtzee")
+    row, allowed, extra = r.turn(FOURS, _sheet())
+    assert row == NORMAL and allowed == list(r.cats) and extra == 0
+
+def test_joker_forces_open_upper_box():
+    row, allowed, extra = load("yahtzee").turn(FOURS, _sheet(Yahtzee=50))
+    assert row == NORMAL and allowed == ["Fours"] and extra == 100
+
+def test_joker_fixed_scores_in_lower_boxes():
+    r = load("yahtzee")
+    row, allowed, extra = r.turn(FOURS, _sheet(Yahtzee=50, Fours=12, Full_House=25))
+    assert row == JOKER and extra == 100
+    assert allowed == ["3 of a Kind", "4 of a Kind", "Small Straight", "Large Straight", "Chance"]
+
+def test_joker_falls_back_to_any_open_box():
+    r = load("yahtzee")
+    lower = {c.replace(" ", "_"): 0 for c in r.cats[6:]}
+    row, allowed, extra = r.turn(FOURS, _sheet(**lower, Fours=12))
+    # Yahtzee를 0점으로 채웠으면 보너스는 없지만 조커 배치는 그대로 적용된다
+    assert row == JOKER and extra == 0
+    assert allowed == ["Ones", "Twos", "Threes", "Fives", "Sixes"]
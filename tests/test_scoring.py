@@ -0,0 +1,26 @@
+from itertools import product
+import pytest
+from yatzy_scoring import SCORE_CATS, SCORE_TABLE, NUM_CATS, calc_score, dice_key, score, score_vector
+
+ROLLS = list(product(range(1, 7), repeat=5))
+
+# 점수표 조회가 기준 구현 calc_score와 모든 굴림(7776) × 모든 카테고리(13)에서 같은지 확인
+def test_score_vector_matches_calc_score():
+    assert len(ROLLS) == 7776
+    for d in ROLLS:
+        assert score_vector(d) == tuple(calc_score(c, list(d)) for c in SCORE_CATS), d
+
+@pytest.mark.parametrize("cat", SCORE_CATS)
+def test_score_matches_calc_score(cat):
+    for d in ROLLS:
+        assert score(cat, d) == calc_score(cat, list(d)), (cat, d)
+
+def test_unrolled_dice_score_zero():
+    assert dice_key([0]*5) is None
+    assert score_vector([0]*5) == tuple(calc_score(c, [0]*5) for c in SCORE_CATS) == (0,) * NUM_CATS
+    for c in SCORE_CATS: assert score(c, [0]*5) == 0
+
+def test_table_bytes_match_rows():
+    for d in ROLLS:
+        i = dice_key(d)
+        assert tuple(SCORE_TABLE[i * NUM_CATS:(i + 1) * NUM_CATS]) == score_vector(d)
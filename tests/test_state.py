@@ -0,0 +1,55 @@
+import copy, pickle, random
+import pytest
+from yatzy_scoring import SCORE_CATS, UPPER_MAP
+from yatzy_state import ScoreSheet, PlayerState
+
+def _check(s):
+    # 유지되는 합계가 처음부터 다시 센 값과 같은지
+    vals = {c: v for c, v in s.items() if v is not None}
+    assert set(s) == set(SCORE_CATS)
+    assert s.filled == sum(1 << i for i, c in enumerate(SCORE_CATS) if c in vals)
+    assert s.upper == sum(v for c, v in vals.items() if c in UPPER_MAP)
+    assert s.raw_total == sum(vals.values())
+
+def test_setitem_and_update_keep_totals():
+    rng, s = random.Random(0), ScoreSheet()
+    for _ in range(500):
+        c = rng.choice(SCORE_CATS)
+        if rng.random() < 0.5: s[c] = rng.choice([None, 0, 5, 12, 25, 50])
+        else: s.update({c: rng.randrange(30)})
+        _check(s)
+
+def test_ior_and_setdefault():
+    s = ScoreSheet({"Aces": 3})
+    s |= {"Sixes": 24, "Chance": 20}
+    assert isinstance(s, ScoreSheet)
+    _check(s); assert s.total() == 47
+    assert s.setdefault("Aces", 5) == 3 and s.setdefault("Twos", 8) is None
+    _check(s)
+    with pytest.raises(KeyError): s.setdefault("Bogus", 1)
+    with pytest.raises(KeyError): s["Bogus"] = 1
+    assert "Bogus" not in s
+    _check(s)
+
+@pytest.mark.parametrize("op", [lambda s: s.pop("Aces"), lambda s: s.popitem(), lambda s: s.clear(),
+                                lambda s: s.__delitem__("Aces")])
+def test_removing_categories_is_rejected(op):
+    s = ScoreSheet({"Aces": 3, "Yatzy": 50})
+    with pytest.raises(TypeError): op(s)
+    _check(s); assert s.total() == 53
+
+def test_copy_pickle_deepcopy():
+    s = ScoreSheet({c: 3 * UPPER_MAP[c] for c in UPPER_MAP})
+    s["Yatzy"] = 50
+    for t in (s.copy(), copy.copy(s), copy.deepcopy(s), pickle.loads(pickle.dumps(s))):
+        assert type(t) is ScoreSheet and t == s and t is not s
+        assert (t.filled, t.upper, t.raw_total, t.total()) == (s.filled, s.upper, s.raw_total, s.total())
+        t["Chance"] = 10
+        assert s["Chance"] is None
+
+def test_player_state_pack_roundtrip():
+    rng = random.Random(1)
+    for _ in range(200):
+        scores = tuple(rng.randrange(64) for _ in SCORE_CATS)
+        st = PlayerState(scores, rng.randrange(1 << 13), tuple(rng.randrange(7) for _ in range(5)), rng.randrange(32), rng.randrange(4))
+        assert PlayerState.unpack(st.pack()) == st == PlayerState.from_bytes(st.to_bytes())
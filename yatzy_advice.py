@@ -0,0 +1,176 @@
+import os, json, time, random, threading
+from collections import deque
+
+# --- 조언 API 클라이언트 ---
+# 오래 사는 작업 스레드 하나가 requests.Session(연결 재사용)으로 조언을 미리 받아
+# prefetch 큐에 N개를 채워 둔다. 받은 조언은 디스크 캐시에 저장해 오프라인일 때 재사용하고,
+# 실패 시 지수 백오프로 재시도한다. requests(HTTP 스택)는 작업 스레드가 처음 뜰 때 import하므로
+# 조언을 쓰지 않는 실행과 pygame 없는 도구는 그 비용을 치르지 않는다.
+#
+# 메인 스레드와는 턴 토큰으로만 주고받는다:
+#   request(token) -> 해당 턴의 조언 1개 요청 (미처리 요청은 항상 최대 1개)
+#   poll(token)    -> 블로킹 없이 결과 확인. 다른(지난) 토큰의 결과는 버린다.
+#   cancel()       -> 미처리 요청과 결과를 버린다 (게임 리셋, 턴 변경)
+
+ADVICE_URL = "https://api.adviceslip.com/advice"
+ADVICE_ERROR = "Time to make a move! (Network or Data Error)"
+CACHE_PATH = os.environ.get("YATZY_ADVICE_CACHE", os.path.join(os.path.expanduser("~"), ".yatzy_advice_cache.json"))
+
+class AdviceClient:
+    def __init__(self, url=ADVICE_URL, prefetch=3, cache_path=CACHE_PATH, timeout=3,
+                 min_interval=2.0, backoff_base=1.0, backoff_max=60.0, cache_max=500):
+        # min_interval: 요청 사이 최소 간격(초). adviceslip은 2초 동안 같은 조언을 돌려준다.
+        self.url, self.prefetch, self.cache_path, self.timeout = url, prefetch, cache_path, timeout
+        self.min_interval, self.backoff_base, self.backoff_max, self.cache_max = min_interval, backoff_base, backoff_max, cache_max
+        self.ready = deque()            # 미리 받아 둔 조언
+        self.seen = self._load_cache()  # 디스크 캐시: {id: 조언}
+        self._lock = threading.Lock()   # seen, 요청/결과 슬롯 보호
+        self._want = None               # 처리 대기 중인 요청의 토큰
+        self._result = None             # (토큰, 조언) 전달 슬롯
+        self.failures = 0
+        self.requests_made = 0
+        self.stale_dropped = 0          # 지난 토큰이라 버린 결과 수
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._session = None
+
+    # 수명 관리
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="advice-client", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set(); self._wake.set()
+        if self._thread is not None: self._thread.join(timeout)
+        self._thread = None
+
+    # 메인 스레드 쪽 (블로킹 없음)
+    def request(self, token):
+        # 미리 받아 둔 조언이 있으면 바로 결과 슬롯에 넣고, 없으면 작업 스레드에 맡긴다
+        self.start()
+        with self._lock:
+            if self._want == token or (self._result is not None and self._result[0] == token): return
+            if self._want is not None or self._result is not None: self.stale_dropped += 1
+            self._want, self._result = token, None
+        slip = self._take_ready()
+        if slip is not None: self._deliver(token, slip)
+        self._wake.set()
+
+    def poll(self, token):
+        # 현재 토큰의 결과가 도착했으면 꺼내서 반환, 아니면 None
+        with self._lock:
+            if self._result is None: return None
+            t, slip = self._result
+            self._result = None
+            if t != token:
+                self.stale_dropped += 1
+                return None
+            return slip
+
+    def cancel(self):
+        with self._lock:
+            if self._want is not None or self._result is not None: self.stale_dropped += 1
+            self._want = self._result = None
+
+    @property
+    def pending(self):
+        with self._lock: return self._want
+
+    def _take_ready(self):
+        # 미리 받아 둔 조언 -> (오프라인이면) 디스크 캐시의 조언 -> 오류 문구, 없으면 None
+        try:
+            return self.ready.popleft()
+        except IndexError:
+            pass
+        if self.failures:
+            with self._lock: cached = list(self.seen.values())
+            return random.choice(cached) if cached else ADVICE_ERROR
+        return None
+
+    def _deliver(self, token, slip):
+        # 요청한 토큰이 아직 유효할 때만 결과 슬롯에 넣는다. 그 사이 토큰이 바뀌었으면 받은 조언을
+        # prefetch 큐 맨 앞에 되돌려 다음 요청에 쓴다 (빠른 재굴림이 큐를 비우고 요청을 늘리지 않도록)
+        with self._lock:
+            if self._want != token:
+                if slip == ADVICE_ERROR: self.stale_dropped += 1
+                else: self.ready.appendleft(slip)
+                return False
+            self._want, self._result = None, (token, slip)
+            return True
+
+    # 작업 스레드
+    def _run(self):
+        import requests
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self._session.mount("http://", adapter); self._session.mount("https://", adapter)
+        last = 0.0
+        try:
+            while not self._stop.is_set():
+                want = self.pending
+                if want is not None and self.ready:
+                    self._deliver(want, self.ready.popleft())
+                    continue
+                if want is None and len(self.ready) >= self.prefetch:
+                    self._wake.wait(); self._wake.clear()
+                    continue
+                wait = last + self._delay() - time.monotonic()
+                if wait > 0:
+                    self._wake.wait(wait); self._wake.clear()
+                    continue
+                last = time.monotonic()
+                slip = self._fetch()
+                if want is None:
+                    if slip is not None: self.ready.append(slip)
+                    continue
+                # 요청 도중 토큰이 바뀌었으면 _deliver가 결과를 큐에 되돌린다
+                if slip is None: slip = self._take_ready()
+                if slip is not None: self._deliver(want, slip)
+        finally:
+            self._session.close()
+
+    def _delay(self):
+        # 실패가 없으면 요청 간격, 실패가 이어지면 지수 백오프(+지터)
+        if not self.failures: return self.min_interval
+        return min(self.backoff_max, self.backoff_base * 2 ** (self.failures - 1)) * random.uniform(0.5, 1.0)
+
+    def _fetch(self):
+        # 조언 1개를 받아 디스크 캐시에 기록하고 반환 (실패 시 None)
+        self.requests_made += 1
+        try:
+            r = self._session.get(self.url, timeout=self.timeout)
+            r.raise_for_status()
+            slip = r.json()['slip']
+            sid, text = str(slip.get('id', slip['advice'])), slip['advice']
+        except Exception:
+            self.failures += 1
+            return None
+        self.failures = 0
+        with self._lock:
+            new = sid not in self.seen
+            if new:
+                self.seen[sid] = text
+                while len(self.seen) > self.cache_max: self.seen.pop(next(iter(self.seen)))
+                data = dict(self.seen)
+        if new: self._save_cache(data)
+        return text
+
+    # 디스크 캐시
+    def _load_cache(self):
+        if not self.cache_path: return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f: return dict(json.load(f))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, data):
+        if not self.cache_path: return
+        tmp = self.cache_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
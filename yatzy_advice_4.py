@@ -1,9 +1,19 @@
-import pygame, random, sys, requests, textwrap, os
-from collections import Counter
-import threading
+import pygame, random, sys, os
+from functools import lru_cache
+from yatzy_scoring import SCORE_CATS
+from yatzy_engine import YatzyEngine
+from yatzy_render import DirtyCompositor, DiceAtlas
+from yatzy_layout import layout, DICE_SIZE, DICE_SPACING, NAME_Y, TOTAL_Y, ADVICE_Y
+from yatzy_text import TextCache, wrap_lines
+from yatzy_advice import AdviceClient, ADVICE_URL
+from yatzy_log import GameLog, LogError, resume, archive, read_games
+from yatzy_history import HistoryStore
+from yatzy_bots import BOTS, AI_NAME, BotRunner, make_bot, bot_from_name, snapshot, ROLL
+from yatzy_hints import HintService, hint_text
 
 # --- 초기 설정 & 상수 ---
-pygame.init()
+# import만으로는 pygame 초기화, 창 생성, 폰트 로딩을 하지 않는다. 창은 Game()이 init_display()로 만들고,
+# 폰트는 크기별로 처음 쓸 때 불러온다. 확률표/해법/프로파일러/HTTP 모듈도 쓰는 시점에 import한다.
 SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 950
 WHITE, BLACK, GRAY, LIGHT_GRAY, RED, GREEN, BLUE, GOLD = (255,255,255),(0,0,0),(200,200,200),(230,230,230),(200,0,0),(0,150,0),(0,0,200),(255,215,0)
 
@@ -12,38 +22,112 @@ KOREAN_FONT_PATH = os.path.join(os.environ.get("SystemRoot", "C:\\Windows"), "Fo
 if not os.path.exists(KOREAN_FONT_PATH):
     KOREAN_FONT_PATH = None
 
+@lru_cache(maxsize=None)
+def font(size):
+    # 크기별 폰트를 처음 요청할 때 한 번만 불러와 공유 (한글 폰트를 못 읽으면 기본 폰트)
+    pygame.font.init()
+    try: return pygame.font.Font(KOREAN_FONT_PATH, size)
+    except: return pygame.font.Font(None, size)
+
+class LazyFont:
+    # 처음 속성에 접근할 때 font(size)를 불러오고, 찾은 속성(render, size, ...)은 인스턴스에 저장해 바로 쓴다
+    def __init__(self, size): self.pt = size
+    def __getattr__(self, name):
+        attr = getattr(font(self.pt), name)
+        setattr(self, name, attr)
+        return attr
+
 # 폰트 크기 재조정
-try:
-    # F_BIG: 60, F_MED: 40, F_SML: 28, F_TINY: 20
-    F_BIG, F_MED, F_SML, F_TINY = (pygame.font.Font(KOREAN_FONT_PATH, s) for s in (60, 40, 28, 20))
-    # '총점' 및 'Rolls Left'용 미니 폰트 (F_MINI: 18)
-    F_MINI = pygame.font.Font(KOREAN_FONT_PATH, 18)
-    # 조언용 초미니 폰트 (F_V_TINY: 14pt로 축소)
-    F_V_TINY = pygame.font.Font(KOREAN_FONT_PATH, 14) 
-except:
-    F_BIG, F_MED, F_SML, F_TINY = (pygame.font.Font(None, s) for s in (60, 40, 28, 20))
-    F_MINI = pygame.font.Font(None, 18)
-    F_V_TINY = pygame.font.Font(None, 14)
-
-
-SCORE_CATS = [
-    "Aces","Twos","Threes","Fours","Fives","Sixes",
-    "3 of a Kind","4 of a Kind","Full House","Small Straight","Large Straight","Yatzy","Chance"
-]
-UPPER_MAP = {"Aces":1,"Twos":2,"Threes":3,"Fours":4,"Fives":5,"Sixes":6}
-SMALL_STRAIGHTS = [{1,2,3,4},{2,3,4,5},{3,4,5,6}]
+# F_BIG: 60, F_MED: 40, F_SML: 28, F_TINY: 20
+F_BIG, F_MED, F_SML, F_TINY = (LazyFont(s) for s in (60, 40, 28, 20))
+# '총점' 및 'Rolls Left'용 미니 폰트 (F_MINI: 18)
+F_MINI = LazyFont(18)
+# 조언용 초미니 폰트 (F_V_TINY: 14pt로 축소)
+F_V_TINY = LazyFont(14)
+
+
 ADVICE_DELAY, ADVICE_INTERVAL = 5000, 10000
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Yatzy Game")
+# 조언 출처: "quote"(외부 명언 API) 또는 "hint"(최적 해법 기반 추천)
+ADVICE_SOURCE = os.environ.get("YATZY_ADVICE", "quote")
+ADVICE_URL = os.environ.get("YATZY_ADVICE_URL", ADVICE_URL)
+# 렌더링 방식: "full"(매 프레임 전체 다시 그리기) 또는 "dirty"(바뀐 영역만 갱신)
+RENDER_MODE = os.environ.get("YATZY_RENDER", "full")
+# 남은 굴림으로 각 카테고리를 성공할 확률/기대 점수 표시 (게임 중 O 키로 전환)
+SHOW_ODDS = os.environ.get("YATZY_ODDS", "0") == "1"
+AI_DELAY = 700 # AI 동작 사이 간격(ms), 사람이 따라볼 수 있도록
+# 텍스트 Surface 캐시 크기 (항목 수)
+TEXT_CACHE = TextCache(int(os.environ.get("YATZY_TEXT_CACHE", 512)))
+# 진행 중 게임 저장 파일(이벤트 로그)과 끝난 게임을 모아 두는 아카이브
+SAVE_PATH = os.environ.get("YATZY_SAVE", os.path.join(os.path.expanduser("~"), ".yatzy_save.bin"))
+ARCHIVE_PATH = os.environ.get("YATZY_ARCHIVE", os.path.join(os.path.expanduser("~"), ".yatzy_archive.bin"))
+# 프레임 프로파일러: 켜면 F3 오버레이, F4 trace 저장 (종료할 때도 저장). 꺼져 있으면 계측 코드를 설치하지 않는다
+PROFILE = os.environ.get("YATZY_PROFILE", "0") == "1"
+PROFILE_TRACE = os.environ.get("YATZY_PROFILE_TRACE", "yatzy_trace.json")
+# 메인 루프: "sync"(clock.tick 블로킹 루프, 조언/AI는 작업 스레드) 또는 "async"(yatzy_async.AsyncDriver)
+LOOP_MODE = os.environ.get("YATZY_LOOP", "sync")
+PROFILED = ("handle_events", "update", "draw", "draw_dirty", "draw_mode_selection", "draw_name_input",
+            "draw_how_to_play", "draw_playing", "draw_game_over", "update_ai")
+# 창 모드: "fixed"(1280×950), "resizable"(창 크기 조절), "fullscreen"(데스크톱 해상도). 배치는 yatzy_layout이 크기별로 캐시
+WINDOW_MODE = os.environ.get("YATZY_WINDOW", "fixed")
+# 굴림 애니메이션: 굴린 직후 고정하지 않은 주사위가 미리 뽑아 둔 눈을 몇 프레임 보여 준 뒤 결과를 표시한다
+DICE_ANIM = os.environ.get("YATZY_DICE_ANIM", "0") == "1"
+DICE_ANIM_FRAMES, DICE_ANIM_MS = 8, 40 # 애니메이션 프레임 수, 프레임당 시간(ms)
+SCREEN = None # init_display()가 만든 창 Surface
+
+def init_display():
+    # 창 만들기 (처음 한 번). 소리·조이스틱은 쓰지 않으므로 pygame.init() 대신 필요한 모듈만 초기화한다
+    global SCREEN, SCREEN_WIDTH, SCREEN_HEIGHT
+    if SCREEN is None:
+        pygame.display.init(); pygame.font.init()
+        pygame.time.wait(0) # 타이머 초기화 (get_ticks 기준점)
+        if WINDOW_MODE == "fullscreen": SCREEN = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else: SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE if WINDOW_MODE == "resizable" else 0)
+        SCREEN_WIDTH, SCREEN_HEIGHT = SCREEN.get_size()
+        pygame.display.set_caption("Yatzy Game")
+    return SCREEN
+
+# 게임 방법 화면 텍스트 ("**"로 시작하는 줄은 소제목)
+RULES = [
+    "**[Yatzy 게임 방법 및 규칙]**",
+    "",
+    "**1. 목표:** 13개의 카테고리에 점수를 모두 채워 가장 높은 총점을 얻는 것입니다.",
+    "",
+    "**2. 게임 진행:**",
+    " - 자기 턴이 되면 'ROLL' 버튼을 눌러 주사위 5개를 굴립니다.",
+    " - 한 턴에 **최대 3번**까지 굴릴 수 있습니다. (굴린 횟수 표시됨)",
+    " - 굴린 후, 원하는 주사위를 클릭하여 '고정'(Held)하거나 고정을 풀 수 있습니다.",
+    " - 3번의 기회를 모두 사용했거나, 중간에 멈추고 싶다면 점수판에서 점수를 기록할 카테고리 하나를 선택해야 합니다.",
+    " - 점수를 기록하면 턴이 상대방에게 넘어갑니다.",
+    "",
+    "**3. 점수 계산 (주요 카테고리):**",
+    " - **Aces ~ Sixes:** 선택한 숫자의 눈금을 모두 더한 값.",
+    " - **Upper Bonus:** Aces~Sixes 합계가 **63점 이상**일 경우 **35점** 추가.",
+    " - **Full House:** 동일한 주사위 3개와 2개. 고정 25점.",
+    " - **Small Straight:** 4개의 연속된 숫자 (예: 1-2-3-4). 고정 30점.",
+    " - **Large Straight:** 5개의 연속된 숫자 (예: 1-2-3-4-5). 고정 40점.",
+    " - **Yatzy:** 5개 주사위가 모두 동일한 숫자. 고정 50점.",
+    "",
+    "**4. 승리 조건:**",
+    "모든 플레이어가 13개 카테고리를 모두 채웠을 때, 총점이 더 높은 플레이어가 승리합니다.",
+    "",
+    "**플레이 팁:**",
+    "어떤 카테고리를 선택할지 고민된다면, 당신의 이름 아래에 나타나는 조언을 참고하세요!",
+]
 
 # --- 유틸 ---
 def draw_text(txt, font, color, surf, x, y, center=False):
     # 한글 렌더링을 위해 기본 폰트 설정을 KOREAN_FONT_PATH로 변경함
-    img = font.render(txt, True, color)
+    img = TEXT_CACHE.render(font, txt, color)
     rect = img.get_rect(center=(x,y) if center else (x,y))
     if not center: rect.topleft = (x,y)
     surf.blit(img, rect)
 
+def text_rect(txt, font, x, y, center=False):
+    # draw_text가 그릴 영역 (렌더링 없이 크기만 계산)
+    r = pygame.Rect((x, y), TEXT_CACHE.size(font, txt))
+    if center: r.center = (x, y)
+    return r
+
 def draw_dice_face(surf, val, rect):
     if val not in range(1,7): return
     cx, cy, off = rect.centerx, rect.centery, rect.w//4
@@ -57,32 +141,15 @@ def draw_dice_face(surf, val, rect):
     }
     for p in patterns[val]: pygame.draw.circle(surf, BLACK, p, 6)
 
-# --- 점수 계산 ---
-def calc_score(cat, dice):
-    cnt = Counter(dice)
-    sset, ssum = set(dice), sum(dice)
-    if cat in UPPER_MAP: return sum(d for d in dice if d==UPPER_MAP[cat])
-    if cat == "3 of a Kind" and any(c>=3 for c in cnt.values()): return ssum
-    if cat == "4 of a Kind" and any(c>=4 for c in cnt.values()): return ssum
-    if cat == "Full House" and sorted(cnt.values()) == [2,3]: return 25
-    if cat == "Small Straight" and any(st.issubset(sset) for st in SMALL_STRAIGHTS): return 30
-    if cat == "Large Straight" and sorted(dice) in ([1,2,3,4,5],[2,3,4,5,6]): return 40
-    if cat == "Yatzy" and len(cnt)==1 and dice[0]!=0: return 50
-    if cat == "Chance": return ssum
-    return 0
-
-# --- API (비동기 처리 함수) ---
-def fetch_advice_async(game_instance):
-    game_instance.advice_loading = True
-    try:
-        r = requests.get("https://api.adviceslip.com/advice", timeout=3)
-        r.raise_for_status()
-        result = r.json()['slip']['advice']
-    except Exception:
-        result = "Time to make a move! (Network or Data Error)"
-
-    game_instance.advice_future = result
-    game_instance.advice_loading = False
+def draw_die(surf, val, rect, held):
+    # 주사위 하나 (테두리, 눈, 고정 표시). 아틀라스를 만들 때 칸마다 한 번만 호출된다
+    pygame.draw.rect(surf, BLACK, rect, 2, border_radius=10)
+    draw_dice_face(surf, val, rect)
+    if held: pygame.draw.rect(surf, RED, rect, 4, border_radius=10)
+
+@lru_cache(maxsize=None)
+def dice_atlas(size):
+    return DiceAtlas(size, draw_die)
 
 # --- UI 위젯 ---
 class Button:
@@ -94,74 +161,155 @@ class Button:
     def check(self, pos): self.is_hovered = self.rect.collidepoint(pos)
     def clicked(self, e): return e.type==pygame.MOUSEBUTTONDOWN and e.button==1 and self.is_hovered
 
-class Player:
-    def __init__(self, name):
-        self.name=name; self.scores={c:None for c in SCORE_CATS}; self.reset_turn()
-        
-    def get_upper(self): return sum(v for k,v in self.scores.items() if k in UPPER_MAP and v is not None)
-    
-    # 35점 Yatzy 보너스 규칙: Upper Section 63점 이상 시 35점 부여
-    def bonus(self): return 35 if self.get_upper()>=63 else 0
-    
-    def total(self): return sum(v for v in self.scores.values() if v is not None)+self.bonus()
-    def reset_turn(self): self.dice=[0]*5; self.held=[False]*5; self.rolls=3
-    def roll(self):
-        if self.rolls<=0: return False
-        self.rolls-=1
-        for i in range(5):
-            if not self.held[i]: self.dice[i]=random.randint(1,6)
-        return True
-
 # --- 게임 ---
 class Game:
+    # 입력·시간·seed 출처. yatzy_replay가 녹화/재생할 때 인스턴스에서 바꿔 끼운다
+    events = staticmethod(pygame.event.get)
+    mouse_pos = staticmethod(pygame.mouse.get_pos)
+    ticks = staticmethod(pygame.time.get_ticks)
+    new_seed = staticmethod(lambda: None) # 새 게임 엔진/화면용 난수 seed (None이면 새로 뽑는다)
+
     def __init__(self):
+        init_display()
         self.clock=pygame.time.Clock(); self.mouse=(0,0)
+        self._hover_key, self._hover_hits = None, () # (마우스 위치, 배치) -> 적중 키
+        rects = layout(0, (SCREEN_WIDTH, SCREEN_HEIGHT)).buttons # 버튼 위치는 배치 모듈이 화면 크기별로 계산
         self.buttons={
-            k:Button(r,t,c,h) for k,(r,t,c,h) in {
-                "1p":((SCREEN_WIDTH//2-100, 300, 200, 60), "1인 플레이", GREEN, (0, 200, 0)),
-                "2p":((SCREEN_WIDTH//2-100, 400, 200, 60), "2인 플레이", BLUE, (50, 50, 255)),
-                "roll":((SCREEN_WIDTH//2-75,SCREEN_HEIGHT-100,150,50),"ROLL",GREEN,(0,200,0)),
-                "quit_ingame":((SCREEN_WIDTH-170,20,150,50),"QUIT",RED,(255,50,50)),
-                "restart":((SCREEN_WIDTH-170,80,150,50),"RESTART",RED,(255,50,50)),
-                "start":((SCREEN_WIDTH//2-100,600,200,60),"게임 시작",BLUE,(50,50,255)),
-                "how_to_play":((SCREEN_WIDTH//2-100, 680, 200, 60), "게임 방법", BLUE, (50, 50, 255)),
-                "back_to_menu":((50, 50, 150, 50), "뒤로가기", RED, (255, 50, 50)),
-                "play_again":((SCREEN_WIDTH//2-100,500,200,60),"다시 플레이",GREEN,(0,200,0)),
-                "quit":((SCREEN_WIDTH//2-100,580,200,60),"종료",RED,(255,50,50)),
+            k:Button(rects[k],t,c,h) for k,(t,c,h) in {
+                "1p":("1인 플레이", GREEN, (0, 200, 0)),
+                "2p":("2인 플레이", BLUE, (50, 50, 255)),
+                "resume":("이어하기", GOLD, (255, 235, 100)),
+                "roll":("ROLL",GREEN,(0,200,0)),
+                "quit_ingame":("QUIT",RED,(255,50,50)),
+                "restart":("RESTART",RED,(255,50,50)),
+                "start":("게임 시작",BLUE,(50,50,255)),
+                "ai":("AI: 없음", BLUE, (50, 50, 255)),
+                "how_to_play":("게임 방법", BLUE, (50, 50, 255)),
+                "back_to_menu":("뒤로가기", RED, (255, 50, 50)),
+                "play_again":("다시 플레이",GREEN,(0,200,0)),
+                "quit":("종료",RED,(255,50,50)),
             }.items()
         }
+        self.render_mode = RENDER_MODE
+        self.show_odds = SHOW_ODDS
+        self.compositor = DirtyCompositor()
+        self._static_layers = {}
+        self._screen_sig = None
+        self._rules_lines = None
+        self.advice_client = AdviceClient(ADVICE_URL)
+        self.advice_gen = 0 # 조언 요청 토큰: 리셋/굴림/턴 변경마다 증가, 지난 토큰의 결과는 버려진다
+        self.hints = None # 최적 해법 추천 (ADVICE_SOURCE == "hint"일 때만)
+        if ADVICE_SOURCE == "hint":
+            self.hints = HintService(); self.hints.warm()
+        self.log = None
+        self.bots = BotRunner() # AI 결정은 이 작업 스레드에서 계산
+        self.history = HistoryStore() # 끝난 게임 통계 (작업 스레드에서 모아서 기록)
+        self.profiler = None
+        if PROFILE:
+            from yatzy_profile import Profiler
+            self.profiler = Profiler(TEXT_CACHE)
+            self.profiler.instrument(self, PROFILED, "game")
+            self.profiler.instrument(self.advice_client, ("_fetch",), "advice")
+            if self.hints: self.profiler.instrument(self.hints, ("hint",), "hint")
+            self.profiler.watch("score_preview", lambda: sum(p.preview_computes for p in self.players))
         self.reset()
 
-    # 상태 관리
+    # 상태 관리 (턴 규칙은 YatzyEngine이 담당)
+    @property
+    def players(self): return self.engine.players
+    @property
+    def turn(self): return self.engine.turn
+
     def reset(self):
+        # 진행 중이던 게임을 버리고 처음 화면으로 (저장 파일도 지운다)
+        if self.log is not None: self._close_log(discard=True)
+        self.can_resume = os.path.exists(SAVE_PATH)
+        self.ai = {} # 자리 -> BotPlayer
+        self.ai_choice = None # 이름 입력 화면에서 고른 2번 플레이어 봇
+        self.ai_t = 0
+        self.dice_anim = None # (플레이어, 시작 시각, 프레임별 눈)
+        self.anim_rng = random.Random(self.new_seed())
+        self.bots.cancel()
+        self.buttons["ai"].text = "AI: 없음"
         self.num_players = 0
         self.names=[]
-        self.players=[]
-        self.turn=0
+        self.engine=YatzyEngine([])
         self.state="MODE_SELECTION" # 초기 상태: 모드 선택
         self.active_input = -1 
         self.caret_visible = False # 텍스트 입력 캐럿
         self.caret_timer = 0
         self.advice=None
         self.advice_on=False
-        self.turn_t=pygame.time.get_ticks()
+        self.turn_t=self.ticks()
         self.advice_t=0
-        
-        self.advice_loading = False 
-        self.advice_future = None    
+        self._new_advice_turn()
+
+    def _new_advice_turn(self):
+        # 진행 중인 조언 요청을 무효화 (늦게 도착한 결과는 새 턴에 표시되지 않는다)
+        self.advice_gen += 1 # AI 요청 토큰도 겸한다
+        self.advice_client.cancel()
+        self.advice = None
+        self.advice_loading = False
         
     def _setup_players(self):
         self.names = [f"플레이어 {i+1}" for i in range(self.num_players)]
-        self.players = [Player(n) for n in self.names]
+        self.engine = YatzyEngine(self.names, seed=self.new_seed())
         self.active_input = 0 # 이름 입력 시 첫 번째 플레이어 활성화
 
+    # 저장 / 이어하기 (이벤트 로그가 곧 저장 파일이라 굴림마다 자동 저장된다)
+    def _start_playing(self):
+        self.state = "PLAYING"
+        self.turn_t = self.ticks()
+        if ADVICE_SOURCE == "quote": self.advice_client.start() # 첫 조언 전에 미리 받아 두기
+
+    def _open_log(self, resumed=False):
+        try: self.log = (GameLog.append if resumed else GameLog.create)(SAVE_PATH, self.engine)
+        except OSError: self.log = None # 저장할 수 없어도 게임은 계속한다
+
+    def _close_log(self, discard=False, finished=False):
+        self.engine.recorder = None
+        self.log.close(); self.log = None
+        try:
+            if finished:
+                games = read_games(SAVE_PATH)
+                archive(SAVE_PATH, ARCHIVE_PATH)
+                if games: self.history.submit(games[-1])
+            elif discard: os.remove(SAVE_PATH)
+        except (OSError, LogError):
+            pass
+
+    def _resume(self):
+        try: self.engine = resume(SAVE_PATH)
+        except (OSError, LogError):
+            self.can_resume = False # 읽을 수 없는 저장 파일은 무시
+            return
+        self.num_players = len(self.players)
+        self.names = [p.name for p in self.players]
+        self.ai = {k: make_bot(b) for k, p in enumerate(self.players) if (b := bot_from_name(p.name))}
+        self._open_log(resumed=True)
+        if self.engine.over: self._game_over()
+        else: self._start_playing()
+
+    def _game_over(self):
+        self.state = "GAME_OVER"
+        if self.log is not None: self._close_log(finished=True)
+
     # 이벤트
     def handle_events(self):
-        for e in pygame.event.get():
+        for e in self.events():
+            if e.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): self.invalidate()
+            if e.type == pygame.VIDEORESIZE: self.resize(e.w, e.h)
             if e.type==pygame.QUIT or (self.state=="GAME_OVER" and self.buttons["quit"].clicked(e)): return False
+            if self.profiler and e.type==pygame.KEYDOWN and e.key in (pygame.K_F3, pygame.K_F4):
+                self.ev_profiler(e); continue
             getattr(self, f"ev_{self.state.lower()}")(e)
         return True
 
+    def ev_profiler(self, e):
+        if e.key == pygame.K_F4: self.profiler.dump(PROFILE_TRACE); return
+        self.profiler.overlay = not self.profiler.overlay
+        if not self.profiler.overlay: self.invalidate() # 오버레이가 덮었던 영역 다시 그리기
+
     def ev_mode_selection(self, e):
         if e.type == pygame.MOUSEBUTTONDOWN:
             if self.buttons["1p"].clicked(e):
@@ -172,25 +320,22 @@ class Game:
                 self.num_players = 2
                 self.state = "NAME_INPUT"
                 self._setup_players()
+            elif self.can_resume and self.buttons["resume"].clicked(e):
+                self._resume()
             elif self.buttons["how_to_play"].clicked(e):
                 self.state = "HOW_TO_PLAY"
 
 
     def ev_name_input(self, e):
-        # 입력 상자 위치 계산
-        input_rects = []
-        total_height = self.num_players * 150
-        start_y = (SCREEN_HEIGHT - total_height) // 2
-        for i in range(self.num_players):
-            y_pos = start_y + i * 150
-            input_rects.append(pygame.Rect(SCREEN_WIDTH//2 - 250, y_pos, 500, 50))
+        # 입력 상자 위치는 배치 캐시에서 (격자 조회로 클릭한 상자를 찾는다)
+        input_rects = self._layout().inputs
 
         if e.type == pygame.MOUSEBUTTONDOWN:
             clicked_on_input = False
-            for i, r in enumerate(input_rects):
-                if r.collidepoint(e.pos):
-                    self.active_input = i
-                    pygame.key.set_text_input_rect(r)
+            for key in self._layout().hits(e.pos):
+                if key[0] == "input":
+                    self.active_input = key[1]
+                    pygame.key.set_text_input_rect(input_rects[key[1]])
                     pygame.key.start_text_input()
                     clicked_on_input = True
                     break
@@ -198,11 +343,20 @@ class Game:
                 self.active_input = -1
                 pygame.key.stop_text_input()
             
+            if self.num_players == 2 and self.buttons["ai"].clicked(e):
+                # 2번 플레이어: 사람 -> greedy -> upper -> solver -> 사람
+                opts = (None,) + BOTS
+                self.ai_choice = opts[(opts.index(self.ai_choice) + 1) % len(opts)]
+                self.buttons["ai"].text = f"AI: {self.ai_choice or '없음'}"
+                self.names[1] = AI_NAME.format(self.ai_choice) if self.ai_choice else ""
             if self.buttons["start"].clicked(e):
                 for i in range(self.num_players):
                     self.players[i].name = self.names[i].strip() or f"플레이어 {i+1}"
-                self.state = "PLAYING"
-                self.turn_t = pygame.time.get_ticks()
+                if self.ai_choice:
+                    self.players[1].name = AI_NAME.format(self.ai_choice)
+                    self.ai = {1: make_bot(self.ai_choice)}
+                self._start_playing()
+                self._open_log()
                 if self.active_input != -1: pygame.key.stop_text_input()
             elif self.buttons["how_to_play"].clicked(e):
                 self.state = "HOW_TO_PLAY"
@@ -229,85 +383,110 @@ class Game:
 
     def ev_playing(self, e):
         cur=self.players[self.turn]
-        if self.buttons["roll"].clicked(e) and cur.roll():
-            self.advice_on=True; self.advice = None; now=pygame.time.get_ticks()
-            self.turn_t=now; self.advice_t=now-ADVICE_INTERVAL
-        elif self.buttons["quit_ingame"].clicked(e): pygame.event.post(pygame.event.Event(pygame.QUIT))
+        if self.buttons["quit_ingame"].clicked(e): pygame.event.post(pygame.event.Event(pygame.QUIT))
         elif self.buttons["restart"].clicked(e): self.reset()
+        elif self.turn in self.ai: return # AI 차례에는 주사위/점수판 입력을 받지 않는다
+        elif self.buttons["roll"].clicked(e): self._roll()
+        elif e.type==pygame.KEYDOWN and e.key==pygame.K_o: self.show_odds = not self.show_odds
         elif e.type==pygame.MOUSEBUTTONDOWN and e.button==1:
             self.click_dice(cur); self.click_score(cur)
 
     def ev_game_over(self, e):
         if self.buttons["play_again"].clicked(e): self.reset()
 
-    # 클릭 로직
+    # 클릭 로직 (그리기와 같은 배치 캐시의 영역, 마우스 위치의 적중 키로 판정)
     def click_dice(self, cur):
-        if cur.rolls==3: return
-
-        is_single_player = self.num_players == 1
-        panel_width = SCREEN_WIDTH if is_single_player else SCREEN_WIDTH // 2
-        x0 = 0 if is_single_player else (SCREEN_WIDTH // 2) * self.turn
-
-        # 주사위 위치 계산 로직 (기존 2P와 유사한 간격 유지)
-        DICE_SIZE = 80
-        DICE_START_OFFSET = 80 # 원래 x0 + 80
-        DICE_SPACING = 100
-        
-        # 1인 모드 시 주사위 행을 중앙에 배치
-        if is_single_player:
-            DICE_ROW_WIDTH = DICE_SPACING * 4 + DICE_SIZE
-            start_dice_x = x0 + (panel_width - DICE_ROW_WIDTH) // 2
-        else:
-            start_dice_x = x0 + DICE_START_OFFSET
-
-        for i in range(5):
-            # 주사위 Y 위치: 10픽셀 더 위로 조정 (SCREEN_HEIGHT - 190)
-            r = pygame.Rect(start_dice_x + i * DICE_SPACING, SCREEN_HEIGHT - 190, DICE_SIZE, DICE_SIZE)
-            if r.collidepoint(self.mouse):
-                cur.held[i] ^= True
+        if cur.rolls==3 or self._dice_rolling(): return # 굴림 애니메이션 중에는 보이지 않는 눈을 고정하지 않는다
+        k = self._cur_panel()
+        for key in self._hover():
+            if key[0] == "dice" and key[1] == k: self.engine.toggle_hold(key[2])
 
     def click_score(self, cur):
         if cur.rolls==3: return
-        
-        is_single_player = self.num_players == 1
-        panel_width = SCREEN_WIDTH if is_single_player else SCREEN_WIDTH // 2
-        x0 = 0 if is_single_player else (SCREEN_WIDTH // 2) * self.turn
-        
-        # 원본 파일 (yatzy_advice_3_수정 전.py) 기준 y0=220, h=35
-        y0, h = 220, 35
-        y_upper_end = y0 + 6 * h
-        for i,cat in enumerate(SCORE_CATS):
-            # 원본 파일 기준 y 계산 로직
-            y = y0+i*h if i<6 else y_upper_end+70+(i-6)*h 
-            
-            # 카테고리 호버/클릭 영역 조정 (y-5 -> y-4로 조정하여 1픽셀 더 아래로 이동)
-            r=pygame.Rect(x0+40, y+2, panel_width-80, h)
-            
-            if cur.scores[cat] is None and r.collidepoint(self.mouse):
-                is_yat = len(set(cur.dice))==1 and cur.dice[0]!=0
-                
-                if cat == "Yatzy" and is_yat:
-                    cur.scores[cat] = 50
-                else:
-                    cur.scores[cat] = calc_score(cat, cur.dice)
-                    
-                cur.dice=[0]*5
-                
-                self.turn = (self.turn + 1) % self.num_players
-                self.players[self.turn].reset_turn()
-                self.turn_t=pygame.time.get_ticks()
-                self.advice_on=False
-                self.advice=None
-                
-                if all(p.scores[c] is not None for p in self.players for c in SCORE_CATS): 
-                    self.state="GAME_OVER"
+        k = self._cur_panel()
+        for key in self._hover():
+            if key[0] == "row" and key[1] == k and cur.scores[SCORE_CATS[key[2]]] is None:
+                self._score(SCORE_CATS[key[2]])
                 break
 
+    # 배치
+    def _layout(self):
+        return layout(self.num_players, (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def _cur_panel(self):
+        # 현재 플레이어의 패널 번호 (1인 모드는 패널 하나)
+        return 0 if self.num_players == 1 else self.turn
+
+    def _hover(self):
+        # 마우스 위치의 적중 키. 위치나 배치가 바뀔 때만 격자를 다시 조회한다
+        L = self._layout()
+        if self._hover_key != (self.mouse, L):
+            self._hover_key, self._hover_hits = (self.mouse, L), L.hits(self.mouse)
+        return self._hover_hits
+
+    def resize(self, w, h):
+        # 창 크기 변경: 크기별 배치/정적 배경 캐시를 버리고 버튼을 새 배치로 옮긴 뒤 전체를 다시 그린다
+        global SCREEN, SCREEN_WIDTH, SCREEN_HEIGHT
+        SCREEN = pygame.display.get_surface()
+        SCREEN_WIDTH, SCREEN_HEIGHT = SCREEN.get_size() if SCREEN is not None else (w, h)
+        layout.cache_clear(); self._static_layers.clear()
+        rects = self._layout().buttons
+        for k, b in self.buttons.items(): b.rect = rects[k].copy()
+        self.invalidate()
+
+    # 굴리기 / 점수 기록 (사람 입력과 AI가 공유)
+    def _roll(self):
+        if not self.engine.roll(): return False
+        self.advice_on=True; self._new_advice_turn(); now=self.ticks()
+        if DICE_ANIM: self._start_dice_anim(now)
+        self.turn_t=now; self.advice_t=now-ADVICE_INTERVAL
+        return True
+
+    def _start_dice_anim(self, now):
+        # 굴림 애니메이션 프레임(주사위별 눈)을 미리 뽑아 둔다. 게임 난수열과 무관한 화면용 난수를 쓴다
+        p = self.players[self.turn]
+        frames = [tuple(d if h else self.anim_rng.randint(1, 6) for d, h in zip(p.dice, p.held)) for _ in range(DICE_ANIM_FRAMES)]
+        self.dice_anim = (p, now, frames)
+
+    def _dice_rolling(self):
+        # 굴림 애니메이션이 진행 중인지 (끝났으면 지운다)
+        if self.dice_anim is not None and (self.ticks() - self.dice_anim[1]) // DICE_ANIM_MS >= DICE_ANIM_FRAMES:
+            self.dice_anim = None
+        return self.dice_anim is not None
+
+    def _score(self, cat):
+        # 점수 기록, 턴 넘김, 종료 판정은 엔진에서 처리
+        if self.engine.score(cat) is None: return False
+        self.dice_anim = None # 기록한 주사위는 지워지므로 남은 애니메이션도 멈춘다
+        self.turn_t=self.ticks()
+        self.advice_on=False
+        self._new_advice_turn()
+        if self.engine.over: self._game_over()
+        return True
+
+    def update_ai(self, now):
+        # AI 차례: 일정 간격마다 작업 스레드에 다음 동작을 요청하고, 도착한 결과를 적용한다
+        bot = self.ai.get(self.turn)
+        if bot is None: return
+        if not self.bots.pending and now - self.ai_t >= AI_DELAY:
+            self.bots.request(self.advice_gen, bot, snapshot(self.players[self.turn]))
+        action = self.bots.poll(self.advice_gen)
+        if action is None: return
+        self.ai_t = now
+        kind, arg = action
+        if kind == ROLL:
+            for i, h in enumerate(arg):
+                if self.players[self.turn].held[i] != h: self.engine.toggle_hold(i)
+            self._roll()
+        else:
+            self._score(arg)
+
     # 업데이트 & 렌더
     def update(self):
-        self.mouse=pygame.mouse.get_pos()
-        for b in self.buttons.values(): b.check(self.mouse)
-        now=pygame.time.get_ticks()
+        self.mouse=self.mouse_pos()
+        hover = self._hover()
+        for k, b in self.buttons.items(): b.is_hovered = ("button", k) in hover
+        now=self.ticks()
 
         # Caret blinking 로직
         if self.active_input != -1:
@@ -318,20 +497,31 @@ class Game:
         else:
              pygame.key.stop_text_input()
         
-        # 비동기 API 호출 시작 로직
-        if self.state=="PLAYING" and self.advice_on and not self.advice_loading and \
-           now-self.turn_t>=ADVICE_DELAY and now-self.advice_t>=ADVICE_INTERVAL:
-            
-            threading.Thread(target=fetch_advice_async, args=(self,)).start()
-            self.advice_t=now
-            
-        # 비동기 API 호출 완료 결과 처리
-        if self.advice_future is not None:
-            self.advice = self.advice_future
-            self.advice_future = None
+        if self.state=="PLAYING": self.update_ai(now)
+
+        # 최적 수 힌트: 캐시에서 즉시 조회 (값 테이블 로딩 전에는 greedy 추천)
+        if self.state=="PLAYING" and ADVICE_SOURCE=="hint":
+            self.advice = hint_text(self.hints.hint(self.players[self.turn]))
+
+        # 조언 요청: 표시 시점이 되면 현재 토큰으로 한 번 요청 (미리 받아 둔 조언이 있으면 즉시 도착)
+        elif self.state=="PLAYING" and self.advice_on:
+            if not self.advice_loading and now-self.turn_t>=ADVICE_DELAY and now-self.advice_t>=ADVICE_INTERVAL:
+                self.advice_client.request(self.advice_gen)
+                self.advice_loading = True
+                self.advice_t = now
+            # 결과 확인 (블로킹 없음, 현재 토큰의 결과만 받는다)
+            if self.advice_loading:
+                slip = self.advice_client.poll(self.advice_gen)
+                if slip is not None:
+                    self.advice = slip
+                    self.advice_loading = False
 
     def draw(self):
-        # 상태에 따라 다른 draw 함수 호출
+        if self.render_mode == "dirty": self.draw_dirty()
+        else: self._draw_full()
+
+    def _draw_full(self):
+        # 상태에 따라 다른 draw 함수 호출 (프로파일러가 감싸지 않으므로 draw_dirty 안에서 불러도 draw 구간이 두 번 잡히지 않는다)
         if self.state == "MODE_SELECTION":
             self.draw_mode_selection()
         elif self.state == "NAME_INPUT":
@@ -345,114 +535,133 @@ class Game:
             
         pygame.display.flip()
 
+    def draw_dirty(self):
+        # PLAYING: 바뀐 항목 영역만 다시 그리고 그 영역만 화면에 반영
+        if self.state == "PLAYING":
+            if self._screen_sig != ("PLAYING", self.num_players):
+                self._screen_sig = ("PLAYING", self.num_players)
+                self.compositor.invalidate()
+            rects = self.compositor.frame(SCREEN, self._static_layer(), self._playing_items())
+            if rects: pygame.display.update(rects)
+            return
+        # 그 외 화면: 화면 내용 서명이 바뀐 경우에만 전체를 다시 그린다
+        sig = (self.state, self.num_players, self.can_resume, self.ai_choice, tuple(b.is_hovered for b in self.buttons.values()),
+               tuple(self.names), self.active_input, self.caret_visible,
+               tuple(p.total() for p in self.players) if self.state == "GAME_OVER" else None)
+        if sig == self._screen_sig: return
+        self._screen_sig = sig
+        self._draw_full()
+
+    def invalidate(self):
+        # 창이 다시 노출되는 등 화면 전체를 다시 그려야 할 때
+        self._screen_sig = None
+        self.compositor.invalidate()
+
     def draw_mode_selection(self):
         SCREEN.fill(WHITE)
         draw_text("Yatzy Game", F_BIG, BLACK, SCREEN, SCREEN_WIDTH // 2, 150, True)
         draw_text("플레이 모드 선택", F_MED, BLACK, SCREEN, SCREEN_WIDTH // 2, 220, True)
         self.buttons["1p"].draw(SCREEN)
         self.buttons["2p"].draw(SCREEN)
+        if self.can_resume: self.buttons["resume"].draw(SCREEN)
         self.buttons["how_to_play"].draw(SCREEN)
 
     def draw_name_input(self):
         SCREEN.fill(WHITE)
         draw_text(f"플레이어 이름 입력 ({self.num_players}인 모드)", F_BIG, BLACK, SCREEN, SCREEN_WIDTH//2, 100, True)
 
-        total_height = self.num_players * 150
-        start_y = (SCREEN_HEIGHT - total_height) // 2
-
-        for i, name in enumerate(self.names):
-            y_pos = start_y + i * 150
-            draw_text(f"플레이어 {i+1}:", F_MED, BLACK, SCREEN, SCREEN_WIDTH//2, y_pos - 50, True)
-            r = pygame.Rect(SCREEN_WIDTH//2 - 250, y_pos, 500, 50)
+        for i, (name, r) in enumerate(zip(self.names, self._layout().inputs)):
+            draw_text(f"플레이어 {i+1}:", F_MED, BLACK, SCREEN, SCREEN_WIDTH//2, r.y - 50, True)
             
             # Draw input box
             pygame.draw.rect(SCREEN, LIGHT_GRAY, r)
             pygame.draw.rect(SCREEN, BLACK if self.active_input == i else GRAY, r, 2)
 
             # Draw text
-            text_surf = F_SML.render(name, True, BLACK)
+            text_surf = TEXT_CACHE.render(F_SML, name, BLACK)
             SCREEN.blit(text_surf, (r.x + 10, r.y + 10))
 
             # Draw caret
             if self.active_input == i and self.caret_visible:
-                text_width = F_SML.size(name)[0]
+                text_width = TEXT_CACHE.size(F_SML, name)[0]
                 caret_pos_x = r.x + 10 + text_width
                 pygame.draw.line(SCREEN, BLACK, (caret_pos_x, r.y + 12), (caret_pos_x, r.y + r.height - 12), 2)
 
         self.buttons["start"].draw(SCREEN)
+        if self.num_players == 2: self.buttons["ai"].draw(SCREEN)
         self.buttons["how_to_play"].draw(SCREEN)
 
     def draw_how_to_play(self):
         SCREEN.fill(WHITE)
-        rules = [
-            "**[Yatzy 게임 방법 및 규칙]**",
-            "",
-            "**1. 목표:** 13개의 카테고리에 점수를 모두 채워 가장 높은 총점을 얻는 것입니다.",
-            "",
-            "**2. 게임 진행:**",
-            " - 자기 턴이 되면 'ROLL' 버튼을 눌러 주사위 5개를 굴립니다.",
-            " - 한 턴에 **최대 3번**까지 굴릴 수 있습니다. (굴린 횟수 표시됨)",
-            " - 굴린 후, 원하는 주사위를 클릭하여 '고정'(Held)하거나 고정을 풀 수 있습니다.",
-            " - 3번의 기회를 모두 사용했거나, 중간에 멈추고 싶다면 점수판에서 점수를 기록할 카테고리 하나를 선택해야 합니다.",
-            " - 점수를 기록하면 턴이 상대방에게 넘어갑니다.",
-            "",
-            "**3. 점수 계산 (주요 카테고리):**",
-            " - **Aces ~ Sixes:** 선택한 숫자의 눈금을 모두 더한 값.",
-            " - **Upper Bonus:** Aces~Sixes 합계가 **63점 이상**일 경우 **35점** 추가.",
-            " - **Full House:** 동일한 주사위 3개와 2개. 고정 25점.",
-            " - **Small Straight:** 4개의 연속된 숫자 (예: 1-2-3-4). 고정 30점.",
-            " - **Large Straight:** 5개의 연속된 숫자 (예: 1-2-3-4-5). 고정 40점.",
-            " - **Yatzy:** 5개 주사위가 모두 동일한 숫자. 고정 50점.",
-            "",
-            "**4. 승리 조건:**",
-            "모든 플레이어가 13개 카테고리를 모두 채웠을 때, 총점이 더 높은 플레이어가 승리합니다.",
-            "",
-            "**플레이 팁:**",
-            "어떤 카테고리를 선택할지 고민된다면, 당신의 이름 아래에 나타나는 조언을 참고하세요!",
-        ]
 
         draw_text("Yatzy 게임 방법", F_BIG, BLACK, SCREEN, SCREEN_WIDTH // 2, 40, True) # 제목 Y 위치 상향
 
+        for line, font, x_pos, y in self._rules_layout():
+            draw_text(line, font, BLACK, SCREEN, x_pos, y, center=False)
+
+        self.buttons["back_to_menu"].draw(SCREEN)
+
+    def _rules_layout(self):
+        # 규칙 화면의 줄바꿈/배치 결과 (한 번만 계산): [(줄, 폰트, x, y)]
+        if self._rules_lines is not None: return self._rules_lines
+        self._rules_lines = lines = []
+
         # 텍스트가 잘리지 않도록 F_TINY(20)보다 작은 F_MINI(18) 사용
-        line_height = F_MINI.get_height() + 5 
         start_y = 100 # 시작 Y 위치 상향
         x_start = 80
         
-        for i, line in enumerate(rules):
+        for i, line in enumerate(RULES):
             font = F_TINY if line.startswith("**") else F_MINI # 소제목 F_TINY(20), 본문 F_MINI(18)
             
             display_line = line.replace('**', '') 
 
-            wrapped_lines = textwrap.wrap(display_line, width=130) # 줄바꿈 폭을 최대로 늘림
+            wrapped_lines = wrap_lines(display_line, 130) # 줄바꿈 폭을 최대로 늘림
             
             for j, wrapped_line in enumerate(wrapped_lines):
                 # 목록의 경우 들여쓰기 적용
                 x_pos = x_start + (20 if wrapped_line.strip().startswith("-") else 0)
-                draw_text(wrapped_line, font, BLACK, SCREEN, x_pos, start_y, center=False)
+                lines.append((wrapped_line, font, x_pos, start_y))
                 start_y += font.get_height() + 2 # 줄 간격
             
             if not wrapped_lines:
                 start_y += F_TINY.get_height() # 빈 줄 처리 (빈 줄도 간격 확보)
             else:
                 start_y += 5 # 섹션 간격 조정 (약간의 추가 공간)
-
-
-        self.buttons["back_to_menu"].draw(SCREEN)
+        return lines
 
     def draw_playing(self):
-        SCREEN.fill(WHITE)
+        # 전체 다시 그리기: 정적 배경 위에 모든 항목을 순서대로 그린다
+        SCREEN.blit(self._static_layer(), (0, 0))
+        for _, _, _, draw in self._playing_items(): draw()
+
+    def _panels(self):
+        # (플레이어, 패널 배치) 목록. 1P 모드는 현재 플레이어 하나 (2P 패널 폭을 중앙에 배치)
+        panels = self._layout().panels
+        if self.num_players == 1: return [(self.players[self.turn], panels[0])]
+        return list(zip(self.players, panels))
+
+    def _static_layer(self):
+        # 점수판 배경, 구분선, 고정 라벨을 미리 그려 둔 화면 크기 Surface (모드별 캐시)
+        key = self.num_players
+        bg = self._static_layers.get(key)
+        if bg is None:
+            bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            bg.fill(WHITE)
+            if self.num_players != 1:
+                pygame.draw.line(bg, GRAY, (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT), 4)
+            for _, P in self._panels():
+                x0, panel_width, y_upper_end = P.x0, P.width, P.upper_end
+                draw_text("Total Score", F_SML, BLACK, bg, x0 + panel_width // 2, 100, True) # 총점 F_MINI로 축소
+                pygame.draw.line(bg, GRAY, (x0+40, y_upper_end+70-10), (x0+panel_width-40, y_upper_end+70-10), 2)
+            self._static_layers[key] = bg
+        return bg
+
+    def _playing_items(self):
+        # PLAYING 화면의 항목 목록: (키, 영역, 서명, 그리기 함수)
         cur = self.players[self.turn]
-        is_single_player = self.num_players == 1
-
-        if not is_single_player:
-            # 2P 모드 (원본 레이아웃 유지)
-            pygame.draw.line(SCREEN, GRAY, (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT), 4)
-            self.draw_player(self.players[0], 0, is_single_player=False)
-            self.draw_player(self.players[1], SCREEN_WIDTH // 2, is_single_player=False)
-        else:
-            # 1P 모드 (2P 패널 폭을 중앙에 배치)
-            x_offset = SCREEN_WIDTH // 4 
-            self.draw_player(cur, x_offset, is_single_player=True)
+        items = []
+        for k, (p, P) in enumerate(self._panels()):
+            items += self._player_items(k, p, P)
 
         # Rolls Left 텍스트 위치: 원본 (SCREEN_HEIGHT - 30) 근처로 복구하되, 아래로 살짝 내림
         roll_text_y = SCREEN_HEIGHT - 30 
@@ -465,110 +674,121 @@ class Game:
 
         # 2P 모드에서는 현재 플레이어 패널 중앙에 표시 (원본과 유사하게)
         x = SCREEN_WIDTH//4 + (SCREEN_WIDTH//2)*self.turn
-        draw_text(roll_text, roll_font, BLACK, SCREEN, x, roll_text_y, True)
-            
-        # ROLL 버튼을 더 아래로 내림 (SCREEN_HEIGHT - 70)
-        self.buttons['roll'].rect.centerx = SCREEN_WIDTH // 2
-        self.buttons['roll'].rect.centery = SCREEN_HEIGHT - 70
-
+        r = text_rect(roll_text, roll_font, x, roll_text_y, True)
+        items.append(("rolls", r, (roll_text, x), lambda: draw_text(roll_text, roll_font, BLACK, SCREEN, x, roll_text_y, True)))
 
+        # ROLL 버튼 위치(중심 SCREEN_HEIGHT - 70)는 배치 모듈에서 정한다
         for k in ("roll", "quit_ingame", "restart"):
-            self.buttons[k].draw(SCREEN)
+            b = self.buttons[k]
+            items.append((k, b.rect.copy(), (b.text, b.is_hovered), lambda b=b: b.draw(SCREEN)))
+        return items
 
-    def draw_player(self, p, x0, is_single_player=False):
-        # 1인 모드 시 패널 폭을 2P 폭(SCREEN_WIDTH // 2)으로 고정
-        panel_width = SCREEN_WIDTH // 2
+    def _player_items(self, k, p, P):
+        # P: 패널 배치 (yatzy_layout.Panel, 1인 모드도 패널 폭은 SCREEN_WIDTH // 2)
+        x0, panel_width = P.x0, P.width
         is_cur = (p is self.players[self.turn])
+        items = []
+        hover = self._hover()
         
         # --- 레이아웃 변수 (원본 파일과 유사하도록 조정) ---
-        name_y = 50 
-        total_score_label_y = 100
-        total_score_y = 150
-        advice_y = 185 # 원본 advice 위치
-        board_y = 220 # 원본 score board 시작 Y (y0)
-        
-        name_x = x0 + panel_width // 2
+        name_y, total_score_y, advice_y = NAME_Y, TOTAL_Y, ADVICE_Y
+        name_x = P.name_x
         
         # Draw Name (현재 턴 표시)
-        if is_cur:
-            w,h = F_MED.size(p.name)
-            pygame.draw.rect(SCREEN, GOLD, (name_x-w//2-10, name_y-h//2-5, w+20, h+10), border_radius=5)
-        draw_text(p.name, F_MED, BLACK, SCREEN, name_x, name_y, True)
+        w,h = TEXT_CACHE.size(F_MED, p.name)
+        name_box = pygame.Rect(name_x-w//2-10, name_y-h//2-5, w+20, h+10)
+        def draw_name():
+            if is_cur:
+                pygame.draw.rect(SCREEN, GOLD, name_box, border_radius=5)
+            draw_text(p.name, F_MED, BLACK, SCREEN, name_x, name_y, True)
+        items.append(((k, "name"), name_box.union(text_rect(p.name, F_MED, name_x, name_y, True)), (p.name, is_cur), draw_name))
         
-        # Draw Total Score
-        draw_text("Total Score", F_SML, BLACK, SCREEN, name_x, total_score_label_y, True) # 총점 F_MINI로 축소
-        draw_text(str(p.total()), F_BIG, BLUE, SCREEN, name_x, total_score_y, True)
+        # Draw Total Score ("Total Score" 라벨은 정적 배경에 포함)
+        total = str(p.total())
+        items.append(((k, "total"), text_rect(total, F_BIG, name_x, total_score_y, True), total,
+                      lambda: draw_text(total, F_BIG, BLUE, SCREEN, name_x, total_score_y, True)))
         
         # Draw Advice
-        if is_cur and self.advice_on:
+        advice_on, loading, advice = is_cur and self.advice_on, self.advice_loading, self.advice
+        def draw_advice():
+            if not advice_on: return
             advice_wrap_width = 40
-            if self.advice_loading:
+            if loading:
                 draw_text("조언 로딩 중...", F_V_TINY, GRAY, SCREEN, x0 + 50, advice_y) # F_V_TINY
-            elif self.advice:
-                lines = textwrap.wrap(self.advice, width=advice_wrap_width)
+            elif advice:
+                lines = wrap_lines(advice, advice_wrap_width)
                 for i,line in enumerate(lines):
                     if i < 2: # 조언은 최대 2줄만 표시
                         draw_text(line, F_V_TINY, RED, SCREEN, x0 + 50, advice_y + i*(F_V_TINY.get_height()+2)) # F_V_TINY
                     else:
                         break
+        advice_rect = pygame.Rect(x0 + 50, advice_y, panel_width - 50, 2*(F_V_TINY.get_height()+2))
+        items.append(((k, "advice"), advice_rect, (advice_on, advice_on and loading, advice_on and advice), draw_advice))
                         
         # Draw Scoreboard
-        y0,h = board_y, 35 # 원본 높이 35 사용
-        y_upper_end=y0+6*h
-        
-        score_name_x = x0 + 50
-        score_value_x = x0 + panel_width - 50
+        y_upper_end = P.upper_end
+        score_name_x, score_value_x = P.score_name_x, P.score_value_x
+        preview = p.preview() # 카테고리별 점수 (주사위가 바뀔 때만 다시 계산, 점수 기록과 같은 벡터)
+        # 확률 표시: 현재 고정 그대로 남은 굴림을 할 때 (성공 확률, 기대 점수)
+        odds = None
+        if self.show_odds and is_cur and p.rolls in (1, 2):
+            from yatzy_odds import category_odds # 확률표는 처음 켤 때 만든다
+            odds = category_odds(p.dice, p.held, p.rolls)
+        odds_x, odds_dy = score_value_x - 70, (F_SML.get_height() - F_MINI.get_height()) // 2
         
         for i,cat in enumerate(SCORE_CATS):
-            # 원본 y 계산 로직 사용
-            y = y0+i*h if i<6 else y_upper_end+70+(i-6)*h 
-            
-            # 카테고리 호버 영역 (y-10 -> y-4로 조정하여 6픽셀 아래로 이동)
-            r=pygame.Rect(x0+40, y+2, panel_width-80, h)
-            
-            if i==6: pygame.draw.line(SCREEN, GRAY, (x0+40, y_upper_end+70-10), (x0+panel_width-40, y_upper_end+70-10), 2)
+            # 행 Y와 호버/클릭 영역은 배치 캐시에서
+            y, r = P.row_y[i], P.rows[i]
             
             selectable = is_cur and p.scores[cat] is None and p.rolls<3
-            hovered = r.collidepoint(self.mouse)
-            
-            if selectable and hovered: pygame.draw.rect(SCREEN, LIGHT_GRAY, r, border_radius=5)
-            
-            draw_text(cat, F_SML, BLUE if selectable and hovered else BLACK, SCREEN, score_name_x, y) # F_SML
+            hovered = ("row", k, i) in hover
+            score = p.scores[cat]
+            pts = preview[i] if selectable and score is None else None
+            odds_text = f"{odds[0][i]:.0%}  ~{odds[1][i]:.1f}" if odds is not None and selectable else None
             
-            if p.scores[cat] is not None:
-                # 점수 우측 정렬 (F_SML)
-                draw_text(str(p.scores[cat]), F_SML, BLACK, SCREEN, score_value_x - F_SML.size(str(p.scores[cat]))[0], y)
-            elif selectable:
-                is_yat = len(set(p.dice))==1 and p.dice[0]!=0
-                pts = 50 if cat == "Yatzy" and is_yat else calc_score(cat, p.dice) 
-                # 점수 우측 정렬 (F_SML)
-                draw_text(str(pts), F_SML, BLUE if hovered else GREEN, SCREEN, score_value_x - F_SML.size(str(pts))[0], y)
+            def draw_row(cat=cat, y=y, r=r, selectable=selectable, hovered=hovered, score=score, pts=pts, odds_text=odds_text):
+                if selectable and hovered: pygame.draw.rect(SCREEN, LIGHT_GRAY, r, border_radius=5)
+                
+                draw_text(cat, F_SML, BLUE if selectable and hovered else BLACK, SCREEN, score_name_x, y) # F_SML
+                
+                if score is not None:
+                    # 점수 우측 정렬 (F_SML)
+                    draw_text(str(score), F_SML, BLACK, SCREEN, score_value_x - TEXT_CACHE.size(F_SML, str(score))[0], y)
+                elif selectable:
+                    # 점수 우측 정렬 (F_SML)
+                    draw_text(str(pts), F_SML, BLUE if hovered else GREEN, SCREEN, score_value_x - TEXT_CACHE.size(F_SML, str(pts))[0], y)
+                if odds_text:
+                    draw_text(odds_text, F_MINI, BLACK, SCREEN, odds_x - TEXT_CACHE.size(F_MINI, odds_text)[0], y + odds_dy)
+            row_rect = r.union(text_rect(cat, F_SML, score_name_x, y)).union((x0+40, y, panel_width-80, F_SML.get_height()))
+            items.append(((k, "row", i), row_rect, (score, selectable, selectable and hovered, pts, odds_text), draw_row))
         
         # Draw Upper Total & Bonus
-        draw_text(f"Upper Total: {p.get_upper()} / 63", F_TINY, BLACK, SCREEN, x0+50, y_upper_end+10)
-        
+        upper, bonus = p.get_upper(), p.bonus()
+        upper_text = f"Upper Total: {upper} / 63"
         # 보너스 우측 정렬 (F_TINY)
-        bonus_text = f"Bonus: {p.bonus()}"
-        draw_text(bonus_text, F_TINY, GOLD if p.bonus()>0 else BLACK, SCREEN, score_value_x - F_TINY.size(bonus_text)[0], y_upper_end + 35)
+        bonus_text = f"Bonus: {bonus}"
+        def draw_upper():
+            draw_text(upper_text, F_TINY, BLACK, SCREEN, x0+50, y_upper_end+10)
+            draw_text(bonus_text, F_TINY, GOLD if bonus>0 else BLACK, SCREEN, score_value_x - TEXT_CACHE.size(F_TINY, bonus_text)[0], y_upper_end + 35)
+        upper_rect = text_rect(upper_text, F_TINY, x0+50, y_upper_end+10).union(
+            text_rect(bonus_text, F_TINY, score_value_x - TEXT_CACHE.size(F_TINY, bonus_text)[0], y_upper_end + 35))
+        items.append(((k, "upper"), upper_rect, (upper, bonus), draw_upper))
         
-        # Draw Dice
-        # 주사위 Y 위치 조정 (170)
-        dice_y = SCREEN_HEIGHT-190 # 10픽셀 더 위로
-        if any(d>0 for d in p.dice):
-            DICE_SIZE = 80
-            DICE_SPACING = 100
-
-            if is_single_player:
-                DICE_ROW_WIDTH = DICE_SPACING * 4 + DICE_SIZE
-                start_dice_x = x0 + (panel_width - DICE_ROW_WIDTH) // 2
-            else:
-                start_dice_x = x0 + 80 # 2P 모드는 원래처럼 고정 오프셋 (x0 + 80)
-
-            for i,val in enumerate(p.dice):
-                r=pygame.Rect(start_dice_x + i*DICE_SPACING, dice_y, DICE_SIZE, DICE_SIZE) 
-                pygame.draw.rect(SCREEN, BLACK, r, 2, border_radius=10)
-                draw_dice_face(SCREEN, val, r)
-                if p.held[i]: pygame.draw.rect(SCREEN, RED, r, 4, border_radius=10)
+        # Draw Dice (1P 모드는 패널 가운데, 2P 모드는 x0 + 80, Y는 SCREEN_HEIGHT-190)
+        start_dice_x, dice_y = P.dice_x, P.dice_y
+        dice, held = tuple(p.dice), tuple(p.held)
+        if self.dice_anim is not None and self.dice_anim[0] is p:
+            # 굴림 애니메이션 중이면 미리 뽑아 둔 프레임의 눈을 보여 준다
+            f = (self.ticks() - self.dice_anim[1]) // DICE_ANIM_MS
+            if f < DICE_ANIM_FRAMES: dice = self.dice_anim[2][f]
+            else: self.dice_anim = None
+
+        def draw_dice():
+            # 아틀라스에서 주사위 줄 전체를 blits 한 번으로
+            if any(d>0 for d in dice):
+                SCREEN.blits(dice_atlas(DICE_SIZE).row(start_dice_x, dice_y, DICE_SPACING, dice, held), doreturn=False)
+        items.append(((k, "dice"), P.dice_row.copy(), (dice, held), draw_dice))
+        return items
 
     def draw_game_over(self):
         self.draw_playing(); self._overlay(220)
@@ -593,11 +813,26 @@ class Game:
         ov.fill((0,0,0,alpha)); SCREEN.blit(ov,(0,0))
 
     # 루프
+    def frame(self):
+        # 이벤트 처리, 갱신, 그리기 한 번. 종료 요청이면 False
+        running=self.handle_events(); self.update(); self.draw()
+        if self.profiler: self.profiler.end_frame(SCREEN)
+        return running
+
     def run(self):
-        running=True
-        while running:
-            running=self.handle_events(); self.update(); self.draw(); self.clock.tick(60)
+        if LOOP_MODE == "async":
+            from yatzy_async import AsyncDriver
+            AsyncDriver(self).run()
+        else:
+            while self.frame(): self.clock.tick(60)
+        self.close()
         pygame.quit(); sys.exit()
 
+    def close(self):
+        if self.profiler: self.profiler.dump(PROFILE_TRACE)
+        if self.log is not None: self.log.close() # 저장 파일은 남겨 두고 다음 실행에서 이어하기
+        self.history.stop(timeout=2) # 대기 중인 게임 기록 쓰기
+        self.bots.shutdown()
+
 if __name__ == '__main__':
     Game().run()
\ No newline at end of file
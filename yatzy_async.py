@@ -0,0 +1,141 @@
+import json, time, asyncio
+from collections import deque
+from urllib.parse import urlsplit
+from yatzy_advice import AdviceClient, ADVICE_URL
+from yatzy_bots import BotRunner
+
+# --- asyncio 메인 루프 (선택, YATZY_LOOP=async) ---
+# AsyncDriver가 이벤트/갱신/그리기 한 프레임(Game.frame)을 asyncio 작업으로 돌리고, 조언 요청과 AI 계산을
+# 턴 토큰에 묶인 코루틴 작업으로 바꿔 끼운다. AdviceClient/BotRunner와 같은 request/poll/cancel 인터페이스라
+# Game 코드는 그대로이며, 리셋·굴림·턴 변경 때 Game이 부르는 cancel()과 토큰 변경이 곧 작업 취소다.
+#   AsyncAdvice : asyncio 스트림으로 직접 HTTP GET (작업 스레드 없음, 취소하면 연결을 닫는다)
+#   AsyncBots   : bot.act를 전용 스레드 하나에서 실행하는 코루틴 (취소하면 결과를 버린다)
+# 프레임 간격은 절대 마감 시각 기준으로 asyncio.sleep해서 맞추고, 늦은 프레임은 따라잡지 않고 건너뛴다.
+
+async def http_get(url):
+    # GET 요청 하나 -> (상태 코드, 본문). Content-Length와 chunked 응답을 처리한다
+    u = urlsplit(url)
+    https = u.scheme == "https"
+    reader, writer = await asyncio.open_connection(u.hostname, u.port or (443 if https else 80), ssl=https or None)
+    try:
+        path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {u.netloc}\r\nAccept: application/json\r\n"
+                     f"Connection: close\r\n\r\n".encode())
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            k, _, v = line.decode("latin-1").partition(":")
+            headers[k.strip().lower()] = v.strip()
+        if "content-length" in headers:
+            return status, await reader.readexactly(int(headers["content-length"]))
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while size := int((await reader.readline()).split(b";")[0], 16):
+                body += await reader.readexactly(size); await reader.readline()
+            return status, body
+        return status, await reader.read()
+    finally:
+        writer.close()
+
+class AsyncAdvice(AdviceClient):
+    # 턴 토큰마다 조언 요청 작업 하나. 디스크 캐시와 실패 시 대체 문구는 AdviceClient 규칙을 그대로 쓴다
+    def __init__(self, url=ADVICE_URL, **kw):
+        super().__init__(url, prefetch=0, **kw)
+        self._task = None # (토큰, Task)
+        self._last = 0.0  # 마지막 요청 시각 (요청 간격/백오프 기준)
+
+    def start(self): return self # 작업 스레드가 없다
+    def stop(self, timeout=None): self.cancel()
+
+    def request(self, token):
+        if self._task is not None and self._task[0] == token: return
+        self.cancel()
+        self._task = (token, asyncio.get_running_loop().create_task(self._get()))
+
+    def poll(self, token):
+        if self._task is None: return None
+        t, task = self._task
+        if t != token:
+            self.cancel(); return None
+        if not task.done(): return None
+        self._task = None
+        return task.result()
+
+    def cancel(self):
+        if self._task is not None:
+            self._task[1].cancel(); self.stale_dropped += 1
+        self._task = None
+
+    @property
+    def pending(self): return self._task[0] if self._task is not None else None
+
+    async def _get(self):
+        # 요청 간격(실패가 이어지면 백오프)을 지킨 뒤 연결한다. 기다리는 중에 취소되면 연결하지 않는다
+        wait = self._last + self._delay() - time.monotonic()
+        if wait > 0: await asyncio.sleep(wait)
+        self._last = time.monotonic()
+        self.requests_made += 1
+        try:
+            status, body = await asyncio.wait_for(http_get(self.url), self.timeout)
+            if status != 200: raise ValueError(status)
+            slip = json.loads(body)['slip']
+            sid, text = str(slip.get('id', slip['advice'])), slip['advice']
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failures += 1
+            return self._take_ready()
+        self.failures = 0
+        if sid not in self.seen:
+            self.seen[sid] = text
+            while len(self.seen) > self.cache_max: self.seen.pop(next(iter(self.seen)))
+            asyncio.get_running_loop().run_in_executor(None, self._save_cache, dict(self.seen))
+        return text
+
+class AsyncBots(BotRunner):
+    # BotRunner와 같지만 요청이 코루틴 작업이고, 토큰이 바뀌거나 cancel()되면 작업을 취소한다
+    def request(self, token, bot, snap):
+        if self._job is not None and self._job[0] == token: return
+        self.cancel()
+        self._job = (token, asyncio.get_running_loop().create_task(self._act(bot, snap)))
+
+    async def _act(self, bot, snap):
+        return await asyncio.get_running_loop().run_in_executor(self._pool, bot.act, snap)
+
+    def poll(self, token):
+        if self._job is not None and self._job[0] != token: self.cancel()
+        return super().poll(token)
+
+    def cancel(self):
+        if self._job is not None: self._job[1].cancel()
+        self._job = None
+
+class AsyncDriver:
+    def __init__(self, game, fps=60, history=3600):
+        self.game, self.period = game, 1 / fps
+        self.frame_starts = deque(maxlen=history) # 프레임 시작 시각 (loop.time)
+        self.late = 0                             # 마감을 넘긴 프레임 수
+
+    def run(self):
+        asyncio.run(self.main())
+
+    async def main(self):
+        g = self.game
+        g.advice_client.stop(0); g.advice_client = AsyncAdvice(g.advice_client.url)
+        g.bots.shutdown(); g.bots = AsyncBots()
+        try:
+            await asyncio.create_task(self._frames(), name="frames")
+        finally:
+            g.advice_client.cancel(); g.bots.cancel()
+
+    async def _frames(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            self.frame_starts.append(loop.time())
+            if not self.game.frame(): return
+            deadline += self.period
+            delay = deadline - loop.time()
+            if delay < 0:
+                self.late += 1; deadline = loop.time(); delay = 0
+            await asyncio.sleep(delay) # 이 사이에 조언/AI 작업이 진행된다
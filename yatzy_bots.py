@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import yatzy_sim as sim
+from yatzy_scoring import SCORE_CATS, score_vector
+from yatzy_engine import YatzyEngine
+
+# --- AI 플레이어 ---
+# 봇은 yatzy_sim의 정책(hold/choose)을 게임 1개짜리 배치로 호출한다. 대량 시뮬레이션·토너먼트와
+# 실제 게임이 같은 정책 코드를 쓴다.
+#   act(snapshot) -> (ROLL, 고정 리스트) 또는 (SCORE, 카테고리)
+# 게임 화면에서는 BotRunner가 전용 스레드 하나에서 act()를 실행하고, 메인 루프는 결과를 poll만 한다.
+
+BOTS = ("greedy", "upper", "solver") # 게임에서 고를 수 있는 봇 (sim.POLICIES 이름)
+AI_NAME = "AI ({})"                  # 봇 플레이어 이름 (이어하기 때 이 이름으로 봇을 복원한다)
+ROLL, SCORE = "roll", "score"
+
+def make_bot(name, seed=None):
+    # 게임용 봇: solver는 값 테이블이 없으면 계산하지 않고 greedy로 대신한다 (계산은 yatzy_solver.py로)
+    policy = sim.SolverPolicy(seed, compute=False) if name == "solver" else sim.POLICIES[name](seed)
+    return BotPlayer(name, policy)
+
+def bot_from_name(player_name):
+    # AI_NAME 형식의 플레이어 이름 -> 봇 이름 (아니면 None)
+    for b in BOTS:
+        if player_name == AI_NAME.format(b): return b
+    return None
+
+def snapshot(p):
+    # Player -> 스레드 사이에 넘길 수 있는 불변 상태 (주사위, 점수판(-1 = 빈 칸), 남은 굴림)
+    return tuple(p.dice), tuple(-1 if p.scores[c] is None else p.scores[c] for c in SCORE_CATS), p.rolls
+
+class BotPlayer:
+    def __init__(self, name, policy):
+        self.name, self.policy = name, policy
+
+    def act(self, snap):
+        dice, sheet, rolls = snap
+        if rolls == 3: return ROLL, [False]*5
+        d, sh = np.array([dice], dtype=np.uint8), np.array([sheet], dtype=np.int16)
+        if rolls > 0:
+            held = self.policy.hold(d, sh, rolls)[0]
+            if not held.all(): return ROLL, held.tolist()
+        cat = int(self.policy.choose(np.array([score_vector(dice)], dtype=np.int16), sh)[0])
+        return SCORE, SCORE_CATS[cat]
+
+def apply(engine, action):
+    # 봇 결정을 엔진에 적용 (고정을 맞춘 뒤 굴리기, 또는 점수 기록)
+    kind, arg = action
+    if kind == SCORE: return engine.score(arg)
+    for i, h in enumerate(arg):
+        if engine.current.held[i] != h: engine.toggle_hold(i)
+    return engine.roll()
+
+def play_game(bots, seed=None):
+    # 봇들끼리 엔진으로 게임 하나를 끝까지 진행
+    engine = YatzyEngine([AI_NAME.format(b.name) for b in bots], seed=seed)
+    while not engine.over:
+        apply(engine, bots[engine.turn].act(snapshot(engine.current)))
+    return engine
+
+class BotRunner:
+    # 봇 계산을 메인 스레드 밖에서 실행. 요청은 토큰(턴 토큰)과 함께 하고, 다른 토큰의 결과는 버린다
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot")
+        self._job = None # (토큰, Future)
+
+    def request(self, token, bot, snap):
+        if self._job is not None and self._job[0] == token: return
+        self._job = (token, self._pool.submit(bot.act, snap))
+
+    def poll(self, token):
+        # 현재 토큰의 결과가 준비됐으면 반환, 아니면 None (블로킹 없음)
+        if self._job is None: return None
+        t, fut = self._job
+        if t != token:
+            self._job = None; return None
+        if not fut.done(): return None
+        self._job = None
+        return fut.result()
+
+    @property
+    def pending(self): return self._job is not None
+
+    def cancel(self):
+        self._job = None
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,119 @@
+import os, random
+from yatzy_scoring import SCORE_CATS, CAT_INDEX, score_vector
+from yatzy_state import ScoreSheet, PlayerState
+
+# --- 화면 없는 게임 엔진 ---
+# pygame 없이 턴 진행(굴리기, 고정, 점수 기록, 종료 판정)만 담당한다.
+# Game(pygame UI)과 자동 시뮬레이션이 같은 규칙 코드를 공유한다.
+# recorder를 붙이면 굴림/고정/점수 기록이 일어날 때마다 이벤트를 넘긴다 (yatzy_log.GameLog).
+# 점수 미리보기(13칸 점수 벡터)는 플레이어별로 캐시하고 주사위가 바뀔 때(굴림, 주사위 대입)만 다시 계산한다.
+# 화면 표시와 점수 기록이 같은 벡터를 쓰므로 둘이 어긋날 수 없다. 고정은 점수와 무관하므로 캐시를 유지한다.
+
+class Player:
+    def __init__(self, name):
+        self.name=name; self.scores=None
+        self.preview_computes = 0 # 미리보기 계산 횟수 (캐시 미스)
+        self.reset_turn()
+
+    # 점수판은 기록할 때마다 합계를 갱신하는 ScoreSheet (일반 dict를 대입해도 변환된다)
+    @property
+    def scores(self): return self._scores
+    @scores.setter
+    def scores(self, v): self._scores = v if isinstance(v, ScoreSheet) else ScoreSheet(v)
+
+    # 주사위는 통째로 대입하거나 roll()로만 바꾼다 (둘 다 미리보기 캐시를 비운다)
+    @property
+    def dice(self): return self._dice
+    @dice.setter
+    def dice(self, v): self._dice = v; self._preview = None
+
+    def preview(self):
+        # 현재 주사위로 각 카테고리에 기록될 점수 (Yatzy 특례 포함, SCORE_CATS 순서)
+        if self._preview is None:
+            self.preview_computes += 1
+            self._preview = score_vector(self._dice)
+        return self._preview
+
+    def get_upper(self): return self._scores.upper
+
+    # Upper 보너스 (기준/점수는 규칙 집합 STANDARD.bonus: Upper Section 63점 이상 시 35점)
+    def bonus(self): return self._scores.bonus()
+
+    def total(self): return self._scores.total()
+    def state(self): return PlayerState.from_player(self)
+    def reset_turn(self): self.dice=[0]*5; self.held=[False]*5; self.rolls=3
+    def roll(self, rng=random):
+        if self.rolls<=0: return False
+        self.rolls-=1
+        for i in range(5):
+            if not self.held[i]: self._dice[i]=rng.randint(1,6)
+        self._preview = None
+        return True
+
+class YatzyEngine:
+    def __init__(self, names, seed=None, rng=None):
+        # rng를 넘기지 않으면 seed로 독립 난수 생성기를 만든다 (seed=None이면 새 seed를 뽑는다)
+        # seed는 이벤트 로그에 남겨 같은 난수열로 이어하기 위한 값이며, rng를 직접 넘기면 None
+        if rng is None and seed is None: seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed if rng is None else None
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.players = [Player(n) for n in names]
+        self.turn = 0
+        self.over = False
+        self.recorder = None
+
+    @property
+    def current(self): return self.players[self.turn]
+
+    # 조작
+    def roll(self):
+        if self.over or not self.current.roll(self.rng): return False
+        if self.recorder: self.recorder.roll(self.turn, self.current.dice)
+        return True
+
+    def apply_roll(self, dice):
+        # 난수 없이 기록된 굴림 결과를 그대로 적용한다 (빠른 재생용)
+        cur = self.current
+        if self.over or cur.rolls<=0: return False
+        cur.rolls-=1; cur.dice=list(dice)
+        if self.recorder: self.recorder.roll(self.turn, cur.dice)
+        return True
+
+    def toggle_hold(self, i):
+        # 한 번이라도 굴린 뒤에만 고정을 바꿀 수 있다
+        cur = self.current
+        if self.over or cur.rolls==3: return False
+        cur.held[i] ^= True
+        if self.recorder: self.recorder.hold(self.turn, i)
+        return True
+
+    def score(self, cat):
+        # 현재 플레이어의 카테고리에 점수를 기록하고 턴을 넘긴다. 기록할 수 없으면 None
+        cur = self.current
+        if self.over or cur.rolls==3 or cur.scores[cat] is not None: return None
+        pts = cur.scores[cat] = self.preview()[CAT_INDEX[cat]]
+        if self.recorder: self.recorder.score(self.turn, CAT_INDEX[cat], pts)
+        cur.dice=[0]*5
+        self.turn = (self.turn + 1) % len(self.players)
+        self.players[self.turn].reset_turn()
+        self.over = all(p.scores[c] is not None for p in self.players for c in SCORE_CATS)
+        return pts
+
+    # 조회
+    def preview(self):
+        # 현재 플레이어의 점수 미리보기 (Player.preview 캐시)
+        return self.current.preview()
+
+    def open_categories(self):
+        return [c for c in SCORE_CATS if self.current.scores[c] is None]
+
+    def state(self):
+        # 직렬화하기 쉬운 현재 상태 스냅샷
+        return {
+            "turn": self.turn, "over": self.over,
+            "players": [
+                {"name": p.name, "scores": dict(p.scores), "dice": list(p.dice), "held": list(p.held),
+                 "rolls": p.rolls, "upper": p.get_upper(), "bonus": p.bonus(), "total": p.total()}
+                for p in self.players
+            ],
+        }
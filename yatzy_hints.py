@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict, namedtuple, Counter
+import numpy as np
+from yatzy_scoring import SCORE_CATS, UPPER_MAP, STANDARD, dice_key, score_vector
+
+# --- 실시간 최적 수 힌트 ---
+# 현재 Player 상태(채운 카테고리, 주사위, 고정, 남은 굴림)에 대해 최적 고정 마스크와
+# 카테고리별 기대값(이번 턴 점수 + 남은 게임 기대 점수)을 돌려준다.
+# 상태별 턴 테이블은 LRU 캐시에 보관하고, 값 테이블이 아직 없으면 즉시 점수 기준(greedy)으로 답한다.
+# 해법 모듈(import 때 전이 행렬을 만든다)은 값 테이블을 열 때 import하므로 이 모듈은 게임과 함께 가볍게 import된다.
+
+Hint = namedtuple("Hint", "hold category_ev best_cat hold_ev source")
+BONUS_THRESHOLD, BONUS_POINTS = STANDARD.bonus
+
+def player_state(p):
+    # Player -> (채운 카테고리 비트마스크, 63 상한 Upper 합계), ScoreSheet가 유지하는 값을 그대로 쓴다
+    return p.scores.filled, min(BONUS_THRESHOLD, p.scores.upper)
+
+def _positions(dice, sorted_mask):
+    # 정렬된 주사위 기준 고정 마스크를 실제 주사위 위치의 held 리스트로 변환
+    order = sorted(range(5), key=lambda i: dice[i])
+    held = [False]*5
+    for j,i in enumerate(order):
+        if sorted_mask >> j & 1: held[i] = True
+    return held
+
+def _solver():
+    import yatzy_solver
+    return yatzy_solver
+
+class HintService:
+    def __init__(self, values=None, max_states=256, max_hints=1024):
+        self.values = values
+        self.solver = None if values is None else _solver()
+        self.max_states, self.max_hints = max_states, max_hints
+        self._tables = OrderedDict() # (mask, up) -> 턴 테이블 (상태당 약 13KB)
+        self._hints = OrderedDict()  # (mask, up, 조합, 남은 굴림) -> Hint
+        self._lock = threading.Lock()
+        self._loading = False
+
+    # 값 테이블 준비
+    def warm(self, compute=False):
+        # 백그라운드 스레드에서 값 테이블을 메모리 맵으로 연다 (compute=True면 없을 때 계산까지)
+        if self.values is not None or self._loading: return
+        self._loading = True
+        def load():
+            try:
+                self.solver = _solver()
+                self.values = self.solver.load_values(compute=compute)
+            finally: self._loading = False
+        threading.Thread(target=load, daemon=True).start()
+
+    @property
+    def ready(self): return self.values is not None
+
+    # 캐시
+    def _turn(self, mask, up):
+        key = (mask, up)
+        t = self._tables.get(key)
+        if t is not None:
+            self._tables.move_to_end(key); return t
+        r0, k1, r1, k2, r2 = self.solver.turn_tables(self.values, np.array([mask]), np.array([up]))
+        t = (r0[0], k1[0], k2[0])
+        self._tables[key] = t
+        if len(self._tables) > self.max_states: self._tables.popitem(last=False)
+        return t
+
+    def _category_ev(self, mask, up, dice):
+        sv = score_vector(dice)
+        ev = {}
+        for i,c in enumerate(SCORE_CATS):
+            if mask >> i & 1: continue
+            pts, nu = sv[i], up
+            if c in UPPER_MAP:
+                nu = min(BONUS_THRESHOLD, up + pts)
+                if up < BONUS_THRESHOLD <= nu: pts += BONUS_POINTS
+            ev[c] = pts + float(self.values[mask | 1 << i, nu])
+        return ev
+
+    # 조회
+    def hint(self, p):
+        # 굴리기 전이거나 게임이 끝났으면 None
+        if p.rolls >= 3 or all(v is not None for v in p.scores.values()): return None
+        d = dice_key(p.dice)
+        if d is None: return None
+        if self.values is None: return self._greedy(p)
+        mask, up = player_state(p)
+        key = (mask, up, d, p.rolls)
+        with self._lock:
+            entry = self._hints.get(key)
+            if entry is not None:
+                self._hints.move_to_end(key)
+            else:
+                entry = self._solve(mask, up, d, p.rolls, p.dice)
+                self._hints[key] = entry
+                if len(self._hints) > self.max_hints: self._hints.popitem(last=False)
+        h, ev, best_cat, hold_ev = entry
+        return Hint(_positions(p.dice, h), ev, best_cat, hold_ev, "solver")
+
+    def _solve(self, mask, up, d, rolls, dice):
+        # 캐시 항목: (정렬 기준 고정 마스크, 카테고리별 기대값, 최선 카테고리, 고정 기대값)
+        ev = self._category_ev(mask, up, dice)
+        best_cat = max(ev, key=ev.get)
+        if rolls == 0: return 31, ev, best_cat, ev[best_cat]
+        _, k1, k2 = self._turn(mask, up)
+        kv = (k2 if rolls == 2 else k1)[self.solver.SUBKEEPS[d]]
+        h = int(np.argmax(kv))
+        # 다섯 개 모두 고정 = 다시 굴리지 않고 기록하는 것과 같다
+        if kv[31] >= kv[h]: h = 31
+        return h, ev, best_cat, float(kv[h])
+
+    def _greedy(self, p):
+        # 값 테이블 준비 전 대체 답: 즉시 점수가 가장 큰 카테고리, 가장 많이 나온 눈 고정
+        sv = score_vector(p.dice)
+        ev = {c:float(sv[i]) for i,c in enumerate(SCORE_CATS) if p.scores[c] is None}
+        best_cat = max(ev, key=ev.get)
+        face = max(Counter(p.dice).items(), key=lambda kv: (kv[1], kv[0]))[0]
+        hold = [True]*5 if p.rolls == 0 else [d == face for d in p.dice]
+        return Hint(hold, ev, best_cat, ev[best_cat], "greedy")
+
+def hint_text(h):
+    # 조언 패널에 표시할 한 줄 요약
+    if h is None: return None
+    if all(h.hold):
+        return f"추천: {h.best_cat}에 기록 (기대값 {h.category_ev[h.best_cat]:.1f})"
+    held = ",".join(str(i+1) for i,v in enumerate(h.hold) if v) or "없음"
+    return f"추천: {held}번 주사위 고정 후 굴리기 (기대값 {h.hold_ev:.1f})"
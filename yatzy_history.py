@@ -0,0 +1,239 @@
+import os, sys, time, queue, hashlib, sqlite3, threading, argparse
+from collections import Counter
+from yatzy_scoring import SCORE_CATS, CAT_INDEX
+from yatzy_log import EV_SCORE, encode_start, read_games, replay
+
+# --- 게임 기록 저장소 (SQLite) ---
+# 끝난 게임을 results 테이블(플레이어당 1행, 카테고리별 점수 열)에 쌓는다.
+# 쓰기는 작업 스레드 하나가 모아서 한 트랜잭션으로 처리하므로 메인 루프는 submit()만 호출한다.
+# 쓰기와 함께 집계 테이블(플레이어 요약, 카테고리 점수 분포, 채움 순서)을 갱신해 두므로
+# 조회는 기록된 게임 수와 관계없이 집계 테이블이나 인덱스만 읽는다.
+# 게임마다 로그 내용(seed, 이름, 이벤트)의 해시를 key로 두어 같은 게임은 한 번만 기록한다
+# (UI가 submit한 게임을 아카이브에서 다시 가져오거나 같은 아카이브를 두 번 가져와도 중복되지 않는다).
+
+HISTORY_PATH = os.environ.get("YATZY_HISTORY", os.path.join(os.path.expanduser("~"), ".yatzy_history.sqlite3"))
+NUM_CATS = len(SCORE_CATS)
+YATZY = CAT_INDEX["Yatzy"]
+_COLS = ", ".join(f"c{i}" for i in range(NUM_CATS)) # 카테고리 점수 열 (SCORE_CATS 순서)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (id INTEGER PRIMARY KEY, ended REAL NOT NULL, players INTEGER NOT NULL, seed INTEGER, key BLOB);
+CREATE TABLE IF NOT EXISTS results (
+    game INTEGER NOT NULL, seat INTEGER NOT NULL, name TEXT NOT NULL,
+    total INTEGER NOT NULL, upper INTEGER NOT NULL, bonus INTEGER NOT NULL,
+    {", ".join(f"c{i} INTEGER NOT NULL" for i in range(NUM_CATS))},
+    fill_order BLOB NOT NULL, PRIMARY KEY (game, seat)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_total ON results(total DESC);
+CREATE INDEX IF NOT EXISTS results_name_total ON results(name, total);
+CREATE TABLE IF NOT EXISTS player_summary (
+    name TEXT PRIMARY KEY, games INTEGER NOT NULL, total_sum INTEGER NOT NULL, best INTEGER NOT NULL,
+    bonus_hits INTEGER NOT NULL, yatzy_hits INTEGER NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS category_counts (cat INTEGER, score INTEGER, n INTEGER NOT NULL, PRIMARY KEY (cat, score)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fill_counts (cat INTEGER, pos INTEGER, n INTEGER NOT NULL, PRIMARY KEY (cat, pos)) WITHOUT ROWID;
+"""
+
+def connect(path=HISTORY_PATH):
+    # WAL 모드: 작업 스레드가 쓰는 동안에도 다른 연결에서 조회할 수 있다
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    # key 열이 없던 DB는 열을 추가한다 (기존 게임의 key는 NULL이라 중복 검사에서 빠진다)
+    if "key" not in {r[1] for r in conn.execute("PRAGMA table_info(games)")}:
+        conn.execute("ALTER TABLE games ADD COLUMN key BLOB")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS games_key ON games(key)")
+    return conn
+
+# 게임 -> 행
+def game_key(game):
+    # 게임 로그 내용의 해시 (이벤트는 8바이트 튜플이라 그대로 바이트로 이어 붙인다)
+    return hashlib.blake2b(encode_start(game.seed, game.names) + bytes(b for ev in game.events for b in ev), digest_size=16).digest()
+
+def game_record(game, ended=None):
+    # yatzy_log.LoggedGame -> (key, seed, 종료 시각, 플레이어별 행), 끝나지 않은 게임은 None
+    # 행: (자리, 이름, 총점, Upper 합계, 보너스, 카테고리 점수 13개, 채움 순서 bytes)
+    eng = replay(game)
+    if not eng.over: return None
+    orders = [[] for _ in eng.players]
+    for ev in game.events:
+        if ev[0] == EV_SCORE: orders[ev[1]].append(ev[2])
+    rows = [(k, p.name, p.total(), p.get_upper(), p.bonus(), *(p.scores[c] for c in SCORE_CATS), bytes(orders[k]))
+            for k, p in enumerate(eng.players)]
+    return game_key(game), game.seed, time.time() if ended is None else ended, rows
+
+def _signed(seed):
+    # SQLite INTEGER는 부호 있는 64비트
+    return None if seed is None else seed - (1 << 64) if seed >= 1 << 63 else seed
+
+def write_records(conn, records):
+    # 게임 기록 여러 개를 한 트랜잭션으로 저장하고 집계 테이블을 갱신한다. 새로 들어간 게임 수를 돌려준다
+    # key가 이미 있는 게임은 건너뛰고 집계에도 넣지 않는다 (key가 None이면 중복 검사 없이 기록)
+    players, cats, fills = {}, Counter(), Counter()
+    added = 0
+    with conn:
+        for key, seed, ended, rows in records:
+            cur = conn.execute("INSERT OR IGNORE INTO games (ended, players, seed, key) VALUES (?, ?, ?, ?)",
+                               (ended, len(rows), _signed(seed), key))
+            if not cur.rowcount: continue
+            gid = cur.lastrowid; added += 1
+            conn.executemany(f"INSERT INTO results (game, seat, name, total, upper, bonus, {_COLS}, fill_order) "
+                             f"VALUES ({', '.join('?' * (NUM_CATS + 7))})", [(gid, *r) for r in rows])
+            for r in rows:
+                name, total, bonus, scores = r[1], r[2], r[4], r[5:5 + NUM_CATS]
+                s = players.get(name) or [0, 0, 0, 0, 0]
+                s[0] += 1; s[1] += total; s[2] = max(s[2], total); s[3] += bonus > 0; s[4] += scores[YATZY] > 0
+                players[name] = s
+                cats.update(enumerate(scores))
+                fills.update((cat, pos) for pos, cat in enumerate(r[-1]))
+        conn.executemany("INSERT INTO player_summary VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                         "games = games + excluded.games, total_sum = total_sum + excluded.total_sum, "
+                         "best = max(best, excluded.best), bonus_hits = bonus_hits + excluded.bonus_hits, "
+                         "yatzy_hits = yatzy_hits + excluded.yatzy_hits", [(n, *s) for n, s in players.items()])
+        conn.executemany("INSERT INTO category_counts VALUES (?, ?, ?) ON CONFLICT(cat, score) DO UPDATE SET n = n + excluded.n",
+                         [(c, v, n) for (c, v), n in cats.items()])
+        conn.executemany("INSERT INTO fill_counts VALUES (?, ?, ?) ON CONFLICT(cat, pos) DO UPDATE SET n = n + excluded.n",
+                         [(c, p, n) for (c, p), n in fills.items()])
+    return added
+
+class HistoryStore:
+    def __init__(self, path=HISTORY_PATH, batch=256, interval=1.0):
+        # batch: 한 트랜잭션에 모을 최대 게임 수, interval: 첫 게임이 들어온 뒤 쓰기까지 기다리는 최대 시간(초)
+        self.path, self.batch, self.interval = path, batch, interval
+        self._q = queue.Queue()
+        self._thread = None
+        self.written = self.batches = self.errors = 0
+
+    # 수명 관리
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        # 대기 중인 기록을 모두 쓰고 종료
+        if self._thread is None: return
+        self._q.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    # 메인 스레드 쪽 (블로킹 없음)
+    def submit(self, game, ended=None):
+        # yatzy_log.LoggedGame 하나를 저장 대기열에 넣는다
+        self.start()
+        self._q.put((game, ended))
+
+    def flush(self):
+        # 지금까지 넣은 기록이 모두 쓰일 때까지 대기 (종료, 벤치마크용)
+        self._q.join()
+
+    # 작업 스레드
+    def _run(self):
+        conn = connect(self.path)
+        try:
+            stop = False
+            while not stop:
+                items = [self._q.get()]
+                deadline = time.monotonic() + self.interval
+                while items[-1] is not None and len(items) < self.batch:
+                    try: items.append(self._q.get(timeout=max(0.0, deadline - time.monotonic())))
+                    except queue.Empty: break
+                stop = items[-1] is None
+                try:
+                    records = [r for r in (game_record(*it) for it in items if it is not None) if r is not None]
+                    if records:
+                        self.written += write_records(conn, records); self.batches += 1
+                except Exception:
+                    self.errors += 1 # 기록 실패가 게임을 멈추지 않도록
+                finally:
+                    for _ in items: self._q.task_done()
+        finally:
+            conn.close()
+
+    def import_archive(self, archive_path):
+        # 이벤트 로그 아카이브의 끝난 게임 중 아직 없는 것을 저장하고 그 수를 돌려준다 (작업 스레드 없이 직접 기록).
+        # 로그에는 게임별 시각이 없으므로 종료 시각은 아카이브 파일의 수정 시각으로 기록한다.
+        # UI에서 끝난 게임은 이미 실제 종료 시각으로 submit되어 있어 그대로 남는다
+        ended = os.path.getmtime(archive_path)
+        records = [r for r in (game_record(g, ended) for g in read_games(archive_path)) if r is not None]
+        conn = connect(self.path)
+        try:
+            return sum(write_records(conn, records[i:i + self.batch]) for i in range(0, len(records), self.batch))
+        finally:
+            conn.close()
+
+# --- 조회 ---
+def leaderboard(conn, limit=10):
+    # 최고 점수 순위: (이름, 총점, 게임 id, 종료 시각)
+    return conn.execute("SELECT r.name, r.total, r.game, g.ended FROM results r JOIN games g ON g.id = r.game "
+                        "ORDER BY r.total DESC LIMIT ?", (limit,)).fetchall()
+
+def player_stats(conn, name=None):
+    # 플레이어별 게임 수, 평균/최고 총점, Upper 보너스 달성률, Yatzy 기록률 (name이 없으면 전체 플레이어)
+    q = "SELECT name, games, total_sum, best, bonus_hits, yatzy_hits FROM player_summary"
+    rows = conn.execute(q + " WHERE name = ?", (name,)) if name is not None else conn.execute(q + " ORDER BY games DESC")
+    return [{"name": n, "games": g, "mean": s / g, "best": b, "bonus_rate": bh / g, "yatzy_rate": yh / g}
+            for n, g, s, b, bh, yh in rows]
+
+def overview(conn):
+    g, s, bh, yh = conn.execute("SELECT sum(games), sum(total_sum), sum(bonus_hits), sum(yatzy_hits) FROM player_summary").fetchone()
+    if not g: return {"results": 0}
+    return {"games": conn.execute("SELECT count(*) FROM games").fetchone()[0], "results": g,
+            "mean": s / g, "bonus_rate": bh / g, "yatzy_rate": yh / g}
+
+def player_percentiles(conn, name, ps=(10, 25, 50, 75, 90, 99)):
+    # (name, total) 인덱스로 총점 히스토그램만 읽어 백분위를 구한다 (총점 종류는 수백 개 이하)
+    hist = conn.execute("SELECT total, count(*) FROM results WHERE name = ? GROUP BY total ORDER BY total", (name,)).fetchall()
+    n = sum(k for _, k in hist)
+    if not n: return {}
+    out, seen, i = {}, 0, 0
+    for p in sorted(ps):
+        rank = max(1, -(-p * n // 100)) # nearest-rank
+        while seen + hist[i][1] < rank:
+            seen += hist[i][1]; i += 1
+        out[p] = hist[i][0]
+    return out
+
+def category_distribution(conn, cat):
+    # 카테고리 하나의 {점수: 비율}
+    rows = conn.execute("SELECT score, n FROM category_counts WHERE cat = ? ORDER BY score", (CAT_INDEX[cat],)).fetchall()
+    n = sum(k for _, k in rows)
+    return {v: k / n for v, k in rows} if n else {}
+
+def fill_order(conn):
+    # 카테고리별 평균 채움 순서(0 = 첫 턴) -> 일찍 채우는 순으로 정렬한 (카테고리, 평균 순서) 목록
+    acc = {}
+    for c, pos, n in conn.execute("SELECT cat, pos, n FROM fill_counts"):
+        a = acc.setdefault(c, [0, 0]); a[0] += pos * n; a[1] += n
+    return sorted(((SCORE_CATS[c], s / n) for c, (s, n) in acc.items()), key=lambda t: t[1])
+
+def print_report(conn, name=None, out=sys.stdout):
+    ov = overview(conn)
+    if not ov["results"]:
+        print("기록된 게임이 없습니다", file=out); return
+    print(f"게임 {ov['games']}개, 플레이어 기록 {ov['results']}개  평균 {ov['mean']:.1f}  "
+          f"보너스 {ov['bonus_rate']:.1%}  Yatzy {ov['yatzy_rate']:.1%}", file=out)
+    print("\n[순위]", file=out)
+    for i, (n, t, gid, ended) in enumerate(leaderboard(conn), 1):
+        print(f"{i:3d}. {n:15s} {t:4d}  ({time.strftime('%Y-%m-%d %H:%M', time.localtime(ended))})", file=out)
+    print("\n[플레이어]", file=out)
+    for s in player_stats(conn, name)[:20]:
+        pct = player_percentiles(conn, s["name"])
+        print(f"{s['name']:15s} {s['games']:7d}게임  평균 {s['mean']:6.1f}  최고 {s['best']:3d}  보너스 {s['bonus_rate']:6.1%}  "
+              f"Yatzy {s['yatzy_rate']:6.1%}  " + " ".join(f"p{p}={v}" for p, v in pct.items()), file=out)
+    print("\n[채움 순서]", file=out)
+    print(", ".join(f"{c} {pos:.1f}" for c, pos in fill_order(conn)), file=out)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="게임 기록 통계")
+    ap.add_argument("--db", default=HISTORY_PATH)
+    ap.add_argument("--import", dest="archive", help="이벤트 로그 아카이브를 먼저 가져온다")
+    ap.add_argument("--player", help="한 플레이어만 표시")
+    args = ap.parse_args(argv)
+    if args.archive: print(f"가져온 게임: {HistoryStore(args.db).import_archive(args.archive)}")
+    conn = connect(args.db)
+    try: print_report(conn, args.player)
+    finally: conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from functools import lru_cache
+import pygame
+
+# --- 화면 배치 캐시 ---
+# 클릭/호버 판정에 쓰는 모든 영역(버튼, 이름 입력 상자, 패널별 점수판 행과 주사위)을 (플레이어 수, 화면 크기)마다
+# 한 번 계산해 두고, 그리기와 이벤트 처리가 같은 Rect를 쓴다. 점 조회는 격자 버킷 하나만 보는 공간 인덱스로 한다.
+# 화면 크기가 키에 들어 있으므로 창 크기가 바뀌면 새 배치를 계산하고, Game.resize()가 layout.cache_clear()로 옛 배치를 버린다.
+# 적중 키: ("button", 이름), ("input", i), ("row", 패널, 카테고리 인덱스), ("dice", 패널, 주사위 인덱스)
+
+BOARD_Y, ROW_H = 220, 35 # 점수판 시작 Y, 카테고리 행 높이
+DICE_SIZE, DICE_SPACING = 80, 100 # 주사위 한 변, 주사위 사이 간격 (스프라이트 아틀라스도 이 크기로 만든다)
+NAME_Y, TOTAL_Y, ADVICE_Y = 50, 150, 185 # 패널 안 이름, 총점, 조언 Y
+GRID_CELL = 64 # 공간 인덱스 격자 한 칸(px)
+NUM_ROWS = 13
+
+class Grid:
+    # 격자 칸마다 그 칸과 겹치는 (키, Rect) 목록. 큰 영역은 여러 칸에 들어간다
+    def __init__(self, cell=GRID_CELL):
+        self.cell, self.buckets = cell, {}
+
+    def add(self, key, rect):
+        c = self.cell
+        for gx in range(rect.left // c, (rect.right - 1) // c + 1):
+            for gy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                self.buckets.setdefault((gx, gy), []).append((key, rect))
+
+    def hits(self, pos):
+        # pos를 포함하는 영역의 키 (추가한 순서)
+        c = self.cell
+        return tuple(k for k, r in self.buckets.get((pos[0] // c, pos[1] // c), ()) if r.collidepoint(pos))
+
+class Panel:
+    # 플레이어 패널 하나의 배치 (1인 모드도 2인 패널 폭을 화면 가운데에 둔다)
+    def __init__(self, x0, single, w, h):
+        self.x0, self.width = x0, w // 2
+        self.name_x = x0 + self.width // 2
+        self.upper_end = BOARD_Y + 6 * ROW_H
+        self.row_y = [BOARD_Y + i * ROW_H if i < 6 else self.upper_end + 70 + (i - 6) * ROW_H for i in range(NUM_ROWS)]
+        self.rows = [pygame.Rect(x0 + 40, y + 2, self.width - 80, ROW_H) for y in self.row_y]
+        self.score_name_x, self.score_value_x = x0 + 50, x0 + self.width - 50
+        row_w = DICE_SPACING * 4 + DICE_SIZE
+        self.dice_x = x0 + (self.width - row_w) // 2 if single else x0 + 80
+        self.dice_y = h - 190
+        self.dice = [pygame.Rect(self.dice_x + i * DICE_SPACING, self.dice_y, DICE_SIZE, DICE_SIZE) for i in range(5)]
+        self.dice_row = pygame.Rect(self.dice_x, self.dice_y, row_w, DICE_SIZE)
+
+class Layout:
+    def __init__(self, num_players, size):
+        w, h = self.size = size
+        rects = {
+            "1p": (w//2-100, 300, 200, 60), "2p": (w//2-100, 400, 200, 60), "resume": (w//2-100, 500, 200, 60),
+            "roll": (w//2-75, h-95, 150, 50), "quit_ingame": (w-170, 20, 150, 50), "restart": (w-170, 80, 150, 50),
+            "start": (w//2-100, 600, 200, 60), "ai": (w//2+270, 475, 180, 50), "how_to_play": (w//2-100, 680, 200, 60),
+            "back_to_menu": (50, 50, 150, 50), "play_again": (w//2-100, 500, 200, 60), "quit": (w//2-100, 580, 200, 60)}
+        self.buttons = {k: pygame.Rect(r) for k, r in rects.items()}
+        start_y = (h - num_players * 150) // 2
+        self.inputs = [pygame.Rect(w//2 - 250, start_y + i * 150, 500, 50) for i in range(num_players)]
+        self.panels = [Panel(w // 4, True, w, h)] if num_players == 1 else [Panel(0, False, w, h), Panel(w // 2, False, w, h)]
+        self.grid = Grid()
+        for k, r in self.buttons.items(): self.grid.add(("button", k), r)
+        for i, r in enumerate(self.inputs): self.grid.add(("input", i), r)
+        for k, p in enumerate(self.panels):
+            for i, r in enumerate(p.rows): self.grid.add(("row", k, i), r)
+            for i, r in enumerate(p.dice): self.grid.add(("dice", k, i), r)
+
+    def hits(self, pos): return self.grid.hits(pos)
+
+@lru_cache(maxsize=8)
+def layout(num_players, size):
+    return Layout(num_players, size)
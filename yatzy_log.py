@@ -0,0 +1,151 @@
+import os, struct
+from collections import namedtuple
+from yatzy_scoring import SCORE_CATS
+from yatzy_engine import YatzyEngine
+
+# --- 이벤트 소싱 게임 로그 ---
+# 게임 하나 = START 레코드 + 고정 길이(8바이트) 이벤트의 나열. 파일에는 덧붙이기만 하므로
+# 진행 중 게임의 저장 파일이 곧 로그이고, 끝난 게임 로그를 이어 붙이면 아카이브가 된다.
+#   START: 종류 1 | 버전 1 | 플래그 1 | seed 8 | 인원 1 | (이름 길이 1 + UTF-8)×인원
+#   ROLL : 종류 1 | 플레이어 1 | 굴린 뒤 주사위 5 | 0
+#   HOLD : 종류 1 | 플레이어 1 | 주사위 번호 1 | 0×5
+#   SCORE: 종류 1 | 플레이어 1 | 카테고리 번호 1 | 점수 1 | 0×4
+# seed가 있으면 같은 seed로 굴림을 다시 실행해 난수 상태까지 복원하고(resume),
+# 분석용 재생(replay)은 기록된 주사위를 그대로 적용하므로 난수를 쓰지 않는다.
+
+EV_START, EV_ROLL, EV_HOLD, EV_SCORE = 1, 2, 3, 4
+LOG_VERSION = 1
+F_SEED = 1 # 플래그: seed 필드가 유효함
+_START = struct.Struct("<BBBQB")
+_EVENT = struct.Struct("<8B")
+_U64 = 1 << 64
+
+LoggedGame = namedtuple("LoggedGame", "seed names events") # events: (종류, 플레이어, a, b, c, d, e, f) 튜플 목록
+
+class LogError(ValueError):
+    pass
+
+class GameLog:
+    def __init__(self, f, autoflush=True):
+        # f: 바이너리 쓰기 파일 객체. autoflush면 이벤트마다 flush해 강제 종료에도 저장이 남는다
+        self.f, self.autoflush = f, autoflush
+        self.events = 0
+
+    @classmethod
+    def create(cls, path, engine):
+        # 새 저장 파일을 만들고 게임 시작을 기록
+        log = cls(open(path, "wb"))
+        log.start(engine)
+        return log
+
+    @classmethod
+    def append(cls, path, engine):
+        # 이어하기: 기존 저장 파일 뒤에 계속 기록. 쓰다가 잘린 마지막 레코드는 지우고 그 자리부터 쓴다
+        # (남겨 두면 이후 이벤트가 모두 어긋나 다음 재생에서 사라진다)
+        with open(path, "rb") as f: end = complete_size(f.read())
+        os.truncate(path, end)
+        log = cls(open(path, "ab"))
+        engine.recorder = log
+        return log
+
+    def start(self, engine):
+        self.f.write(encode_start(engine.seed, [p.name for p in engine.players]))
+        engine.recorder = self
+        self._flush()
+
+    # YatzyEngine recorder 인터페이스
+    def roll(self, player, dice): self._write(EV_ROLL, player, *dice, 0)
+    def hold(self, player, i): self._write(EV_HOLD, player, i, 0, 0, 0, 0, 0)
+    def score(self, player, cat, pts): self._write(EV_SCORE, player, cat, pts, 0, 0, 0, 0)
+
+    def _write(self, *ev):
+        self.f.write(_EVENT.pack(*ev))
+        self.events += 1
+        self._flush()
+
+    def _flush(self):
+        if self.autoflush: self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+def encode_start(seed, names):
+    valid = isinstance(seed, int) and 0 <= seed < _U64
+    out = [_START.pack(EV_START, LOG_VERSION, F_SEED if valid else 0, seed if valid else 0, len(names))]
+    for n in names:
+        b = n.encode("utf-8")[:255]
+        out.append(bytes([len(b)]) + b)
+    return b"".join(out)
+
+# 읽기
+def _scan(data):
+    # 로그/아카이브 바이트 -> (LoggedGame 목록, 마지막 완전한 레코드의 끝 오프셋).
+    # 강제 종료로 마지막 레코드(START 또는 이벤트)가 잘려 있으면 그 레코드는 버린다
+    games, pos, n = [], 0, len(data)
+    unpack, size = _EVENT.unpack_from, _EVENT.size
+    events = None
+    while pos < n:
+        if data[pos] == EV_START:
+            if pos + _START.size > n: break
+            _, ver, flags, seed, count = _START.unpack_from(data, pos)
+            if ver != LOG_VERSION: raise LogError(f"지원하지 않는 로그 버전: {ver}")
+            end, names = pos + _START.size, []
+            for _ in range(count):
+                if end >= n or end + 1 + data[end] > n: break
+                names.append(bytes(data[end+1:end+1+data[end]]).decode("utf-8")); end += 1 + data[end]
+            if len(names) < count: break
+            pos, events = end, []
+            games.append(LoggedGame(seed if flags & F_SEED else None, names, events))
+        else:
+            if events is None: raise LogError("START 레코드 없이 이벤트가 시작됩니다")
+            if pos + size > n: break
+            events.append(unpack(data, pos)); pos += size
+    return games, pos
+
+def parse(data): return _scan(data)[0]
+def complete_size(data): return _scan(data)[1]
+
+def read_games(path):
+    with open(path, "rb") as f: return parse(f.read())
+
+def replay(game, upto=None):
+    # 기록된 이벤트 upto개(None이면 전부)를 적용한 엔진을 돌려준다. 난수를 쓰지 않는다
+    eng = YatzyEngine(game.names, rng=_NoRandom)
+    roll, hold, score = eng.apply_roll, eng.toggle_hold, eng.score
+    for ev in (game.events if upto is None else game.events[:upto]):
+        kind = ev[0]
+        if eng.turn != ev[1]: raise LogError(f"플레이어 순서가 맞지 않습니다: {ev}")
+        if kind == EV_ROLL: ok = roll(ev[2:7])
+        elif kind == EV_HOLD: ok = hold(ev[2])
+        elif kind == EV_SCORE: ok = score(SCORE_CATS[ev[2]]) == ev[3]
+        else: raise LogError(f"알 수 없는 이벤트: {ev}")
+        if not ok: raise LogError(f"적용할 수 없는 이벤트: {ev}")
+    return eng
+
+def resume(path):
+    # 저장 파일의 마지막 게임을 이어서 할 수 있는 엔진으로 복원한다.
+    # seed가 있으면 굴림을 같은 난수열로 다시 실행해 이후 굴림까지 원래 게임과 같게 만든다
+    games = read_games(path)
+    if not games: raise LogError("저장된 게임이 없습니다")
+    game = games[-1]
+    if game.seed is None: return replay(game)
+    eng = YatzyEngine(game.names, seed=game.seed)
+    for ev in game.events:
+        kind = ev[0]
+        if kind == EV_ROLL: ok = eng.roll() and tuple(eng.current.dice) == ev[2:7]
+        elif kind == EV_HOLD: ok = eng.toggle_hold(ev[2])
+        elif kind == EV_SCORE: ok = eng.score(SCORE_CATS[ev[2]]) == ev[3]
+        else: ok = False
+        if not ok: raise LogError(f"seed로 재현되지 않는 이벤트: {ev}")
+    return eng
+
+def archive(path, archive_path):
+    # 끝난 게임의 저장 파일을 아카이브 뒤에 붙이고 지운다 (잘린 마지막 레코드는 붙이지 않는다)
+    with open(path, "rb") as f: data = f.read()
+    with open(archive_path, "ab") as f: f.write(data[:complete_size(data)])
+    os.remove(path)
+
+class _NoRandom:
+    # replay용 엔진이 실수로 난수를 쓰면 바로 드러나도록
+    @staticmethod
+    def randint(a, b): raise LogError("replay 중에는 난수를 쓰지 않습니다")
@@ -0,0 +1,81 @@
+import numpy as np
+from collections import namedtuple
+from yatzy_scoring import SCORE_CATS, dice_key
+from yatzy_solver import SCORES, NUM_MS, KEEPS, KEEP_INDEX, EMPTY_KEEP, TRANSITION, SUBKEEPS
+
+# --- 재굴림 확률 (정확한 값) ---
+# 252개 조합 사이의 전이 행렬(yatzy_solver.TRANSITION)로 카테고리별 성공 확률과 기대 점수를 미리 계산한다.
+#   성공 = 해당 카테고리 점수가 0보다 큼 (Upper는 그 눈이 하나 이상, Chance는 항상)
+#   굴림이 2번 이상 남았을 때 중간 고정은 그 카테고리를 노리는 최선의 고정으로 가정한다
+# 테이블은 고정 조합(462개) × 13 카테고리이고, 조회는 32가지 고정 마스크의 고정 조합을 찾아 행을 읽기만 한다.
+
+Odds = namedtuple("Odds", "hit expected") # 각각 (32, 13) 배열: [위치 기준 고정 마스크, 카테고리]
+
+HIT = (SCORES > 0).astype(np.float64)
+_EXPECT = SCORES.astype(np.float64)
+
+def _stages(x):
+    # x: 굴림이 끝난 조합별 값 (252 × 13) -> 굴림 1/2/3회 남은 고정 조합별 값과 중간 최선 고정
+    keep, best = [None], [None]
+    r = x
+    for _ in range(3):
+        k = TRANSITION @ r                           # 462 × 13
+        keep.append(k)
+        cand = k[SUBKEEPS]                           # 252 × 32 × 13
+        best.append(SUBKEEPS[np.arange(NUM_MS)[:, None], cand.argmax(axis=1)]) # 252 × 13 고정 조합
+        r = cand.max(axis=1)
+    return keep, best
+
+HIT_KEEP, HIT_BEST = _stages(HIT)        # HIT_KEEP[n][k, c] = 고정 조합 k, 굴림 n회 남음 -> 성공 확률
+EXPECT_KEEP, _ = _stages(_EXPECT)
+
+_SORTED_MASKS = {} # 주사위 정렬 순서 -> 위치 기준 마스크 32개를 정렬 기준 마스크로
+
+def _sorted_masks(dice):
+    order = tuple(sorted(range(5), key=dice.__getitem__))
+    m = _SORTED_MASKS.get(order)
+    if m is None:
+        m = _SORTED_MASKS[order] = np.array([sum(1 << j for j, i in enumerate(order) if h >> i & 1) for h in range(32)])
+    return m
+
+def hold_mask(held):
+    return sum(1 << i for i, h in enumerate(held) if h)
+
+def keeps(dice):
+    # 위치 기준 고정 마스크 32개 각각에 대해 남는 고정 조합 인덱스
+    return SUBKEEPS[dice_key(dice), _sorted_masks(dice)]
+
+def position_odds(dice, rolls_left):
+    # 현재 주사위에서 32가지 고정 마스크 각각의 카테고리별 성공 확률/기대 점수
+    if rolls_left >= 3 or not all(dice):
+        return Odds(np.broadcast_to(HIT_KEEP[3][EMPTY_KEEP], (32, len(SCORE_CATS))),
+                    np.broadcast_to(EXPECT_KEEP[3][EMPTY_KEEP], (32, len(SCORE_CATS))))
+    d = dice_key(dice)
+    if rolls_left <= 0:
+        return Odds(np.broadcast_to(HIT[d], (32, len(SCORE_CATS))), np.broadcast_to(_EXPECT[d], (32, len(SCORE_CATS))))
+    k = SUBKEEPS[d, _sorted_masks(dice)]
+    return Odds(HIT_KEEP[rolls_left][k], EXPECT_KEEP[rolls_left][k])
+
+def category_odds(dice, held, rolls_left):
+    # 현재 고정 상태 그대로 굴릴 때의 (성공 확률, 기대 점수), 각각 13개 (SCORE_CATS 순서)
+    o = position_odds(dice, rolls_left)
+    h = hold_mask(held)
+    return o.hit[h], o.expected[h]
+
+def final_distribution(dice, held, rolls_left, cat=None):
+    # 남은 굴림을 모두 마쳤을 때 최종 조합(MULTISETS 순서 252개)의 확률 분포.
+    # 중간 고정은 cat을 노리는 최선의 고정, cat이 없으면 지금 고정한 주사위만 계속 고정한다
+    if rolls_left <= 0: return np.eye(NUM_MS)[dice_key(dice)]
+    k = EMPTY_KEEP if not all(dice) else KEEP_INDEX[tuple(sorted(d for d, h in zip(dice, held) if h))]
+    p = TRANSITION[k]
+    if cat is not None:
+        c = SCORE_CATS.index(cat)
+        for n in range(min(rolls_left, 3) - 1, 0, -1):
+            p = p @ TRANSITION[HIT_BEST[n][:, c]]
+    return p
+
+def best_holds(dice, rolls_left, cat):
+    # cat 성공 확률이 가장 높은 위치 기준 고정 마스크와 그 확률
+    hit = position_odds(dice, rolls_left).hit[:, SCORE_CATS.index(cat)]
+    h = int(hit.argmax())
+    return h, float(hit[h])
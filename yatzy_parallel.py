@@ -0,0 +1,77 @@
+import os, sys, time, argparse
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import yatzy_sim as sim
+from yatzy_scoring import NUM_CATS
+
+# --- 멀티코어 대량 시뮬레이션 ---
+# 게임 N개를 고정 크기 샤드로 나누어 ProcessPoolExecutor에 분배한다.
+# 샤드마다 SeedSequence(seed).spawn()으로 독립 난수 스트림을 받으므로,
+# 결과는 워커 수와 무관하게 항상 같다. 각 워커는 점수판을 pickle로 돌려주지 않고
+# 공유 메모리 버퍼(N × 13 int16)의 자기 구간에 직접 쓴다.
+
+SHARD_SIZE = 1 << 16
+
+def _run_shard(name, n, start, count, seed_seq, policy):
+    # 워커는 부모의 resource_tracker를 공유하므로 버퍼 삭제(unlink)는 부모가 한 번만 한다
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray((n, NUM_CATS), dtype=np.int16, buffer=shm.buf)
+        dice_seed, policy_seed = seed_seq.spawn(2)
+        # 값 테이블은 부모가 미리 준비하므로 워커는 열기만 한다 (동시에 계산하면 같은 파일에 쓰게 된다)
+        pol = sim.SolverPolicy(policy_seed, compute=False) if policy == "solver" else sim.POLICIES[policy](policy_seed)
+        out[start:start+count] = sim.play_batch(count, pol, np.random.default_rng(dice_seed))
+        del out
+    finally:
+        shm.close()
+    return count
+
+def run_parallel(n, workers=None, seed=0, policy="greedy", shard_size=SHARD_SIZE):
+    # n개 게임의 점수판(n × 13)을 반환. workers=None이면 CPU 코어 수만큼 사용
+    workers = workers or os.cpu_count() or 1
+    shards = [(s, min(shard_size, n - s)) for s in range(0, n, shard_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(shards))
+    if policy == "solver":
+        import yatzy_solver
+        yatzy_solver.load_values(compute=True) # 없으면 샤드를 나누기 전에 한 번만 계산
+    shm = shared_memory.SharedMemory(create=True, size=max(1, n * NUM_CATS * 2))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(_run_shard, shm.name, n, s, c, ss, policy) for (s, c), ss in zip(shards, seeds)]
+            for f in futures: f.result()
+        return np.ndarray((n, NUM_CATS), dtype=np.int16, buffer=shm.buf).copy()
+    finally:
+        shm.close(); shm.unlink()
+
+def bench(n, seed=0, policy="greedy", worker_counts=(1, 2, 4, 8), out=sys.stdout):
+    # 워커 수별 처리 시간과 확장 효율을 출력하고, 모든 결과가 동일한지 확인한다
+    base, ref = None, None
+    print(f"CPU 코어: {os.cpu_count()}  게임 수: {n}", file=out)
+    for w in worker_counts:
+        t0 = time.perf_counter()
+        sheets = run_parallel(n, w, seed, policy)
+        dt = time.perf_counter() - t0
+        base = base or dt
+        same = ref is None or np.array_equal(ref, sheets)
+        ref = sheets if ref is None else ref
+        print(f"  워커 {w}: {dt:6.2f}s  {n/dt*60:12,.0f} games/min  가속 {base/dt:4.2f}x  "
+              f"효율 {base/dt/w:5.1%}  결과 동일: {same}", file=out)
+    return ref
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description="Yatzy 멀티코어 시뮬레이션")
+    ap.add_argument("-n", "--games", type=int, default=1_000_000)
+    ap.add_argument("-w", "--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--policy", choices=sorted(sim.POLICIES), default="greedy")
+    ap.add_argument("--bench", action="store_true", help="워커 1/2/4/8개 확장성 측정")
+    args = ap.parse_args()
+    if args.bench:
+        sim.print_summary(sim.summarize(bench(args.games, args.seed, args.policy)))
+    else:
+        t0 = time.perf_counter()
+        sheets = run_parallel(args.games, args.workers, args.seed, args.policy)
+        dt = time.perf_counter() - t0
+        sim.print_summary(sim.summarize(sheets))
+        print(f"{dt:.2f}s ({args.games / dt * 60:,.0f} games/min)")
@@ -0,0 +1,129 @@
+import sys, json, time, threading
+from collections import deque, defaultdict
+
+# --- 프레임 프로파일러 (선택 사용) ---
+# 켜졌을 때만 대상 객체의 메서드를 인스턴스 단위로 감싸 구간 시간을 기록하므로, 꺼져 있으면 비용이 없다.
+#   instrument(obj, names, cat) : obj.name() 호출마다 (이름, 분류, 스레드, 시작, 끝) 기록
+#   end_frame(surf)             : 프레임 경계. 프레임 시간, 텍스트 렌더 수, 스레드 수, 할당 블록 증가량 집계
+#   draw_overlay(surf)          : 프레임 시간 히스토그램, p50/p99, 단계별 평균 표시
+#   watch(name, fn)             : 누적 카운터 fn()의 프레임당 증가량을 함께 기록
+#   dump(path)                  : Chrome trace JSON (chrome://tracing, Perfetto에서 열기)
+# 텍스트 렌더 수는 TextCache 미스 수(= 실제 font.render 호출)로 센다.
+
+PHASES = ("handle_events", "update", "draw") # 프레임 작업 시간 = 이 단계들의 합
+BUCKETS = (1, 2, 4, 8, 16, 33)               # 히스토그램 경계(ms), 마지막 칸은 33ms 초과
+
+class Profiler:
+    def __init__(self, text_cache=None, history=240, max_events=200_000):
+        self.text_cache = text_cache
+        self.events = deque(maxlen=max_events) # (이름, 분류, 스레드, 시작, 끝)
+        self.counters = deque(maxlen=max_events // 4) # (시각, {이름: 값})
+        self.frames = deque(maxlen=history)    # 프레임 작업 시간(ms)
+        self.phase_hist = defaultdict(lambda: deque(maxlen=history))
+        self.overlay = False
+        self._font = None
+        self.t0 = time.perf_counter()
+        self._main = threading.get_ident()
+        self._phase = defaultdict(float)
+        self._renders = self._render_count()
+        self._blocks = sys.getallocatedblocks()
+        self._watch = {} # 이름 -> [fn, 직전 값]
+        self.last = {}
+
+    # 계측
+    def instrument(self, obj, names, cat):
+        for name in names:
+            setattr(obj, name, self.wrap(getattr(obj, name), name, cat))
+
+    def wrap(self, fn, name, cat):
+        events, phase, main, clock = self.events, self._phase, self._main, time.perf_counter
+        def timed(*args, **kw):
+            t = clock()
+            try:
+                return fn(*args, **kw)
+            finally:
+                t2 = clock(); tid = threading.get_ident()
+                events.append((name, cat, tid, t, t2))
+                if tid == main: phase[name] += t2 - t
+        return timed
+
+    def watch(self, name, fn):
+        self._watch[name] = [fn, 0]
+
+    def _render_count(self):
+        return self.text_cache.misses if self.text_cache is not None else 0
+
+    def end_frame(self, surf=None):
+        work = sum(self._phase[p] for p in PHASES) * 1e3
+        self.frames.append(work)
+        for name, v in self._phase.items(): self.phase_hist[name].append(v * 1e3)
+        self._phase.clear()
+        renders, blocks = self._render_count(), sys.getallocatedblocks()
+        self.last = {"frame_ms": work, "font_renders": renders - self._renders,
+                     "threads": threading.active_count(), "alloc_blocks": blocks - self._blocks}
+        self._renders, self._blocks = renders, blocks
+        for name, w in self._watch.items():
+            v = w[0](); d = v - w[1]
+            self.last[name] = d if d >= 0 else v # 카운터가 처음부터 다시 세기 시작하면(새 게임) 현재 값이 증가량
+            w[1] = v
+        self.counters.append((time.perf_counter(), self.last))
+        if self.overlay and surf is not None: return self.draw_overlay(surf)
+
+    # 집계
+    def percentile(self, p):
+        if not self.frames: return 0.0
+        s = sorted(self.frames)
+        return s[min(len(s) - 1, int(len(s) * p / 100))]
+
+    def histogram(self):
+        counts = [0] * (len(BUCKETS) + 1)
+        for ms in self.frames:
+            counts[next((i for i, b in enumerate(BUCKETS) if ms < b), len(BUCKETS))] += 1
+        return counts
+
+    def stats(self):
+        return {"frames": len(self.frames), "p50_ms": self.percentile(50), "p99_ms": self.percentile(99),
+                "max_ms": max(self.frames, default=0.0),
+                "phase_mean_ms": {k: sum(v) / len(v) for k, v in self.phase_hist.items() if v}, **self.last}
+
+    # 화면 표시
+    def draw_overlay(self, surf, font=None):
+        # 왼쪽 위 반투명 패널. 그린 영역(Rect)을 반환
+        import pygame
+        if font is None:
+            font = self._font = self._font or pygame.font.Font(None, 18)
+        st = self.stats()
+        lines = [f"frame p50 {st['p50_ms']:.2f}  p99 {st['p99_ms']:.2f}  max {st['max_ms']:.2f} ms",
+                 f"font.render {st.get('font_renders', 0)}/frame  threads {st.get('threads', 0)}  alloc {st.get('alloc_blocks', 0):+d}"]
+        lines += [f"{k} {st.get(k, 0)}/frame" for k in self._watch]
+        lines += [f"{k:22s}{v:7.3f} ms" for k, v in sorted(st["phase_mean_ms"].items(), key=lambda kv: -kv[1])[:8]]
+        lh, w = font.get_linesize(), 330
+        hist = self.histogram()
+        rect = pygame.Rect(5, 5, w, 10 + lh * len(lines) + 70)
+        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, (255, 255, 255)), (6, 5 + i * lh))
+        top, bw, peak = 10 + lh * len(lines), (w - 12) // len(hist), max(hist) or 1
+        for i, n in enumerate(hist):
+            h = int(45 * n / peak)
+            pygame.draw.rect(panel, (80, 200, 120) if i < 4 else (230, 80, 60), (6 + i * bw, top + 45 - h, bw - 4, h))
+            label = f"<{BUCKETS[i]}" if i < len(BUCKETS) else f">{BUCKETS[-1]}"
+            panel.blit(font.render(label, True, (200, 200, 200)), (6 + i * bw, top + 48))
+        surf.blit(panel, rect)
+        pygame.display.update(rect)
+        return rect
+
+    # Chrome trace
+    def trace(self):
+        us = lambda t: (t - self.t0) * 1e6
+        ev = [{"name": n, "cat": c, "ph": "X", "ts": us(t), "dur": (t2 - t) * 1e6, "pid": 1, "tid": tid}
+              for n, c, tid, t, t2 in list(self.events)]
+        ev += [{"name": k, "ph": "C", "ts": us(t), "pid": 1, "args": {k: v}} for t, c in list(self.counters) for k, v in c.items()]
+        ev += [{"name": "thread_name", "ph": "M", "pid": 1, "tid": th.ident, "args": {"name": th.name}}
+               for th in threading.enumerate()]
+        return {"traceEvents": ev, "displayTimeUnit": "ms"}
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f: json.dump(self.trace(), f)
+        return path
@@ -0,0 +1,80 @@
+import pygame
+
+# --- 변경 영역(dirty rect) 렌더링 ---
+# 화면을 "항목" 목록으로 표현한다: (키, 영역 Rect, 내용 서명, 그리기 함수)
+# 이전 프레임과 서명이나 영역이 달라진 항목만 다시 그리고, 그 영역 목록을 돌려준다.
+# 다시 그릴 때는 영역으로 clip을 걸고 정적 배경을 복원한 뒤, 그 영역에 걸치는 항목을
+# 원래 그리기 순서대로 모두 다시 그리므로 겹치는 항목도 전체 다시 그리기와 같은 결과가 된다.
+# 그리기 함수는 반드시 자신의 영역 안에만 그려야 한다.
+
+class DirtyCompositor:
+    def __init__(self):
+        self.prev = None # 키 -> (영역, 서명)
+
+    def invalidate(self):
+        # 다음 프레임은 화면 전체를 다시 그린다 (상태 전환, 창 노출 등)
+        self.prev = None
+
+    def frame(self, surf, background, items):
+        cur = {key: (rect, sig) for key, rect, sig, _ in items}
+        if self.prev is None:
+            dirty = [surf.get_rect()]
+        else:
+            dirty = []
+            for key, (rect, sig) in cur.items():
+                old = self.prev.get(key)
+                if old == (rect, sig): continue
+                dirty.append(rect)
+                if old is not None and old[0] != rect: dirty.append(old[0])
+            dirty += [old[0] for key, old in self.prev.items() if key not in cur]
+        self.prev = cur
+        dirty = merge_rects(dirty)
+        for r in dirty:
+            surf.set_clip(r)
+            surf.blit(background, r, r)
+            for _, rect, _, draw in items:
+                if rect.colliderect(r): draw()
+        surf.set_clip(None)
+        return dirty
+
+def merge_rects(rects):
+    # 겹치는 영역을 합쳐 같은 픽셀을 두 번 그리지 않도록 한다
+    out = []
+    for r in rects:
+        r = pygame.Rect(r)
+        merged = True
+        while merged:
+            merged = False
+            for i, o in enumerate(out):
+                if o.colliderect(r):
+                    r = r.union(out.pop(i)); merged = True
+                    break
+        out.append(r)
+    return out
+
+# --- 주사위 스프라이트 아틀라스 ---
+# 눈 0~6 × (보통, 고정) 14칸을 가로 한 줄 Surface에 draw_die(surf, 눈, rect, 고정)로 한 번만 그려 두고,
+# 이후에는 주사위 줄 하나를 Surface.blits 한 번으로 찍는다 (눈 0은 테두리만).
+# 바탕은 colorkey로 투명 처리하므로 프리미티브로 직접 그린 것과 같은 픽셀이 된다.
+
+class DiceAtlas:
+    KEY = (255, 0, 255) # 투명색: 주사위 그림에 쓰지 않는 색
+
+    def __init__(self, size, draw_die):
+        self.size = size
+        surf = pygame.Surface((size * 14, size))
+        surf.fill(self.KEY)
+        self.areas = [[pygame.Rect((h * 7 + v) * size, 0, size, size) for v in range(7)] for h in (0, 1)]
+        for h in (0, 1):
+            for v in range(7):
+                surf.set_clip(self.areas[h][v]); draw_die(surf, v, self.areas[h][v].copy(), bool(h))
+        surf.set_clip(None)
+        if pygame.display.get_surface() is not None: surf = surf.convert()
+        surf.set_colorkey(self.KEY) # RLEACCEL은 측정해 보니 더 느렸다
+        self.surf = surf
+
+    def row(self, x, y, spacing, dice, held):
+        # 주사위 줄 하나의 blits 목록 (눈이 1~6이 아니면 빈 주사위)
+        areas = self.areas
+        return [(self.surf, (x + i * spacing, y), areas[h][v if 0 < v < 7 else 0])
+                for i, (v, h) in enumerate(zip(dice, held))]
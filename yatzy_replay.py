@@ -0,0 +1,296 @@
+import os, sys, json, gzip, time, zlib, random
+
+# --- 입력 녹화/재생 하네스 ---
+# 녹화: 프레임마다 이벤트, 마우스 위치, 시각(프레임 안에서는 고정)과 작업 스레드에서 도착한 조언/AI 결과(poll이
+#       값을 돌려준 프레임)를 기록한다. 새 게임 엔진과 화면용 난수의 seed는 세션 seed에서 뽑으므로,
+#       게임 밖에서 들어오는 값은 전부 세션 파일에 있다.
+# 재생: SDL dummy 드라이버에서 clock.tick 없이 최대 속도로 같은 입력을 넣고, 프레임마다 화면 해시(CRC32)와
+#       frame() 시간을 남긴다. 같은 코드면 해시가 같으므로 두 재생 결과를 비교해 화면 회귀와 프레임 시간 변화를 본다.
+# 세션 파일: JSON 줄 (.gz면 gzip). 첫 줄은 헤더 {"version", "seed", "size", "advice", "dice_anim", "pygame"},
+#   이후 프레임마다 {"t": 시각, "m": [x, y], "e": [[종류, 속성], ...], "r": {"advice": 조언, "bots": AI 동작}}
+#   ("e", "r"는 비어 있으면 생략)
+#   python yatzy_replay.py record session.jsonl.gz       # 창을 띄워 직접 플레이하며 녹화 (창을 닫으면 끝)
+#   python yatzy_replay.py synth -n 1000 -o sessions     # 무작위 클릭 세션 생성 (헤드리스)
+#   python yatzy_replay.py replay sessions/*.gz -o after.json
+#   python yatzy_replay.py compare before.json after.json
+
+VERSION = 1
+FRAME_MS = 1000 / 60 # 합성 세션의 프레임 간격
+
+def _game(headless=True):
+    # 저장/통계/조언 캐시를 쓰지 않도록 환경을 정한 뒤 게임 모듈을 import한다
+    if headless: os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.environ.update(YATZY_SAVE=os.path.join(os.devnull, "save"), YATZY_ARCHIVE=os.path.join(os.devnull, "archive"),
+                      YATZY_HISTORY=os.path.join(os.devnull, "history"), YATZY_ADVICE_CACHE="", YATZY_PROFILE="0")
+    import yatzy_advice_4
+    return yatzy_advice_4
+
+def _plain(v):
+    return v is None or isinstance(v, (int, float, str)) or isinstance(v, (tuple, list)) and all(map(_plain, v))
+
+def encode_event(e):
+    return [e.type, {k: v for k, v in e.dict.items() if _plain(v)}]
+
+def decode_event(rec):
+    import pygame
+    return pygame.event.Event(rec[0], rec[1])
+
+def _wait_hints(g, timeout=60):
+    # 최적 해법 추천은 값 테이블 로딩 여부에 따라 달라지므로 로딩이 끝날 때까지 기다린다
+    end = time.perf_counter() + timeout
+    while g.hints is not None and g.hints._loading and time.perf_counter() < end: time.sleep(0.01)
+
+# --- 세션 파일 ---
+def save(path, header, frames):
+    with (gzip.open if path.endswith(".gz") else open)(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        for fr in frames: f.write(json.dumps(fr, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+def load(path):
+    with (gzip.open if path.endswith(".gz") else open)(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != VERSION: raise ValueError(f"{path}: 세션 버전 {header.get('version')}")
+        return header, [json.loads(line) for line in f]
+
+class Session:
+    # 녹화/재생 공통: 게임의 입력·시각·seed 출처를 현재 프레임 기록으로 바꿔 끼운다
+    def __init__(self, header, frames=None):
+        self.header, self.frames = header, [] if frames is None else frames
+        self.seeds = random.Random(header["seed"])
+        self.cur = {"t": 0, "m": [0, 0]}
+
+    def attach(self, g):
+        g.mouse_pos = lambda: tuple(self.cur["m"])
+        g.ticks = lambda: self.cur["t"]
+        g.new_seed = lambda: self.seeds.getrandbits(64)
+        g.events = self.events
+        g.reset() # 바꿔 끼운 시각/seed로 처음 상태를 다시 만든다
+
+class Tap:
+    # 녹화: poll()이 돌려준 결과를 현재 프레임 기록에 남긴다. 나머지 속성은 원래 객체로
+    def __init__(self, inner, session, name): self.inner, self.session, self.name = inner, session, name
+    def __getattr__(self, name): return getattr(self.inner, name)
+    def poll(self, token):
+        r = self.inner.poll(token)
+        if r is not None:
+            r = json.loads(json.dumps(r)) # 재생 때와 같은 값(튜플 -> 리스트)을 게임에 넘긴다
+            self.session.cur.setdefault("r", {})[self.name] = r
+        return r
+
+class Feed:
+    # 재생: 기록된 프레임의 결과만 돌려준다 (요청/취소/작업 스레드 없음)
+    pending = None
+    def __init__(self, session, name): self.session, self.name = session, name
+    def start(self): return self
+    def request(self, *args): pass
+    def cancel(self): pass
+    def stop(self, timeout=None): pass
+    def shutdown(self): pass
+    def poll(self, token): return self.session.cur.get("r", {}).get(self.name)
+
+class Recorder(Session):
+    # source: 프레임마다 (시각, 마우스 위치, 이벤트 목록)을 돌려주는 함수 (실제 입력 또는 합성 입력)
+    def __init__(self, header, source):
+        super().__init__(header)
+        self.source = source
+
+    def attach(self, g):
+        g.advice_client = Tap(g.advice_client, self, "advice")
+        g.bots = Tap(g.bots, self, "bots")
+        super().attach(g)
+
+    def begin(self):
+        t, m, evs = self.source()
+        self.cur = {"t": t, "m": list(m)}
+        if evs: self.cur["e"] = [encode_event(e) for e in evs]
+        self.frames.append(self.cur)
+
+    def events(self):
+        return [decode_event(r) for r in self.cur.get("e", ())] # 재생 때와 같은 Event (기록되는 속성만)
+
+class Replayer(Session):
+    def attach(self, g):
+        g.advice_client.stop(0); g.advice_client = Feed(self, "advice")
+        g.bots.shutdown(); g.bots = Feed(self, "bots")
+        super().attach(g)
+
+    def events(self):
+        import pygame
+        evs = [decode_event(r) for r in self.cur.get("e", ())]
+        for e in evs:
+            if e.type == pygame.VIDEORESIZE: pygame.display.set_mode((e.w, e.h)) # dummy 창도 같은 크기로
+        return evs
+
+def new_header(y, seed):
+    import pygame
+    return {"version": VERSION, "seed": seed, "size": [y.SCREEN_WIDTH, y.SCREEN_HEIGHT], "advice": y.ADVICE_SOURCE,
+            "dice_anim": y.DICE_ANIM, "pygame": pygame.version.ver}
+
+# --- 녹화 ---
+def record(path, seed=None):
+    import pygame
+    y = _game(headless=False)
+    g = y.Game()
+    seed = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+    live = lambda: (pygame.time.get_ticks(), pygame.mouse.get_pos(), pygame.event.get())
+    rec = Recorder(new_header(y, seed), live)
+    rec.begin(); rec.attach(g); _wait_hints(g)
+    try:
+        while g.frame():
+            g.clock.tick(60); rec.begin()
+    finally:
+        g.close()
+        save(path, rec.header, rec.frames)
+    return len(rec.frames)
+
+# --- 합성 세션 (무작위 클릭) ---
+class Monkey:
+    # 몇 프레임마다 현재 화면의 클릭 대상(버튼, 입력 상자, 주사위, 점수판 행) 하나로 마우스를 옮기고 다음 프레임에 클릭한다
+    def __init__(self, g, rng, frames):
+        self.g, self.rng, self.left = g, rng, frames
+        self.t, self.mouse, self.click, self.wait = 0.0, (0, 0), False, 0
+
+    def targets(self):
+        g = self.g; L = g._layout(); st = g.state
+        if st == "MODE_SELECTION": return [L.buttons[k] for k in ("1p", "2p", "2p", "how_to_play")]
+        if st == "HOW_TO_PLAY": return [L.buttons["back_to_menu"]]
+        if st == "NAME_INPUT": return L.inputs + [L.buttons[k] for k in ("ai", "ai", "start", "start", "start")]
+        if st == "GAME_OVER": return [L.buttons["play_again"]]
+        P = L.panels[g._cur_panel()]
+        return [L.buttons["roll"]] * 6 + P.dice + P.rows + [L.buttons["restart"]] * (self.rng.random() < 0.02)
+
+    def __call__(self):
+        import pygame
+        rng, evs = self.rng, []
+        self.t += FRAME_MS; self.left -= 1
+        if self.left <= 0:
+            evs.append(pygame.event.Event(pygame.QUIT))
+        elif self.click:
+            self.click = False
+            evs += [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=self.mouse, button=1),
+                    pygame.event.Event(pygame.MOUSEBUTTONUP, pos=self.mouse, button=1)]
+        elif self.wait > 0:
+            self.wait -= 1
+            if self.g.state == "NAME_INPUT" and self.g.active_input != -1 and rng.random() < 0.2:
+                evs.append(pygame.event.Event(pygame.TEXTINPUT, text=rng.choice("abcdefg가나다")))
+        else:
+            r = rng.choice(self.targets())
+            self.mouse = (rng.randrange(r.left, r.right), rng.randrange(r.top, r.bottom))
+            self.click, self.wait = True, rng.randrange(2, 12)
+        return int(self.t), self.mouse, evs
+
+class CannedAdvice:
+    # 합성 세션용 조언: 요청하면 다음 poll에 정해진 문구 중 하나를 돌려준다 (결과는 Tap이 기록)
+    pending = None
+    TEXTS = ("Measure twice, cut once.", "Don't count your chickens before they hatch.", "Fortune favours the bold.")
+    def __init__(self, rng): self.rng, self.token = rng, None
+    def start(self): return self
+    def stop(self, timeout=None): pass
+    def cancel(self): self.token = None
+    def request(self, token): self.token = token
+    def poll(self, token):
+        if token != self.token: return None
+        self.token = None
+        return self.rng.choice(self.TEXTS)
+
+def synth(out_dir, n, frames=900, seed=0):
+    y = _game()
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for i in range(n):
+        rng = random.Random(seed * 1_000_003 + i)
+        g = y.Game()
+        g.advice_client.stop(0); g.advice_client = CannedAdvice(random.Random(rng.getrandbits(64)))
+        monkey = Monkey(g, rng, frames)
+        rec = Recorder(new_header(y, rng.getrandbits(64)), monkey)
+        rec.begin(); rec.attach(g); _wait_hints(g)
+        while g.frame():
+            if g.state == "PLAYING" and g.turn in g.ai:
+                time.sleep(0.001) # AI 작업 스레드가 결과를 낼 시간
+            rec.begin()
+        g.close()
+        path = os.path.join(out_dir, f"session_{seed}_{i:05d}.jsonl.gz")
+        save(path, rec.header, rec.frames); paths.append(path)
+    return paths
+
+# --- 재생 ---
+def replay(path, render=None, hashes=True):
+    # 세션 하나를 최대 속도로 재생 -> {"frames", "ms": 프레임별 frame() 시간, "hash": 프레임별 화면 CRC32}
+    import pygame
+    header, frames = load(path)
+    y = _game()
+    y.ADVICE_SOURCE, y.DICE_ANIM = header["advice"], header["dice_anim"]
+    size = tuple(header["size"])
+    if y.SCREEN is None: y.SCREEN_WIDTH, y.SCREEN_HEIGHT = size
+    g = y.Game()
+    if y.SCREEN.get_size() != size: pygame.display.set_mode(size); g.resize(*size)
+    if render: g.render_mode = render
+    pygame.event.clear()
+    rep = Replayer(header, frames)
+    rep.cur = frames[0] # 녹화 때처럼 첫 프레임 기록으로 처음 상태를 만든다
+    rep.attach(g); _wait_hints(g)
+    ms, hs, clock = [], [], time.perf_counter
+    for fr in frames:
+        rep.cur = fr
+        t = clock(); running = g.frame(); ms.append((clock() - t) * 1e3)
+        if hashes: hs.append(zlib.crc32(y.SCREEN.get_buffer()))
+        if not running: break
+    g.close()
+    return {"frames": len(ms), "ms": ms, "hash": hs}
+
+def _pct(xs, p):
+    s = sorted(xs)
+    return s[min(len(s) - 1, int(len(s) * p))] if s else 0.0
+
+def compare(a, b, out=sys.stdout):
+    # 화면 해시가 처음 달라진 프레임(세션별)과 전체 프레임 시간 분포 비교. 달라진 세션이 있으면 1
+    diff = 0
+    for k in sorted(set(a) & set(b)):
+        ha, hb = a[k]["hash"], b[k]["hash"]
+        first = next((i for i, (x, y) in enumerate(zip(ha, hb)) if x != y), None if len(ha) == len(hb) else min(len(ha), len(hb)))
+        if first is not None:
+            diff += 1
+            print(f"  화면 다름: {k} 프레임 {first}", file=out)
+    ma = [x for k in a for x in a[k]["ms"]]; mb = [x for k in b for x in b[k]["ms"]]
+    for name, p in (("p50", 0.5), ("p99", 0.99)):
+        x, y = _pct(ma, p), _pct(mb, p)
+        print(f"  frame {name} {x:8.3f} -> {y:8.3f} ms  {(y / x - 1) * 100 if x else 0:+6.1f}%", file=out)
+    print(f"세션 {len(set(a) & set(b))}개 중 화면 다름 {diff}개", file=out)
+    return 1 if diff else 0
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="입력 녹화/재생 하네스 (화면 해시와 프레임 시간)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("record", help="직접 플레이하며 녹화"); r.add_argument("path"); r.add_argument("--seed", type=int)
+    s = sub.add_parser("synth", help="무작위 클릭 세션 생성")
+    s.add_argument("-n", type=int, default=10); s.add_argument("-o", "--out", default="sessions")
+    s.add_argument("--frames", type=int, default=900); s.add_argument("--seed", type=int, default=0)
+    p = sub.add_parser("replay", help="헤드리스 최대 속도 재생")
+    p.add_argument("paths", nargs="+"); p.add_argument("-o", "--output")
+    p.add_argument("--render", choices=("full", "dirty")); p.add_argument("--no-hash", action="store_true")
+    c = sub.add_parser("compare", help="두 재생 결과 비교"); c.add_argument("a"); c.add_argument("b")
+    args = ap.parse_args(argv)
+    if args.cmd == "record":
+        print(f"{record(args.path, args.seed)}프레임 녹화: {args.path}")
+    elif args.cmd == "synth":
+        t = time.perf_counter(); paths = synth(args.out, args.n, args.frames, args.seed)
+        print(f"세션 {len(paths)}개 생성 ({time.perf_counter() - t:.1f}s): {args.out}")
+    elif args.cmd == "replay":
+        results, t = {}, time.perf_counter()
+        for path in args.paths:
+            results[os.path.basename(path)] = res = replay(path, args.render, not args.no_hash)
+            print(f"  {os.path.basename(path)}: {res['frames']}프레임  p50 {_pct(res['ms'], 0.5):.3f}  "
+                  f"p99 {_pct(res['ms'], 0.99):.3f} ms", file=sys.stderr)
+        el, n = time.perf_counter() - t, sum(r["frames"] for r in results.values())
+        print(f"세션 {len(results)}개, {n}프레임, {el:.1f}s ({n / el:,.0f} 프레임/s)")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f: json.dump(results, f)
+    else:
+        with open(args.a, encoding="utf-8") as f: a = json.load(f)
+        with open(args.b, encoding="utf-8") as f: b = json.load(f)
+        sys.exit(compare(a, b))
+
+if __name__ == '__main__':
+    main()
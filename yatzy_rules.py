@@ -0,0 +1,209 @@
+import time, random
+from functools import lru_cache
+from itertools import combinations_with_replacement
+
+# --- 규칙 변형 (선언형 규칙 집합 -> 사전 계산 점수표) ---
+# 규칙 집합은 주사위 수, Upper 보너스(기준, 점수), 카테고리 목록 [이름, 종류, 인자...]만 적은 데이터다.
+# load()가 처음 불릴 때 그 주사위 수의 모든 조합(5개 252, 6개 462)에 대해 카테고리 점수를 한 번 계산해
+# 표로 만들고, 이후 점수 계산은 정렬된 주사위 -> 조합 인덱스 -> 행 조회뿐이다. 변형을 추가해도 실행 중 비용은 없다.
+# 카테고리 종류 (점수: "total"=주사위 전체 합, "sum"=조합을 이루는 주사위의 합(가장 큰 것), 정수=고정 점수):
+#   ["upper", 눈]              해당 눈의 합
+#   ["kind", n, 점수]          같은 눈 n개 이상
+#   ["pairs", k]               서로 다른 눈의 페어 k개 (높은 페어부터, 페어 합)
+#   ["house", a, b, 점수]      서로 다른 두 눈이 각각 a개, b개 이상 (풀하우스, 6개 주사위의 3+3, 4+2)
+#   ["run", 길이, 점수]        연속된 눈 길이개
+#   ["faces", [눈...], 점수]   주어진 눈을 모두 포함 (스칸디나비아식 스트레이트)
+#   ["chance"]                 주사위 전체 합
+# "joker": Yahtzee 조커 규칙. Yahtzee 칸이 채워진 뒤 또 Yahtzee가 나오면 (50점으로 채웠을 때) bonus점을 더 받고,
+#   같은 눈의 Upper 칸이 비었으면 거기에만, 채워졌으면 빈 Lower 칸(없으면 아무 빈 칸)에 기록하며
+#   "fixed" 칸은 조합과 무관하게 선언된 고정 점수를 받는다. 조커 점수도 조합별 행으로 미리 만들어 둔다.
+
+RULESETS = {
+    "standard": {
+        "dice": 5, "bonus": [63, 35],
+        "categories": [
+            ["Aces", "upper", 1], ["Twos", "upper", 2], ["Threes", "upper", 3],
+            ["Fours", "upper", 4], ["Fives", "upper", 5], ["Sixes", "upper", 6],
+            ["3 of a Kind", "kind", 3, "total"], ["4 of a Kind", "kind", 4, "total"],
+            ["Full House", "house", 3, 2, 25], ["Small Straight", "run", 4, 30], ["Large Straight", "run", 5, 40],
+            ["Yatzy", "kind", 5, 50], ["Chance", "chance"]]},
+    "scandinavian": {
+        "dice": 5, "bonus": [63, 50],
+        "categories": [
+            ["Aces", "upper", 1], ["Twos", "upper", 2], ["Threes", "upper", 3],
+            ["Fours", "upper", 4], ["Fives", "upper", 5], ["Sixes", "upper", 6],
+            ["One Pair", "pairs", 1], ["Two Pairs", "pairs", 2],
+            ["3 of a Kind", "kind", 3, "sum"], ["4 of a Kind", "kind", 4, "sum"],
+            ["Small Straight", "faces", [1, 2, 3, 4, 5], "sum"], ["Large Straight", "faces", [2, 3, 4, 5, 6], "sum"],
+            ["Full House", "house", 3, 2, "sum"], ["Chance", "chance"], ["Yatzy", "kind", 5, 50]]},
+    "yahtzee": {
+        "dice": 5, "bonus": [63, 35],
+        "joker": {"category": "Yahtzee", "bonus": 100, "fixed": ["Full House", "Small Straight", "Large Straight"]},
+        "categories": [
+            ["Ones", "upper", 1], ["Twos", "upper", 2], ["Threes", "upper", 3],
+            ["Fours", "upper", 4], ["Fives", "upper", 5], ["Sixes", "upper", 6],
+            ["3 of a Kind", "kind", 3, "total"], ["4 of a Kind", "kind", 4, "total"],
+            ["Full House", "house", 3, 2, 25], ["Small Straight", "run", 4, 30], ["Large Straight", "run", 5, 40],
+            ["Yahtzee", "kind", 5, 50], ["Chance", "chance"]]},
+    "maxi": {
+        "dice": 6, "bonus": [84, 50],
+        "categories": [
+            ["Aces", "upper", 1], ["Twos", "upper", 2], ["Threes", "upper", 3],
+            ["Fours", "upper", 4], ["Fives", "upper", 5], ["Sixes", "upper", 6],
+            ["One Pair", "pairs", 1], ["Two Pairs", "pairs", 2], ["Three Pairs", "pairs", 3],
+            ["3 of a Kind", "kind", 3, "sum"], ["4 of a Kind", "kind", 4, "sum"], ["5 of a Kind", "kind", 5, "sum"],
+            ["Small Straight", "faces", [1, 2, 3, 4, 5], "sum"], ["Large Straight", "faces", [2, 3, 4, 5, 6], "sum"],
+            ["Full Straight", "faces", [1, 2, 3, 4, 5, 6], "sum"],
+            ["Full House", "house", 3, 2, "sum"], ["Castle", "house", 3, 3, "sum"], ["Tower", "house", 4, 2, "sum"],
+            ["Chance", "chance"], ["Maxi Yatzy", "kind", 6, 100]]},
+}
+
+# --- 카테고리 종류별 점수 함수: (눈별 개수 c[1..6], 전체 합 s, 인자...) -> 점수 ---
+def _points(pts, total, used):
+    return total if pts == "total" else used if pts == "sum" else pts
+
+def _upper(c, s, face): return c[face] * face
+
+def _kind(c, s, n, pts):
+    f = next((f for f in range(6, 0, -1) if c[f] >= n), 0)
+    return _points(pts, s, n * f) if f else 0
+
+def _pairs(c, s, k):
+    faces = [f for f in range(6, 0, -1) if c[f] >= 2]
+    return 2 * sum(faces[:k]) if len(faces) >= k else 0
+
+def _house(c, s, a, b, pts):
+    xs, ys = [x for x in range(1, 7) if c[x] >= a], [y for y in range(1, 7) if c[y] >= b]
+    used = max((a * x + b * y for x in xs for y in ys if x != y), default=0) if xs and ys else 0
+    return _points(pts, s, used) if used else 0
+
+def _run(c, s, n, pts):
+    # 가장 높은 연속 구간
+    streak = top = 0
+    for f in range(1, 7):
+        streak = streak + 1 if c[f] else 0
+        if streak >= n: top = f
+    return _points(pts, s, n * top - n * (n - 1) // 2) if top else 0
+
+def _faces(c, s, faces, pts):
+    return _points(pts, s, sum(faces)) if all(c[f] for f in faces) else 0
+
+def _chance(c, s): return s
+
+KINDS = {"upper": _upper, "kind": _kind, "pairs": _pairs, "house": _house, "run": _run, "faces": _faces, "chance": _chance}
+
+class Rules:
+    # 컴파일된 규칙 집합. rows[i] = multisets[i]의 카테고리별 점수 (cats 순서), table = 같은 값의 bytes (행 우선)
+    def __init__(self, name, spec):
+        self.name, self.dice = name, spec["dice"]
+        cats = spec["categories"]
+        self.cats = tuple(c[0] for c in cats)
+        if len(set(self.cats)) != len(self.cats): raise ValueError(f"{name}: 카테고리 이름 중복")
+        for c in cats:
+            if c[1] not in KINDS: raise ValueError(f"{name}: 알 수 없는 카테고리 종류 {c[1]!r} ({c[0]})")
+        self.cat_index = {c: i for i, c in enumerate(self.cats)}
+        self.upper = {c[0]: c[2] for c in cats if c[1] == "upper"}
+        self.bonus = tuple(spec.get("bonus", (0, 0))) # (Upper 기준, 보너스 점수)
+        self.multisets = list(combinations_with_replacement(range(1, 7), self.dice))
+        self.index = {m: i for i, m in enumerate(self.multisets)}
+        fns = [(KINDS[c[1]], c[2:]) for c in cats]
+        self.rows = [self._row(m, fns) for m in self.multisets]
+        self.zero = (0,) * len(self.cats) # 굴리기 전
+        self.max_scores = {c: max(col) for c, col in zip(self.cats, zip(*self.rows))} # 칸별 최대 점수
+        if max(self.max_scores.values()) > 255: raise ValueError(f"{name}: 칸 점수는 255점 이하여야 한다")
+        self.table = bytes(x for r in self.rows for x in r)
+        self.joker, self.joker_rows = spec.get("joker"), {}
+        if self.joker:
+            j = self.joker
+            if j["category"] not in self.cat_index: raise ValueError(f"{name}: 조커 칸 {j['category']!r} 없음")
+            fixed = {self.cat_index[c]: cats[self.cat_index[c]][-1] for c in j["fixed"]}
+            for i, m in enumerate(self.multisets):
+                if m[0] == m[-1]:
+                    self.joker_rows[i] = tuple(fixed.get(k, v) for k, v in enumerate(self.rows[i]))
+
+    @staticmethod
+    def _row(m, fns):
+        c = [0] * 7
+        for d in m: c[d] += 1
+        s = sum(m)
+        return tuple(fn(c, s, *args) for fn, args in fns)
+
+    def key(self, dice):
+        # 정렬된 조합 인덱스 (굴리지 않은 주사위가 있으면 None)
+        return self.index.get(tuple(sorted(dice)))
+
+    def score_vector(self, dice):
+        i = self.index.get(tuple(sorted(dice)))
+        return self.rows[i] if i is not None else self.zero
+
+    def score(self, cat, dice):
+        return self.score_vector(dice)[self.cat_index[cat]]
+
+    def turn(self, dice, scores):
+        # 이번 굴림으로 (카테고리별 점수, 기록할 수 있는 칸, 추가 보너스). scores: 칸 -> 점수 (None = 빈 칸)
+        i = self.index.get(tuple(sorted(dice)))
+        row = self.rows[i] if i is not None else self.zero
+        open_ = [c for c in self.cats if scores.get(c) is None]
+        j = self.joker
+        if not j or i not in self.joker_rows or scores.get(j["category"]) is None: return row, open_, 0
+        extra = j["bonus"] if scores[j["category"]] > 0 else 0
+        up = next(c for c, f in self.upper.items() if f == self.multisets[i][0])
+        if scores.get(up) is None: return row, [up], extra
+        return self.joker_rows[i], [c for c in open_ if c not in self.upper] or open_, extra
+
+    def upper_bonus(self, scores):
+        return self.bonus[1] if sum(scores.get(c) or 0 for c in self.upper) >= self.bonus[0] else 0
+
+    def total(self, scores, extra=0):
+        return sum(v for v in scores.values() if v is not None) + self.upper_bonus(scores) + extra
+
+@lru_cache(maxsize=None)
+def load(name="standard"):
+    # 내장 규칙 이름 또는 같은 형식의 JSON 파일 경로
+    if name in RULESETS: return Rules(name, RULESETS[name])
+    import json
+    with open(name, encoding="utf-8") as f: return Rules(name, json.load(f))
+
+# --- 변형 규칙 greedy 시뮬레이션 ---
+# 가장 많이 나온 눈(같으면 높은 눈)을 남기고 두 번 다시 굴린 뒤, 기록할 수 있는 칸 중 점수가 가장 높은 칸에
+# 기록한다 (모두 0점이면 최대 점수가 가장 낮은 칸을 버린다). 점수 계산은 전부 표 조회다.
+def play(rules, rng):
+    scores, extra, n = dict.fromkeys(rules.cats), 0, rules.dice
+    for _ in rules.cats:
+        dice = [rng.randint(1, 6) for _ in range(n)]
+        for _ in range(2):
+            keep = max(range(1, 7), key=lambda f: (dice.count(f), f))
+            dice = [d if d == keep else rng.randint(1, 6) for d in dice]
+        row, allowed, bonus = rules.turn(dice, scores)
+        extra += bonus
+        cat = max(allowed, key=lambda c: (row[rules.cat_index[c]], -rules.max_scores[c]))
+        scores[cat] = row[rules.cat_index[cat]]
+    return rules.total(scores, extra)
+
+def simulate(rules, n, seed=0):
+    rng = random.Random(seed)
+    return [play(rules, rng) for _ in range(n)]
+
+def main(argv=None):
+    import argparse # 점수 모듈이 import할 때 불필요한 비용을 피한다
+    ap = argparse.ArgumentParser(description="규칙 변형 점수표 컴파일과 greedy 시뮬레이션")
+    ap.add_argument("--rules", nargs="+", default=list(RULESETS), help="내장 규칙 이름 또는 JSON 파일")
+    ap.add_argument("-n", "--games", type=int, default=10_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    for name in args.rules:
+        t = time.perf_counter(); r = load(name); build = time.perf_counter() - t
+        rng = random.Random(args.seed)
+        rolls = [[rng.randint(1, 6) for _ in range(r.dice)] for _ in range(10_000)]
+        t = time.perf_counter()
+        for d in rolls: r.score_vector(d)
+        lookup = (time.perf_counter() - t) / len(rolls)
+        t = time.perf_counter(); totals = simulate(r, args.games, args.seed); el = time.perf_counter() - t
+        mean = sum(totals) / len(totals)
+        sd = (sum((x - mean) ** 2 for x in totals) / max(1, len(totals) - 1)) ** 0.5
+        print(f"{r.name:13s} 주사위 {r.dice}  칸 {len(r.cats):2d}  조합 {len(r.multisets)}  표 {len(r.table)} B "
+              f"(생성 {build * 1e3:.1f} ms)  조회 {lookup * 1e9:.0f} ns  "
+              f"greedy 평균 {mean:.1f} ± {sd:.1f}  ({args.games / el:,.0f} 게임/s)")
+
+if __name__ == '__main__':
+    main()
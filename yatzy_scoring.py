@@ -0,0 +1,52 @@
+from collections import Counter
+from itertools import permutations
+from yatzy_rules import load
+
+# --- 규칙 상수 (yatzy_rules의 "standard" 규칙 집합에서 가져온다) ---
+STANDARD = load("standard")
+SCORE_CATS = list(STANDARD.cats)
+UPPER_MAP = dict(STANDARD.upper)
+SMALL_STRAIGHTS = [{1,2,3,4},{2,3,4,5},{3,4,5,6}]
+CAT_INDEX = {c:i for i,c in enumerate(SCORE_CATS)}
+
+# --- 점수 계산 (기준 구현) ---
+def calc_score(cat, dice):
+    cnt = Counter(dice)
+    sset, ssum = set(dice), sum(dice)
+    if cat in UPPER_MAP: return sum(d for d in dice if d==UPPER_MAP[cat])
+    if cat == "3 of a Kind" and any(c>=3 for c in cnt.values()): return ssum
+    if cat == "4 of a Kind" and any(c>=4 for c in cnt.values()): return ssum
+    if cat == "Full House" and sorted(cnt.values()) == [2,3]: return 25
+    if cat == "Small Straight" and any(st.issubset(sset) for st in SMALL_STRAIGHTS): return 30
+    if cat == "Large Straight" and sorted(dice) in ([1,2,3,4,5],[2,3,4,5,6]): return 40
+    if cat == "Yatzy" and len(cnt)==1 and dice[0]!=0: return 50
+    if cat == "Chance": return ssum
+    return 0
+
+# --- 점수표 (252개 주사위 조합 × 13 카테고리) ---
+# 정렬된 주사위 조합을 0..251 인덱스로 정규화하고, 카테고리별 점수를 bytes 한 덩어리에 보관한다.
+# 최대 점수가 50점이므로 칸당 1바이트로 충분하다. 표는 규칙 집합을 컴파일한 결과이며 calc_score와 같다.
+MULTISETS = STANDARD.multisets
+NUM_CATS = len(SCORE_CATS)
+SCORE_TABLE = STANDARD.table
+
+# 순서 있는 7776가지 굴림 -> 조합 인덱스 (정렬 없이 사전 조회 한 번으로 정규화)
+_ROLL_INDEX = {r:i for i,m in enumerate(MULTISETS) for r in set(permutations(m))}
+_ROWS = STANDARD.rows
+# 굴리기 전 상태([0]*5)는 모든 카테고리가 0점
+_ZERO_ROW = tuple(calc_score(c, [0]*5) for c in SCORE_CATS)
+
+def dice_key(dice):
+    # 주사위 값의 정렬된 조합 인덱스 (굴리지 않은 주사위가 섞여 있으면 None)
+    return _ROLL_INDEX.get(tuple(dice))
+
+def score_vector(dice):
+    # 한 번의 조회로 13개 카테고리 점수 전체를 SCORE_CATS 순서대로 반환
+    i = _ROLL_INDEX.get(tuple(dice))
+    if i is not None: return _ROWS[i]
+    if not any(dice): return _ZERO_ROW
+    return tuple(calc_score(c, dice) for c in SCORE_CATS)
+
+def score(cat, dice):
+    # click_score의 is_yat 특례(Yatzy 50점)는 calc_score와 동일하므로 표에 그대로 포함되어 있다.
+    return score_vector(dice)[CAT_INDEX[cat]]
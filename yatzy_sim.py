@@ -0,0 +1,196 @@
+import sys, time, argparse
+import numpy as np
+from yatzy_scoring import MULTISETS, SCORE_TABLE, NUM_CATS, SCORE_CATS, UPPER_MAP, STANDARD
+
+# --- 대량 몬테카를로 시뮬레이터 ---
+# N개의 1인 게임을 NumPy 배열로 동시에 진행한다.
+#   dice   : N × 5 uint8 (1..6)
+#   sheets : N × 13 int16 (-1 = 빈 칸)
+# 정책(policy)은 hold(dice, sheets, rolls_left) -> N × 5 bool 고정 마스크,
+# choose(scores, sheets) -> N 카테고리 인덱스 두 메서드만 구현하면 된다.
+
+SCORES = np.frombuffer(SCORE_TABLE, dtype=np.uint8).reshape(len(MULTISETS), NUM_CATS).astype(np.int16)
+UPPER_IDX = np.array([i for i,c in enumerate(SCORE_CATS) if c in UPPER_MAP])
+BONUS_THRESHOLD, BONUS_POINTS = STANDARD.bonus
+FACES = np.arange(1, 7, dtype=np.uint8)
+CHANCE = SCORE_CATS.index("Chance")
+_POW7 = 7 ** np.arange(5)
+
+def _code_table():
+    # 정렬된 주사위의 7진수 코드 -> 조합 인덱스
+    t = np.full(7**5, -1, dtype=np.int16)
+    for i,m in enumerate(MULTISETS): t[int(np.dot(m, _POW7))] = i
+    return t
+_CODE_TO_MS = _code_table()
+
+def multiset_index(dice):
+    # N × 5 주사위 -> N개의 조합 인덱스 (0..251)
+    return _CODE_TO_MS[np.sort(dice, axis=1).astype(np.intp) @ _POW7]
+
+def score_matrix(dice):
+    # N × 5 주사위 -> N × 13 점수 (calc_score와 동일한 점수표)
+    return SCORES[multiset_index(dice)]
+
+def face_counts(dice):
+    # N × 6 눈별 개수
+    return (dice[:, :, None] == FACES).sum(axis=1)
+
+# --- 정책 ---
+class GreedyPolicy:
+    # 가장 많이 나온 눈(동률이면 큰 눈)을 고정하고, 즉시 점수가 가장 큰 빈 칸에 기록
+    def hold(self, dice, sheets, rolls_left):
+        counts = face_counts(dice)
+        face = FACES[np.argmax(counts * 8 + FACES, axis=1)]
+        return dice == face[:, None]
+
+    def choose(self, scores, sheets):
+        return np.argmax(np.where(sheets < 0, scores, -1), axis=1)
+
+class UpperBonusPolicy:
+    # Upper 보너스(63점) 노리기: 빈 Upper 칸의 눈을 우선 고정하고, 눈당 3개(기준 점수) 이상이면 Upper에 기록.
+    # 0점을 넣어야 하면 기대 점수가 낮은 칸(Yatzy, Aces 순)부터 버린다
+    UPPER_WEIGHT = 6
+    PAR = 3 * np.arange(1, 7, dtype=np.int16)                      # 보너스 기준: 눈마다 3개
+    DUMP = np.array([0, 0, 0, 0, 0, 0, -8, -5, -9, -10, -8, -2, 0]) # 0점으로 버릴 때의 벌점 (Lower)
+    CHANCE_HOLD = 12                                                # Chance는 마지막까지 아껴 둔다
+
+    def hold(self, dice, sheets, rolls_left):
+        counts = face_counts(dice)
+        open_upper = sheets[:, UPPER_IDX] < 0
+        face = FACES[np.argmax(counts * 8 + FACES + self.UPPER_WEIGHT * open_upper, axis=1)]
+        return dice == face[:, None]
+
+    def choose(self, scores, sheets):
+        val = scores.astype(np.int32)
+        up = scores[:, UPPER_IDX]
+        val[:, UPPER_IDX] = (up - self.PAR) + 15 * (up >= self.PAR)
+        lower = np.setdiff1d(np.arange(NUM_CATS), UPPER_IDX)
+        val[:, lower] = np.where(scores[:, lower] > 0, scores[:, lower], self.DUMP[lower])
+        val[:, CHANCE] -= self.CHANCE_HOLD
+        return np.argmax(np.where(sheets < 0, val, -10**6), axis=1)
+
+class SolverPolicy:
+    # yatzy_solver 값 테이블 기반 최적 정책 (1인 기대 점수 최대화).
+    # 같은 (채운 칸, Upper 합계) 상태의 게임은 턴 테이블을 한 번만 계산한다 (첫 턴은 모든 게임이 같은 상태).
+    # 값 테이블이 없으면 compute=True일 때 계산하고, 아니면 GreedyPolicy로 대신한다.
+    def __init__(self, seed=None, values=None, compute=True, chunk=2048):
+        import yatzy_solver as solver
+        self.solver, self.chunk = solver, chunk
+        self.values = values if values is not None else solver.load_values(compute=compute)
+        self.fallback = GreedyPolicy() if self.values is None else None
+
+    def _state(self, sheets):
+        masks = ((sheets >= 0) << np.arange(NUM_CATS)).sum(axis=1)
+        ups = np.minimum(BONUS_THRESHOLD, np.maximum(sheets[:, UPPER_IDX], 0).sum(axis=1))
+        return masks, ups
+
+    def hold(self, dice, sheets, rolls_left):
+        if self.fallback: return self.fallback.hold(dice, sheets, rolls_left)
+        sv = self.solver
+        masks, ups = self._state(sheets)
+        uniq, inv = np.unique(masks * sv.NUM_UPPER + ups, return_inverse=True)
+        subkeeps = sv.SUBKEEPS[multiset_index(dice)]                # N × 32 고정 조합
+        kv = np.empty(subkeeps.shape)
+        for a in range(0, len(uniq), self.chunk):
+            u = uniq[a:a+self.chunk]
+            k1 = sv.final_values(self.values, u // sv.NUM_UPPER, u % sv.NUM_UPPER) @ sv.TRANSITION_T
+            k = k1 if rolls_left == 1 else sv.best_keep(k1) @ sv.TRANSITION_T
+            sel = np.flatnonzero((inv >= a) & (inv < a + len(u)))
+            kv[sel] = k[inv[sel, None] - a, subkeeps[sel]]
+        h = np.argmax(kv, axis=1)
+        h[kv[:, 31] >= kv[np.arange(len(h)), h]] = 31                # 다섯 개 모두 고정 = 그대로 기록
+        order = np.argsort(dice, axis=1, kind="stable")
+        held = np.zeros(dice.shape, dtype=bool)
+        np.put_along_axis(held, order, (h[:, None] >> np.arange(5)) & 1 == 1, axis=1)
+        return held
+
+    def choose(self, scores, sheets):
+        if self.fallback: return self.fallback.choose(scores, sheets)
+        masks, ups = self._state(sheets)
+        ev = np.full(scores.shape, -np.inf)
+        for c in range(NUM_CATS):
+            sel = np.flatnonzero(sheets[:, c] < 0)
+            sc = scores[sel, c].astype(np.int64)
+            nu = ups[sel]
+            if c in UPPER_IDX:
+                nu = np.minimum(BONUS_THRESHOLD, nu + sc)
+                sc = sc + BONUS_POINTS * ((ups[sel] < BONUS_THRESHOLD) & (nu >= BONUS_THRESHOLD))
+            ev[sel, c] = sc + self.values[masks[sel] | 1 << c, nu]
+        return np.argmax(ev, axis=1)
+
+class RandomPolicy:
+    # 비교 기준용: 무작위 고정, 무작위 빈 칸
+    def __init__(self, seed=0): self.rng = np.random.default_rng(seed)
+    def hold(self, dice, sheets, rolls_left): return self.rng.random(dice.shape) < 0.5
+    def choose(self, scores, sheets):
+        return np.argmax(np.where(sheets < 0, self.rng.random(sheets.shape), -1), axis=1)
+
+# 이름 -> 정책 생성 함수(seed). 샤드별로 다른 seed를 넘길 수 있도록 모두 seed 인자를 받는다.
+POLICIES = {"greedy": lambda seed=None: GreedyPolicy(), "upper": lambda seed=None: UpperBonusPolicy(),
+            "solver": SolverPolicy, "random": RandomPolicy}
+
+# --- 시뮬레이션 ---
+def play_batch(n, policy, rng):
+    # n개의 게임을 끝까지 진행하고 완성된 점수판(n × 13)을 반환
+    sheets = np.full((n, NUM_CATS), -1, dtype=np.int16)
+    rows = np.arange(n)
+    for _ in range(NUM_CATS):
+        dice = rng.integers(1, 7, size=(n, 5), dtype=np.uint8)
+        for rolls_left in (2, 1):
+            held = policy.hold(dice, sheets, rolls_left)
+            dice = np.where(held, dice, rng.integers(1, 7, size=(n, 5), dtype=np.uint8))
+        scores = score_matrix(dice)
+        cat = policy.choose(scores, sheets)
+        sheets[rows, cat] = scores[rows, cat]
+    return sheets
+
+def totals(sheets):
+    # Player.total()과 동일: 카테고리 합 + Upper 63점 이상 시 35점
+    upper = sheets[:, UPPER_IDX].sum(axis=1, dtype=np.int32)
+    return sheets.sum(axis=1, dtype=np.int32) + BONUS_POINTS * (upper >= BONUS_THRESHOLD)
+
+def simulate(n, policy=None, seed=None, chunk=1 << 16):
+    # 같은 seed, 같은 chunk 크기면 항상 같은 결과
+    policy = policy or GreedyPolicy()
+    rng = np.random.default_rng(seed)
+    sheets = np.empty((n, NUM_CATS), dtype=np.int16)
+    for s in range(0, n, chunk):
+        sheets[s:s+chunk] = play_batch(min(chunk, n - s), policy, rng)
+    return sheets
+
+def summarize(sheets):
+    tot = totals(sheets)
+    upper = sheets[:, UPPER_IDX].sum(axis=1)
+    return {
+        "games": int(len(sheets)),
+        "mean": float(tot.mean()),
+        "variance": float(tot.var()),
+        "min": int(tot.min()), "max": int(tot.max()),
+        "bonus_rate": float((upper >= BONUS_THRESHOLD).mean()),
+        "category_mean": {c: float(sheets[:, i].mean()) for i,c in enumerate(SCORE_CATS)},
+        # 카테고리별 점수 분포: {점수: 비율}
+        "category_dist": {
+            c: {int(v): float(k) / len(sheets) for v,k in zip(*np.unique(sheets[:, i], return_counts=True))}
+            for i,c in enumerate(SCORE_CATS)
+        },
+    }
+
+def print_summary(summary, out=sys.stdout):
+    print(f"게임 수: {summary['games']}  평균: {summary['mean']:.2f}  분산: {summary['variance']:.2f}  "
+          f"최소/최대: {summary['min']}/{summary['max']}  보너스 달성률: {summary['bonus_rate']:.2%}", file=out)
+    for c in SCORE_CATS:
+        dist = summary["category_dist"][c]
+        top = ", ".join(f"{v}:{p:.1%}" for v,p in sorted(dist.items(), key=lambda kv: -kv[1])[:4])
+        print(f"  {c:15s} 평균 {summary['category_mean'][c]:6.2f}  ({top})", file=out)
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description="Yatzy 대량 시뮬레이션")
+    ap.add_argument("-n", "--games", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    sheets = simulate(args.games, POLICIES[args.policy](args.seed), args.seed)
+    dt = time.perf_counter() - t0
+    print_summary(summarize(sheets))
+    print(f"{dt:.2f}s ({args.games / dt * 60:,.0f} games/min)")
@@ -0,0 +1,132 @@
+import os, sys, time
+from itertools import combinations_with_replacement
+from math import factorial
+from collections import Counter
+import numpy as np
+from yatzy_scoring import MULTISETS, SCORE_TABLE, NUM_CATS, UPPER_MAP, SCORE_CATS, STANDARD
+
+# --- 1인 Yatzy 기대값 최적 해법 ---
+# 상태 = (채운 카테고리 비트마스크 13비트, 63점으로 잘라낸 Upper 합계 0..63)
+# 값 = 해당 상태에서 턴을 시작했을 때 남은 게임에서 얻을 수 있는 최대 기대 점수
+# 턴 내부(굴림 3회, 고정 선택)는 상태마다 252개 조합 벡터와 462개 고정 조합 사이의 행렬곱으로 계산한다.
+
+BONUS_THRESHOLD, BONUS_POINTS = STANDARD.bonus
+NUM_MASKS, NUM_UPPER = 1 << NUM_CATS, BONUS_THRESHOLD + 1
+FULL_MASK = NUM_MASKS - 1
+VALUES_PATH = os.environ.get("YATZY_VALUES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "yatzy_values.npy"))
+
+# --- 턴 내부 전이 테이블 ---
+NUM_MS = len(MULTISETS)
+SCORES = np.frombuffer(SCORE_TABLE, dtype=np.uint8).reshape(NUM_MS, NUM_CATS).astype(np.int64)
+UPPER_CATS = [i for i,c in enumerate(SCORE_CATS) if c in UPPER_MAP]
+
+# 고정해 둔 주사위 조합 (0~5개, 462가지)
+KEEPS = [k for n in range(6) for k in combinations_with_replacement(range(1,7), n)]
+KEEP_INDEX = {k:i for i,k in enumerate(KEEPS)}
+EMPTY_KEEP = KEEP_INDEX[()]
+_MS_INDEX = {m:i for i,m in enumerate(MULTISETS)}
+
+def _transition():
+    # TRANSITION[k, d] = 고정 조합 k에서 나머지를 굴렸을 때 최종 조합이 d가 될 확률
+    t = np.zeros((len(KEEPS), NUM_MS))
+    for ki,k in enumerate(KEEPS):
+        n = 5 - len(k)
+        for r in combinations_with_replacement(range(1,7), n):
+            ways = factorial(n)
+            for c in Counter(r).values(): ways //= factorial(c)
+            t[ki, _MS_INDEX[tuple(sorted(k + r))]] += ways / 6**n
+    return t
+
+def _subkeeps():
+    # SUBKEEPS[d, h] = 조합 d(정렬된 주사위)에서 고정 마스크 h(비트 i = i번째 주사위)로 남기는 조합
+    s = np.zeros((NUM_MS, 32), dtype=np.intp)
+    for di,m in enumerate(MULTISETS):
+        for h in range(32):
+            s[di, h] = KEEP_INDEX[tuple(m[i] for i in range(5) if h >> i & 1)]
+    return s
+
+TRANSITION = _transition()
+TRANSITION_T = np.ascontiguousarray(TRANSITION.T)
+SUBKEEPS = _subkeeps()
+
+def _reachable_upper():
+    # Upper 카테고리 채움 상태(6비트)별로 실제 도달 가능한 Upper 합계(63 상한)
+    reach = np.zeros((64, NUM_UPPER), dtype=bool)
+    for um in range(64):
+        sums = {0}
+        for j in range(6):
+            if um >> j & 1: sums = {min(BONUS_THRESHOLD, s + (j+1)*k) for s in sums for k in range(6)}
+        reach[um, sorted(sums)] = True
+    return reach
+
+# --- 턴 계산 ---
+def final_values(values, masks, ups):
+    # 굴림이 끝난 252개 조합마다 남은 카테고리 중 최선을 골랐을 때의 값 (S × 252)
+    best = np.full((len(masks), NUM_MS), -np.inf)
+    for c in range(NUM_CATS):
+        bit = 1 << c
+        sel = np.flatnonzero((masks & bit) == 0)
+        if not len(sel): continue
+        m, u, sc = masks[sel] | bit, ups[sel], SCORES[:, c]
+        if c in UPPER_CATS:
+            nu = np.minimum(u[:, None] + sc[None, :], BONUS_THRESHOLD)
+            val = sc + BONUS_POINTS * ((u[:, None] < BONUS_THRESHOLD) & (nu >= BONUS_THRESHOLD)) + values[m[:, None], nu]
+        else:
+            val = sc[None, :] + values[m, u][:, None]
+        best[sel] = np.maximum(best[sel], val)
+    return best
+
+def best_keep(keep_values):
+    # 각 조합에서 32가지 고정 마스크 중 최선의 기대값 (S × 462 -> S × 252)
+    return keep_values[:, SUBKEEPS].max(axis=2)
+
+def turn_tables(values, masks, ups):
+    # 턴 단계별 값: r0 = 굴림 0회 남음, k1 = 마지막 굴림 전 고정 조합의 기대값, r1, k2, r2
+    r0 = final_values(values, masks, ups)
+    k1 = r0 @ TRANSITION_T
+    r1 = best_keep(k1)
+    k2 = r1 @ TRANSITION_T
+    r2 = best_keep(k2)
+    return r0, k1, r1, k2, r2
+
+def _solve_states(values, masks, ups):
+    r2 = turn_tables(values, masks, ups)[-1]
+    return r2 @ TRANSITION[EMPTY_KEEP]
+
+def solve(path=VALUES_PATH, chunk=2048, verbose=False):
+    # 후방 귀납: 채운 카테고리 수가 많은 상태부터 0개까지 계산하고 결과를 메모리 맵 파일에 저장
+    tmp = f"{path}.{os.getpid()}.tmp" # 프로세스마다 다른 임시 파일 (동시에 계산해도 완성된 파일만 교체된다)
+    values = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float64, shape=(NUM_MASKS, NUM_UPPER))
+    values[:] = 0.0
+    reach = _reachable_upper()
+    upper_bits = sum(1 << c for c in UPPER_CATS)
+    popcount = np.array([bin(m).count("1") for m in range(NUM_MASKS)])
+    t0 = time.perf_counter()
+    for filled in range(NUM_CATS - 1, -1, -1):
+        layer = np.flatnonzero(popcount == filled)
+        um = np.array([sum(1 << j for j,c in enumerate(UPPER_CATS) if m >> c & 1) for m in layer & upper_bits])
+        mi, ui = np.nonzero(reach[um])
+        masks, ups = layer[mi], ui
+        for s in range(0, len(masks), chunk):
+            values[masks[s:s+chunk], ups[s:s+chunk]] = _solve_states(values, masks[s:s+chunk], ups[s:s+chunk])
+        if verbose: print(f"채운 카테고리 {filled:2d}: {len(masks):6d} 상태 ({time.perf_counter()-t0:.1f}s)", file=sys.stderr)
+    values.flush(); del values
+    os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
+
+def load_values(path=VALUES_PATH, compute=True, verbose=False):
+    # 저장된 값 테이블이 있으면 메모리 맵으로 즉시 열고, 없으면 (compute=True일 때) 계산한다.
+    if os.path.exists(path):
+        values = np.load(path, mmap_mode="r")
+        if values.shape == (NUM_MASKS, NUM_UPPER): return values
+    if not compute: return None
+    return solve(path, verbose=verbose)
+
+def expected_score(values):
+    # 게임 시작 상태의 최적 기대 점수
+    return float(values[0, 0])
+
+if __name__ == '__main__':
+    t0 = time.perf_counter()
+    v = load_values(verbose=True)
+    print(f"최적 기대 점수: {expected_score(v):.4f} ({time.perf_counter()-t0:.1f}s, {VALUES_PATH})")
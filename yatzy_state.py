@@ -0,0 +1,114 @@
+from yatzy_scoring import SCORE_CATS, UPPER_MAP, CAT_INDEX, STANDARD, dice_key
+
+# --- 압축 게임 상태 ---
+# ScoreSheet: Player.scores용 dict. 값이 기록될 때마다 채움 비트마스크, Upper 합계, 총합을
+#             갱신하므로 total()/get_upper()/bonus()가 O(1)이다. 13개 칸은 항상 있으므로 칸을 지우는
+#             연산(del, pop, popitem, clear)은 TypeError이고, 비우려면 None을 기록한다.
+# PlayerState: 한 플레이어의 상태 전체를 __slots__ 레코드 하나(또는 정수 하나)로 표현한다.
+#   정수 배치 (하위 비트부터): 남은 굴림 2 | 고정 마스크 5 | 주사위 5×3 | 채움 마스크 13 | 점수 13×6
+#   key()는 주사위 순서를 지운 정규화 키(채움, 63 상한 Upper, 조합 인덱스, 정렬 기준 고정, 굴림)로 메모이제이션용이다.
+
+NUM_CATS = len(SCORE_CATS)
+UPPER_BITS = sum(1 << CAT_INDEX[c] for c in UPPER_MAP)
+BONUS_THRESHOLD, BONUS_POINTS = STANDARD.bonus
+_ROLLS_SHIFT, _HELD_SHIFT, _DICE_SHIFT, _FILLED_SHIFT, _SCORES_SHIFT = 0, 2, 7, 22, 35
+PACKED_BYTES = 15 # 113비트
+
+class ScoreSheet(dict):
+    __slots__ = ("filled", "upper", "raw_total")
+
+    def __init__(self, scores=None):
+        super().__init__({c: None for c in SCORE_CATS})
+        self.filled = self.upper = self.raw_total = 0
+        for c, v in (scores or {}).items(): self[c] = v
+
+    def __setitem__(self, cat, v):
+        bit = 1 << CAT_INDEX[cat]
+        old = self.get(cat)
+        if old is not None: self._add(cat, -old)
+        super().__setitem__(cat, v)
+        if v is not None: self._add(cat, v)
+        self.filled = self.filled | bit if v is not None else self.filled & ~bit
+
+    def _add(self, cat, v):
+        self.raw_total += v
+        if cat in UPPER_MAP: self.upper += v
+
+    def update(self, *args, **kw):
+        for c, v in dict(*args, **kw).items(): self[c] = v
+
+    def __ior__(self, other):
+        self.update(other); return self
+
+    def setdefault(self, cat, v=None):
+        if cat not in self: self[cat] = v
+        return self[cat]
+
+    def _fixed(self, *args):
+        raise TypeError("ScoreSheet의 칸은 지울 수 없다 (빈 칸은 None을 기록한다)")
+    __delitem__ = pop = popitem = clear = _fixed
+
+    def copy(self): return ScoreSheet(self)
+    def __reduce__(self): return ScoreSheet, (dict(self),) # pickle/deepcopy는 기록을 다시 적용해 합계를 만든다
+
+    def bonus(self): return BONUS_POINTS if self.upper >= BONUS_THRESHOLD else 0
+    def total(self): return self.raw_total + self.bonus()
+
+class PlayerState:
+    __slots__ = ("scores", "filled", "dice", "held", "rolls")
+
+    def __init__(self, scores, filled, dice, held, rolls):
+        # scores: 13개 점수 튜플(빈 칸은 0), filled: 채움 비트마스크, dice: 주사위 5개 튜플(0 = 안 굴림),
+        # held: 고정 비트마스크(비트 i = i번째 주사위), rolls: 남은 굴림
+        self.scores, self.filled, self.dice, self.held, self.rolls = scores, filled, dice, held, rolls
+
+    # Player <-> PlayerState
+    @classmethod
+    def from_player(cls, p):
+        s = p.scores
+        return cls(tuple(s[c] or 0 for c in SCORE_CATS), s.filled, tuple(p.dice),
+                   sum(1 << i for i, h in enumerate(p.held) if h), p.rolls)
+
+    def apply(self, p):
+        # 이 상태를 Player 객체에 그대로 써 넣는다 (이름은 유지)
+        p.scores = {c: (self.scores[i] if self.filled >> i & 1 else None) for i, c in enumerate(SCORE_CATS)}
+        p.dice = list(self.dice)
+        p.held = [bool(self.held >> i & 1) for i in range(5)]
+        p.rolls = self.rolls
+        return p
+
+    # 점수 집계
+    @property
+    def upper(self): return sum(self.scores[CAT_INDEX[c]] for c in UPPER_MAP)
+    def bonus(self): return BONUS_POINTS if self.upper >= BONUS_THRESHOLD else 0
+    def total(self): return sum(self.scores) + self.bonus()
+
+    # 정수 하나로 직렬화
+    def pack(self):
+        n = self.rolls | self.held << _HELD_SHIFT | self.filled << _FILLED_SHIFT
+        for i, d in enumerate(self.dice): n |= d << (_DICE_SHIFT + 3 * i)
+        for i, v in enumerate(self.scores): n |= v << (_SCORES_SHIFT + 6 * i)
+        return n
+
+    @classmethod
+    def unpack(cls, n):
+        return cls(tuple(n >> (_SCORES_SHIFT + 6 * i) & 63 for i in range(NUM_CATS)),
+                   n >> _FILLED_SHIFT & (1 << NUM_CATS) - 1,
+                   tuple(n >> (_DICE_SHIFT + 3 * i) & 7 for i in range(5)),
+                   n >> _HELD_SHIFT & 31, n >> _ROLLS_SHIFT & 3)
+
+    def to_bytes(self): return self.pack().to_bytes(PACKED_BYTES, "little")
+    @classmethod
+    def from_bytes(cls, b): return cls.unpack(int.from_bytes(b, "little"))
+
+    # 메모이제이션 키
+    def key(self):
+        # (채움 마스크, 63 상한 Upper, 조합 인덱스(안 굴렸으면 None), 정렬 기준 고정 마스크, 남은 굴림)
+        order = sorted(range(5), key=lambda i: self.dice[i])
+        held = sum(1 << j for j, i in enumerate(order) if self.held >> i & 1)
+        return (self.filled, min(BONUS_THRESHOLD, self.upper), dice_key(self.dice), held, self.rolls)
+
+    def __eq__(self, other): return isinstance(other, PlayerState) and self.pack() == other.pack()
+    def __hash__(self): return hash(self.pack())
+    def __repr__(self):
+        return f"PlayerState(scores={self.scores}, filled={self.filled:#06x}, dice={self.dice}, held={self.held:#04x}, rolls={self.rolls})"
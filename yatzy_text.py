@@ -0,0 +1,64 @@
+import textwrap
+from collections import OrderedDict
+from functools import lru_cache
+
+# --- 텍스트 렌더링 캐시 ---
+# font.render 결과 Surface를 (폰트, 문자열, 색, 안티앨리어싱) 키로 보관하고 LRU로 내보낸다.
+# 반환된 Surface는 여러 곳에서 공유되므로 blit 용도로만 써야 한다.
+
+class TextCache:
+    def __init__(self, max_items=512, max_sizes=2048):
+        self.max_items, self.max_sizes = max_items, max_sizes
+        self._surfs = OrderedDict() # 키 -> Surface
+        self._sizes = OrderedDict() # (폰트, 문자열) -> (w, h)
+        self.hits = self.misses = self.evictions = 0
+        self.size_hits = self.size_misses = 0
+        self.bytes = 0
+
+    def render(self, font, txt, color, antialias=True):
+        key = (font, txt, color, antialias)
+        img = self._surfs.get(key)
+        if img is not None:
+            self.hits += 1
+            self._surfs.move_to_end(key)
+            return img
+        self.misses += 1
+        img = self._surfs[key] = font.render(txt, antialias, color)
+        self.bytes += _surface_bytes(img)
+        while len(self._surfs) > self.max_items:
+            _, old = self._surfs.popitem(last=False)
+            self.bytes -= _surface_bytes(old); self.evictions += 1
+        return img
+
+    def size(self, font, txt):
+        # font.size 측정값 캐시 (우측 정렬, 캐럿 위치 계산용)
+        key = (font, txt)
+        sz = self._sizes.get(key)
+        if sz is not None:
+            self.size_hits += 1
+            self._sizes.move_to_end(key)
+            return sz
+        self.size_misses += 1
+        sz = self._sizes[key] = font.size(txt)
+        if len(self._sizes) > self.max_sizes: self._sizes.popitem(last=False)
+        return sz
+
+    def clear(self):
+        self._surfs.clear(); self._sizes.clear(); self.bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "items": len(self._surfs), "max_items": self.max_items, "bytes": self.bytes,
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size_hits": self.size_hits, "size_misses": self.size_misses,
+        }
+
+def _surface_bytes(img):
+    return img.get_pitch() * img.get_height()
+
+@lru_cache(maxsize=256)
+def wrap_lines(txt, width):
+    # textwrap.wrap 결과 캐시 (규칙 화면, 조언 텍스트)
+    return tuple(textwrap.wrap(txt, width=width))
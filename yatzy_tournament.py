@@ -0,0 +1,75 @@
+import sys, time, argparse
+from itertools import combinations
+import numpy as np
+import yatzy_sim as sim
+from yatzy_parallel import run_parallel
+from yatzy_bots import BOTS
+
+# --- 봇 라운드 로빈 토너먼트 ---
+# 봇마다 N게임을 yatzy_parallel로 병렬 시뮬레이션하고, 대진마다 i번째 게임끼리 총점을 비교한다.
+# 봇은 상대 점수를 보지 않으므로(1인 기대 점수 정책) 서로 다른 난수로 진행한 두 게임을 맞붙이는 것은
+# 같은 판에서 번갈아 두는 2인 게임과 분포가 같다. 같은 봇의 게임은 여러 대진에서 재사용한다.
+# 승률 = (승 + 무/2) / N, 신뢰구간은 게임별 결과(1, 0.5, 0)의 정규 근사.
+
+Z95 = 1.959964
+
+def _ci(x):
+    # 평균과 95% 신뢰구간 반폭
+    return float(x.mean()), float(Z95 * x.std(ddof=1) / np.sqrt(len(x)))
+
+def play_bots(bots, n, workers=None, seed=0):
+    # 봇 이름 -> n게임 총점 배열. 봇마다 독립 seed
+    seeds = np.random.SeedSequence(seed).generate_state(len(bots))
+    if "solver" in bots:
+        import yatzy_solver
+        yatzy_solver.load_values(verbose=True) # 워커가 열기 전에 값 테이블 준비
+    out = {}
+    for b, s in zip(bots, seeds):
+        t0 = time.perf_counter()
+        out[b] = sim.totals(run_parallel(n, workers, int(s), b))
+        print(f"  {b:8s} {n}게임 {time.perf_counter() - t0:6.1f}s", file=sys.stderr)
+    return out
+
+def round_robin(totals):
+    # 대진별 승/무/패와 승률·점수 차 신뢰구간
+    rows = []
+    for a, b in combinations(totals, 2):
+        ta, tb = totals[a], totals[b]
+        n = min(len(ta), len(tb))
+        diff = ta[:n].astype(np.int32) - tb[:n]
+        outcome = (diff > 0) + 0.5 * (diff == 0)
+        rows.append({"a": a, "b": b, "games": n, "wins": int((diff > 0).sum()), "draws": int((diff == 0).sum()),
+                     "losses": int((diff < 0).sum()), "win_rate": _ci(outcome), "margin": _ci(diff)})
+    return rows
+
+def standings(totals, rows):
+    # 봇별 평균 점수와 전체 대진 승률
+    score = {b: [0.0, 0] for b in totals}
+    for r in rows:
+        score[r["a"]][0] += r["wins"] + r["draws"] / 2; score[r["a"]][1] += r["games"]
+        score[r["b"]][0] += r["losses"] + r["draws"] / 2; score[r["b"]][1] += r["games"]
+    return sorted(({"bot": b, "mean": _ci(totals[b]), "win_rate": s / g if g else 0.0} for b, (s, g) in score.items()),
+                  key=lambda r: -r["win_rate"])
+
+def print_report(totals, rows, out=sys.stdout):
+    print("[대진]", file=out)
+    for r in rows:
+        wr, m = r["win_rate"], r["margin"]
+        print(f"  {r['a']:8s} vs {r['b']:8s}  {r['wins']:7d}승 {r['draws']:5d}무 {r['losses']:7d}패  "
+              f"승률 {wr[0]:6.2%} ± {wr[1]:.2%}  점수 차 {m[0]:+7.2f} ± {m[1]:.2f}", file=out)
+    print("[순위]", file=out)
+    for i, s in enumerate(standings(totals, rows), 1):
+        print(f"  {i}. {s['bot']:8s} 평균 {s['mean'][0]:7.2f} ± {s['mean'][1]:.2f}  전체 승률 {s['win_rate']:6.2%}", file=out)
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description="Yatzy 봇 라운드 로빈 토너먼트")
+    ap.add_argument("-n", "--games", type=int, default=100_000, help="봇당 게임 수")
+    ap.add_argument("-w", "--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--bots", nargs="+", choices=sorted(sim.POLICIES), default=list(BOTS))
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    totals = play_bots(args.bots, args.games, args.workers, args.seed)
+    print_report(totals, round_robin(totals))
+    dt = time.perf_counter() - t0
+    print(f"{dt:.1f}s ({len(args.bots) * args.games / dt * 60:,.0f} games/min)")